@@ -1,19 +1,50 @@
 # -*- coding: utf-8 -*-
 
+from datetime import date
+import json
 import logging
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask import current_app, Flask, Request, render_template, request, jsonify, redirect, url_for
+from flask import Response, stream_with_context
 from flask_dropzone import Dropzone
 from werkzeug.utils import secure_filename
 
-from scripts.dc_handler import analyze
-from scripts.shifts import duty
+from scripts.dc_archive import ArchiveError, read_archive
+from scripts.dc_cache import cache
+from scripts.dc_handler import configure, pool, REPORT_FIELDS
+from scripts.dc_jobs import jobs, QueueFull
+from scripts.dc_logging import writer
+from scripts.dc_plugins import plugins
+from scripts.dc_upload import CardStream
+from scripts.dc_warmup import warmup
+from scripts.reports.dc_reporter import create_report_error
+from scripts.shifts import duty, schedule_index
+from scripts.tests.dc_rules import rules
+
+
+class UploadRequest(Request):
+    """A request decoding (and decompressing) the uploaded cards while they are received instead of spooling them
+    (see CardStream).
+    """
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return CardStream(current_app.config['CARD_MAX_SIZE'])
 
 
 app = Flask(__name__)
+app.request_class = UploadRequest
 app.config.from_object('config.DevelopmentConfig')
 dropzone = Dropzone(app)
+# The log records are written by a background thread (a rotating file and the console)
+writer.configure(app.config['LOG_PATH'], app.config['LOG_LEVEL'], app.config['LOG_CONSOLE_LEVEL'],
+                 app.config['LOG_MAX_BYTES'], app.config['LOG_BACKUPS'])
+configure(app.config)
+pool.configure(app.config['ANALYSIS_WORKERS'], app.config, writer.queue, writer.level,
+               app.config['ANALYSIS_EXECUTABLE'])
+schedule_index.configure(app.config['SCHEDULE_PATH'])
+jobs.configure(app.config['JOBS_WORKERS'], app.config['JOBS_QUEUE'], app.config['JOBS_PATH'], app.config['JOBS_TTL'],
+               app.config['JOBS_CALLBACK_HOSTS'])
 
 
 def allowed_file(filename):
@@ -32,34 +63,180 @@ def upload():
         return render_template('upload.html')
 
 
+def received_card(file):
+    """Return the uploaded card as (text, line offsets) or (bytes, None) if it was not decoded while it was received.
+    Return None if the card was rejected while it was received.
+    """
+
+    if isinstance(file.stream, CardStream):
+        text = file.stream.text()
+        return None if text is None else (text, file.stream.offsets)
+    return file.read(), None
+
+
+def analyze_files(files):
+    """Analyze the uploaded files {a field name: (a file name, a card (see received_card()))} in the analysis pool
+    and return the replies of the files.
+    """
+
+    dc_source = ['jira', 'DESK-00000']
+    accepted = {name: card for name, (_, card) in files.items() if card is not None}
+    for name, (filename, card) in files.items():
+        logger.info(f'Send "{name}" ({secure_filename(filename)}) to parser' if card is not None else
+                    f'"{name}" ({secure_filename(filename)}) was rejected')
+    reports = pool.map([(name, content, dc_source, offsets) for name, (content, offsets) in accepted.items()])
+    reports = dict(zip(accepted, reports))
+    # The rejected cards get the report of an invalid card
+    error = dict(zip(REPORT_FIELDS, create_report_error(dc_source))) if len(reports) < len(files) else None
+
+    return {name: {'filename': secure_filename(filename), **reports.get(name, error)}
+            for name, (filename, _) in files.items()}
+
+
 @app.route('/jira', methods=['POST'])
 def parser():
     data = request.files.to_dict()
     logger.warning(f'--------------------NEW REQUEST--------------------')
     logger.info(f'POST request received from {request.remote_addr}')
-    logger.debug(f'POST request User-Agent: {request.headers["User-Agent"]}')
+    logger.debug('POST request User-Agent: %s', request.headers['User-Agent'])
     logger.info(f'POST contains: {list(data.keys())}')
-    for name, file in data.items():
-        data[name] = {}
-        data[name]['filename'] = secure_filename(file.filename)
-        logger.info(f'Send "{name}" ({data[name]["filename"]}) to parser')
-        report = analyze(name, file, dc_source=['jira', 'DESK-00000'])
-        data[name]['model'] = report[0]
-        data[name]['family'] = report[1]
-        data[name]['subfamily'] = report[2]
-        data[name]['serial_number'] = report[3]
-        data[name]['firmware'] = report[4]
-        data[name]['report'] = report[5]
+    data = analyze_files({name: (file.filename, received_card(file)) for name, file in data.items()})
     logger.info(f'Send reply (JSON) to {request.remote_addr}')
     return jsonify(data)
 
 
+@app.route('/archive', methods=['POST'])
+def parse_archive():
+    """Analyze the cards of a zip or tar.gz archive sent as the request body and stream the replies (NDJSON),
+    a line per card as soon as it is analyzed.
+    """
+    logger.warning(f'--------------------NEW ARCHIVE--------------------')
+    logger.info(f'POST request received from {request.remote_addr}')
+    archive_size = app.config['ARCHIVE_MAX_SIZE']
+    if request.content_length is None:
+        return 'The size of the archive (Content-Length) is required.', 411
+    if request.content_length > archive_size:
+        logger.error(f'HTTP 413 Archive is too large')
+        return f'Archive is too large. It must be less than {archive_size // 1024 // 1024} MB.', 413
+    logger.info(f'POST contains an archive ({request.content_length} bytes)')
+
+    def replies():
+        rejected = []
+
+        def cards():
+            for name, content in read_archive(request.stream, archive_size, app.config['ARCHIVE_MEMBER_SIZE'],
+                                              app.config['ARCHIVE_MEMBERS']):
+                if content is None:
+                    rejected.append(name)
+                else:
+                    logger.info(f'Send "{name}" to parser')
+                    yield name, content, ['jira', 'DESK-00000']
+
+        def rejections():
+            while rejected:
+                yield json.dumps({'name': rejected.pop(0), 'error': 'The card is too large'}) + '\n'
+
+        try:
+            for name, report in pool.iterate(cards()):
+                yield from rejections()
+                if report is None:
+                    yield json.dumps({'name': name, 'error': 'The card cannot be analyzed'}) + '\n'
+                else:
+                    yield json.dumps({'name': name, 'filename': secure_filename(PurePosixPath(name).name),
+                                      **report}) + '\n'
+            yield from rejections()
+        except ArchiveError as error:
+            logger.error(f'Archive from {request.remote_addr}: {error}')
+            yield json.dumps({'error': str(error)}) + '\n'
+        logger.info(f'Sent replies (NDJSON) to {request.remote_addr}')
+
+    return Response(stream_with_context(replies()), mimetype='application/x-ndjson')
+
+
+@app.route('/jobs', methods=['POST'])
+def submit_job():
+    """Queue the uploaded files for analysis and reply with the job id at once.
+    The result is polled from /jobs/<id> or sent (POST, JSON) to the URL of the optional "callback" form field.
+    """
+    data = request.files.to_dict()
+    logger.warning(f'--------------------NEW JOB--------------------')
+    logger.info(f'POST request received from {request.remote_addr}')
+    logger.info(f'POST contains: {list(data.keys())}')
+    # The uploads are read here, the request files are closed when the request ends
+    files = {name: (file.filename, received_card(file)) for name, file in data.items()}
+    try:
+        job_id = jobs.submit(lambda: analyze_files(files), request.form.get('callback') or None)
+    except QueueFull as error:
+        logger.warning(f'Job from {request.remote_addr} was rejected: {error}')
+        return jsonify(error='Too many jobs, please try again later'), 503, {'Retry-After': '30'}
+    except ValueError as error:
+        return jsonify(error=str(error)), 400
+    return jsonify(id=job_id, status='queued', url=url_for('job_status', job_id=job_id)), 202
+
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Reply with the status of the job (queued, running, finished, failed) and the result of a finished job."""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify(error=f'Job {job_id} is not found'), 404
+    return jsonify(id=job['id'], status=job['status'], result=job['result'])
+
+
 @app.route('/schedule', methods=['GET'])
 def schedule():
     schedule = duty()
     return render_template('schedule.html', date=schedule[0], person=schedule[1])
 
 
+@app.route('/schedule/days', methods=['GET'])
+def schedule_days():
+    """Reply with the duty days (JSON) of the period (day, week or month, the week by default)
+    of the date (YYYY-MM-DD, today by default).
+    """
+    try:
+        day = date.fromisoformat(request.args.get('date', date.today().isoformat()))
+    except ValueError:
+        return jsonify(error='The date must be YYYY-MM-DD'), 400
+    period = request.args.get('period', 'week')
+    if period == 'day':
+        days = [(day, schedule_index.person(day))]
+    elif period == 'week':
+        days = schedule_index.week(day)
+    elif period == 'month':
+        days = schedule_index.month(day.year, day.month)
+    else:
+        return jsonify(error='The period must be day, week or month'), 400
+    return jsonify(period=period, days=[{'date': day.isoformat(), 'person': person} for day, person in days])
+
+
+@app.route('/reload', methods=['POST'])
+def reload_plugins():
+    """Rebuild the plugin registry (parsers, tests and reports) of the worker and load the rule overrides again
+    without restarting the server.
+    """
+    if request.remote_addr not in ('127.0.0.1', '::1'):
+        logger.warning(f'Reload request from {request.remote_addr} was rejected')
+        return 'Forbidden', 403
+    plugins.load(reload_modules=True)
+    rules.configure(app.config['RULES_PATH'])
+    cache.invalidate()
+    # The worker processes import the reloaded modules when they are started again
+    pool.configure(app.config['ANALYSIS_WORKERS'], app.config, writer.queue, writer.level,
+                   app.config['ANALYSIS_EXECUTABLE'])
+    logger.info(f'Plugins were reloaded by {request.remote_addr}')
+    tests = {family: [module.__name__ for module in modules] for family, modules in plugins.tests.items()}
+    reports = {family: sorted(kinds) for family, kinds in plugins.reports.items()}
+    return jsonify(parsers=sorted(plugins.parsers), tests=tests, reports=reports)
+
+
+@app.route('/ready', methods=['GET'])
+def ready():
+    """Reply 200 when the worker is warmed up (503 until then) with the steps of the warm-up."""
+    status = warmup.status()
+    return jsonify(status), 200 if status['ready'] else 503
+
+
 @app.errorhandler(413)
 def request_entity_too_large(error):
     logger.info(f'POST request received from {request.remote_addr}')
@@ -69,26 +246,9 @@ def request_entity_too_large(error):
 
 # Create a custom logger
 logger = logging.getLogger('logger')
-logger.setLevel(logging.DEBUG)
-
-# Create handlers
-console_handler = logging.StreamHandler()
-log = 'parser.log'
-#Fix for Apache (httpd.service)
-httpd_location = '/var/www/html/parser/logs/'
-file_handler = logging.FileHandler(log)
-console_handler.setLevel(logging.DEBUG)
-file_handler.setLevel(logging.DEBUG)
-
-# Create formatter and add it to handlers
-form = '%(asctime)s - %(levelname)s - %(pathname)s - %(message)s'
-formatter = logging.Formatter(fmt=form, datefmt='%d-%b-%y %H:%M:%S')
-console_handler.setFormatter(formatter)
-file_handler.setFormatter(formatter)
-
-# Add handlers to the logger
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+
+# Load the plugins, compile the patterns and run the sample cards before the first request (see /ready)
+warmup.start(app.config['WARM_UP_CARDS'])
 
 
 if __name__ == '__main__':
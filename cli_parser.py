@@ -1,42 +1,59 @@
 # -*- coding: utf-8 -*-
 
 import click
+import json
 import logging
+from pathlib import Path
 
-from scripts.dc_handler import analyze
+from config import Config
+from scripts.dc_archive import ArchiveError, read_archive
+from scripts.dc_compression import SUFFIXES
+from scripts.dc_handler import analyze, configure, pool
+from scripts.dc_logging import writer
 
 
 @click.command()
-@click.argument('file', type=click.File("rb"), nargs=-1)
+@click.argument('files', type=click.Path(exists=True, dir_okay=False), nargs=-1)
 @click.option('-s', '--source', default='jira', help='-s [jira/web/cli] to choose a source')
-@click.option('-f', '--folder', default='jira', help='selec')
-@click.option('-n', '--name', default='jira', help='selec')
-@click.option('-c', '--clear', default='jira', help='selec')
-def parser(file, source):
-    print(file)
-    report = analyze(dc_name='cli', dc_file=file, dc_source=[source, 'CLI'])
-    click.echo(report)
-
-
-# Create a custom logger
+@click.option('-f', '--folder', type=click.Path(exists=True, file_okay=False),
+              help='-f <folder> to analyze all diagnostic cards (*.txt, *.gz, *.zst, *.xz) in the folder')
+@click.option('-a', '--archive', type=click.Path(exists=True, dir_okay=False), multiple=True,
+              help='-a <archive> to analyze all diagnostic cards (*.txt) in a zip or tar.gz archive (NDJSON output)')
+@click.option('-w', '--workers', default=4, show_default=True,
+              help='-w <number> of processes to analyze the cards of the archives')
+def parser(files, source, folder, archive, workers):
+    # The cards are analyzed with the settings of the server, in this process and in the worker processes
+    settings = vars(Config)
+    configure(settings)
+
+    paths = [Path(file) for file in files]
+    if folder:
+        paths.extend(sorted(path for path in Path(folder).iterdir()
+                            if path.is_file() and path.suffix in ('.txt', *SUFFIXES)))
+
+    for path in paths:
+        # card.txt.gz is named "card" as card.txt is
+        dc_name = Path(path.stem).stem if path.suffix in SUFFIXES else path.stem
+        report = analyze(dc_name=dc_name, dc_file=path, dc_source=[source, 'CLI'])
+        click.echo(report)
+
+    if archive:
+        pool.configure(workers, settings, writer.queue, writer.level, Config.ANALYSIS_EXECUTABLE)
+    for path in archive:
+        with open(path, 'rb') as file:
+            cards = read_archive(file, Config.ARCHIVE_MAX_SIZE, Config.ARCHIVE_MEMBER_SIZE, Config.ARCHIVE_MEMBERS)
+            try:
+                for name, report in pool.iterate((name, content, [source, 'CLI'])
+                                                 for name, content in cards if content is not None):
+                    reply = {'error': 'The card cannot be analyzed'} if report is None else report
+                    click.echo(json.dumps({'archive': path, 'name': name, **reply}))
+            except ArchiveError as error:
+                click.echo(f'{path}: {error}', err=True)
+
+
+# The log records are written by a background thread
+writer.configure('parser.log', level=logging.DEBUG, console_level=logging.CRITICAL)
 logger = logging.getLogger('logger')
-logger.setLevel(logging.DEBUG)
-
-# Create handlers
-console_handler = logging.StreamHandler()
-file_handler = logging.FileHandler('parser.log')
-console_handler.setLevel(logging.CRITICAL)
-file_handler.setLevel(logging.DEBUG)
-
-# Create formatter and add it to handlers
-form = '%(asctime)s - %(levelname)s - %(pathname)s - %(message)s'
-formatter = logging.Formatter(fmt=form, datefmt='%d-%b-%y %H:%M:%S')
-console_handler.setFormatter(formatter)
-file_handler.setFormatter(formatter)
-
-# Add handlers to the logger
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
 
 
 if __name__ == "__main__":
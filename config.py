@@ -5,17 +5,69 @@ from pathlib import Path
 
 class Config(object):
     UPLOAD_FOLDER = Path.cwd() / 'scripts' / 'dcards'
-    ALLOWED_EXTENSIONS = 'txt'
+    ALLOWED_EXTENSIONS = ('txt', 'gz', 'zst', 'xz')
     MAX_CONTENT_LENGTH = 1024 * 1024 * 2
+    # The size limit of a card after decompression (the cards may be uploaded as .gz, .zst (zstandard) or .xz)
+    CARD_MAX_SIZE = 1024 * 1024 * 16
     DROPZONE_MAX_FILE_SIZE = 1
     DROPZONE_UPLOAD_MULTIPLE = True
     DROPZONE_ALLOWED_FILE_CUSTOM = True
-    DROPZONE_ALLOWED_FILE_TYPE = '.txt'
+    DROPZONE_ALLOWED_FILE_TYPE = '.txt, .gz, .zst, .xz'
     #DROPZONE_REDIRECT_VIEW = 'results'
     DROPZONE_DEFAULT_MESSAGE = 'Drop files here to upload111'
+    # Report cache: memory limit (bytes), SQLite database shared by the workers (None - memory only), timeout (sec)
+    CACHE_SIZE = 1024 * 1024 * 32
+    CACHE_PATH = None
+    CACHE_TIMEOUT = 60 * 60 * 24
+    # Log: file (rotated at the size limit, the number of old files kept), levels of the file and the console
+    LOG_PATH = 'parser.log'
+    LOG_MAX_BYTES = 1024 * 1024 * 10
+    LOG_BACKUPS = 5
+    LOG_LEVEL = 'DEBUG'
+    LOG_CONSOLE_LEVEL = 'DEBUG'
+    # Warm-up: the sample cards (a card of each family) run through the pipeline before the worker is ready,
+    # the time parser.wsgi waits for the warm-up (sec)
+    WARM_UP_CARDS = [Path.cwd() / 'scripts' / 'dcards' / 'archive' / name for name in (
+        '110006_diagcard.SN-206827+(1).txt',
+        'diagcard.SN-506026 xg 1000 link up and all ok.txt',
+        'diag_master_700081_2019-05-14_01-20-55.txt',
+    )]
+    WARM_UP_TIMEOUT = 120
+    # Analysis: worker processes parsing the cards in parallel (0 - the cards are parsed in the request thread)
+    ANALYSIS_WORKERS = 4
+    # The Python interpreter of the worker processes, None - found from sys.executable (Apache under mod_wsgi)
+    ANALYSIS_EXECUTABLE = None
+    # The duty schedule (PDF), its calendar is saved next to it (<name>.schedule.json)
+    SCHEDULE_PATH = 'test.pdf'
+    # Archives (zip, tar.gz) of cards: archive size limit, card size limit (bytes), number of cards limit
+    ARCHIVE_MAX_SIZE = 1024 * 1024 * 32
+    ARCHIVE_MEMBER_SIZE = 1024 * 1024 * 16
+    ARCHIVE_MEMBERS = 500
+    # Tests: threads per process, time limit of a test and of all tests of a card (sec)
+    TESTS_WORKERS = 8
+    TESTS_TIMEOUT = 15
+    TESTS_BUDGET = 25
+    # Firmware catalog: a local copy of the FTP server (None - the server), listing lifetime (sec), last known listing
+    FIRMWARE_FOLDER = None
+    FIRMWARE_TTL = 60 * 60
+    FIRMWARE_SNAPSHOT = Path.cwd() / 'scripts' / 'dcards' / 'firmware.json'
+    # Overrides of the test thresholds (JSON, see scripts/tests/dc_rules.py), None - the default thresholds
+    RULES_PATH = None
+    # Jobs: threads per process, queued and running jobs limit, SQLite database shared by the workers
+    # (None - memory only), lifetime of a finished job (sec)
+    JOBS_WORKERS = 2
+    JOBS_QUEUE = 64
+    JOBS_PATH = None
+    JOBS_TTL = 60 * 60
+    # Hosts allowed for the job callbacks, empty - any host with public addresses (not the local network)
+    JOBS_CALLBACK_HOSTS = ()
 
 class ProductionConfig(Config):
     DEBUG = False
+    LOG_LEVEL = 'INFO'
+    LOG_CONSOLE_LEVEL = 'WARNING'
+    CACHE_PATH = Path.cwd() / 'scripts' / 'dcards' / 'cache.sqlite'
+    JOBS_PATH = Path.cwd() / 'scripts' / 'dcards' / 'jobs.sqlite'
 
 class DevelopmentConfig(Config):
     DEBUG = True
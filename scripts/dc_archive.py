@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+import io
+import logging
+from pathlib import PurePosixPath
+import tarfile
+import zipfile
+
+
+ZIP_MAGIC = b'PK\x03\x04'
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+class ArchiveError(ValueError):
+    """The archive cannot be read (an unknown format, a broken or too large archive)."""
+
+
+class PrefixedStream(io.RawIOBase):
+    """A stream returning the bytes read ahead (to detect the format) and then the rest of the source stream."""
+
+    def __init__(self, prefix, stream):
+        self.prefix = prefix
+        self.stream = stream
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self.prefix:
+            size = min(len(buffer), len(self.prefix))
+            buffer[:size], self.prefix = self.prefix[:size], self.prefix[size:]
+            return size
+        data = self.stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def read_exactly(file, size):
+    """Read up to size bytes from the file (a stream may return fewer bytes per read)."""
+
+    chunks = []
+    while size > 0:
+        chunk = file.read(size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def read_archive(stream, archive_size, member_size, members):
+    """Yield (a member name, bytes) of the cards (*.txt) of a zip or tar.gz archive read from the stream.
+
+    A tar.gz archive is extracted while it is read, a zip archive is read into memory first (its directory is
+    at the end), no member is written to disk. A member larger than member_size yields (a member name, None).
+    Raise ArchiveError if the format is unknown, the archive is broken or it has more than members cards.
+    """
+
+    magic = read_exactly(stream, 4)
+    try:
+        if magic.startswith(GZIP_MAGIC):
+            entries = read_tar(PrefixedStream(magic, stream), member_size)
+        elif magic.startswith(ZIP_MAGIC):
+            content = magic + read_exactly(stream, archive_size + 1 - len(magic))
+            if len(content) > archive_size:
+                raise ArchiveError(f'The archive is larger than {archive_size} bytes')
+            entries = read_zip(io.BytesIO(content), member_size)
+        else:
+            raise ArchiveError('The archive must be a zip or tar.gz file')
+
+        for count, (name, content) in enumerate(entries, 1):
+            if count > members:
+                raise ArchiveError(f'The archive contains more than {members} cards')
+            yield name, content
+    except (tarfile.TarError, zipfile.BadZipFile, EOFError, OSError) as error:
+        raise ArchiveError(f'The archive cannot be read ({error})') from error
+
+
+def read_tar(stream, member_size):
+    """Yield the cards of a tar.gz stream."""
+
+    with tarfile.open(fileobj=stream, mode='r|gz') as archive:
+        for member in archive:
+            if not member.isfile() or PurePosixPath(member.name).suffix.lower() != '.txt':
+                continue
+            if member.size > member_size:
+                logger.warning(f'Archive: {member.name} ({member.size} bytes) is too large')
+                yield member.name, None
+                continue
+            yield member.name, archive.extractfile(member).read()
+
+
+def read_zip(file, member_size):
+    """Yield the cards of a zip file."""
+
+    with zipfile.ZipFile(file) as archive:
+        for member in archive.infolist():
+            if member.is_dir() or PurePosixPath(member.filename).suffix.lower() != '.txt':
+                continue
+            # The declared size may be forged, the member is read no further than the limit
+            with archive.open(member) as member_file:
+                content = member_file.read(member_size + 1)
+            if len(content) > member_size:
+                logger.warning(f'Archive: {member.filename} is larger than {member_size} bytes')
+                yield member.filename, None
+                continue
+            yield member.filename, content
+
+
+logger = logging.getLogger('logger.dc_archive')
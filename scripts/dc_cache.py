@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+from contextlib import contextmanager
+import hashlib
+import logging
+from pathlib import Path
+import pickle
+import sqlite3
+from threading import Lock
+from time import time
+
+from scripts.dc_firmware import catalog
+from scripts.tests.dc_rules import rules
+
+
+# The modules the reports depend on besides the parsers, tests and reports (the firmware catalog, the pipeline)
+MODULES = ('dc_firmware.py', 'dc_handler.py')
+
+
+def code_version():
+    """Return a hash of the parsers, tests and reports code (and MODULES) and the overrides of the test thresholds.
+    The reports made by another version of the code are not taken from the cache.
+    """
+
+    digest = hashlib.sha256(rules.digest.encode('utf-8'))
+    root = Path(__file__).parent
+    paths = [root / name for name in MODULES]
+    for folder in ('parsers', 'tests', 'reports'):
+        paths.extend(sorted((root / folder).rglob('*.py')))
+    for path in paths:
+        digest.update(str(path.relative_to(root)).encode('utf-8'))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class ReportCache:
+    """A cache of the reports keyed by the card text, the source kind (jira, web, cli) and the code version.
+
+    The first tier is an LRU in the process memory limited by the size of the pickled reports (bytes).
+    The second tier is an optional SQLite database shared by all processes (WSGI workers) on the server.
+    The reports older than the timeout (seconds) are not returned, the recommendations depend on the latest firmware.
+    """
+
+    def __init__(self, size=1024 * 1024 * 32, path=None, timeout=60 * 60 * 24):
+        self.lock = Lock()
+        self.memory = OrderedDict()
+        self.memory_size = 0
+        self.version = None
+        self.configure(size, path, timeout)
+
+    def configure(self, size, path=None, timeout=60 * 60 * 24):
+        """Set the memory limit (bytes), the database path (None disables the disk tier) and the timeout."""
+
+        with self.lock:
+            self.size = size
+            self.path = path
+            self.timeout = timeout
+            self.evict()
+
+        if path is not None:
+            with self.connect() as connection:
+                connection.execute('PRAGMA journal_mode=WAL')
+                connection.execute('CREATE TABLE IF NOT EXISTS reports '
+                                   '(key TEXT PRIMARY KEY, created REAL, report BLOB)')
+
+    @contextmanager
+    def connect(self):
+        """Open the database for a transaction, a connection is not shared between threads."""
+
+        connection = sqlite3.connect(self.path, timeout=5)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def key(self, dc_string, kind):
+        """Return the key of the card analyzed for the source kind.
+        The line endings and the trailing blanks of the lines are ignored (the same card saved on Windows).
+        """
+
+        if self.version is None:
+            self.version = code_version()
+            logger.info(f'Report cache: code version {self.version}')
+
+        digest = hashlib.sha256(f'{self.version}:{kind}:'.encode('utf-8'))
+        digest.update('\n'.join(map(str.rstrip, dc_string.splitlines())).rstrip().encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Return the cached report or None."""
+
+        with self.lock:
+            if key in self.memory:
+                created, data = self.memory[key]
+                if time() - created < self.timeout:
+                    self.memory.move_to_end(key)
+                    logger.debug('Report cache: memory hit %s', key)
+                    return pickle.loads(data)
+                self.memory_size -= len(data)
+                del self.memory[key]
+
+        if self.path is None:
+            return None
+
+        try:
+            with self.connect() as connection:
+                row = connection.execute('SELECT created, report FROM reports WHERE key = ?', (key,)).fetchone()
+                if row is None:
+                    return None
+                created, data = row
+                if time() - created >= self.timeout:
+                    connection.execute('DELETE FROM reports WHERE key = ?', (key,))
+                    return None
+        except sqlite3.Error as error:
+            logger.warning(f'Report cache: the database cannot be read ({error})')
+            return None
+
+        logger.debug('Report cache: disk hit %s', key)
+        self.store(key, created, data)
+        return pickle.loads(data)
+
+    def set(self, key, report):
+        """Save the report in the cache."""
+
+        created = time()
+        data = pickle.dumps(report)
+        self.store(key, created, data)
+
+        if self.path is None:
+            return
+
+        try:
+            with self.connect() as connection:
+                connection.execute('INSERT OR REPLACE INTO reports VALUES (?, ?, ?)', (key, created, data))
+                connection.execute('DELETE FROM reports WHERE created < ?', (created - self.timeout,))
+        except sqlite3.Error as error:
+            logger.warning(f'Report cache: the database cannot be written ({error})')
+
+    def store(self, key, created, data):
+        """Save the pickled report in the memory tier."""
+
+        with self.lock:
+            if key in self.memory:
+                self.memory_size -= len(self.memory.pop(key)[1])
+            self.memory[key] = (created, data)
+            self.memory_size += len(data)
+            self.evict()
+
+    def evict(self):
+        """Drop the least recently used reports until the memory tier fits the size (the lock must be held)."""
+
+        while self.memory and self.memory_size > self.size:
+            _, (_, data) = self.memory.popitem(last=False)
+            self.memory_size -= len(data)
+
+    def invalidate(self):
+        """Drop the reports of the process and compute the code version again (e.g. the plugins were reloaded).
+        The reports of another code version in the database are not used since their keys differ.
+        """
+
+        with self.lock:
+            self.memory.clear()
+            self.memory_size = 0
+            self.version = None
+
+    def clear(self):
+        """Drop all cached reports."""
+
+        with self.lock:
+            self.memory.clear()
+            self.memory_size = 0
+
+        if self.path is not None:
+            with self.connect() as connection:
+                connection.execute('DELETE FROM reports')
+
+
+cache = ReportCache()
+# The recommendations of the cached reports are out of date when a new firmware is found
+catalog.on_change(cache.clear)
+
+logger = logging.getLogger('logger.dc_cache')
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import lzma
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# The compressed cards (the format is found by the magic bytes, the suffix is used to find the files)
+MAGIC = {b'\x1f\x8b': 'gzip', b'\xfd7zXZ\x00': 'xz', b'\x28\xb5\x2f\xfd': 'zstd'}
+MAGIC_SIZE = max(map(len, MAGIC))
+SUFFIXES = ('.gz', '.xz', '.zst')
+
+# The output of one decompression step, a small compressed chunk may expand a lot
+CHUNK_SIZE = 1024 * 256
+# A zstd block (128 KB at most) may be encoded by 4 bytes
+ZSTD_RATIO = 1024 * 32
+
+
+class CompressionError(ValueError):
+    """The card cannot be decompressed (a broken or truncated stream, an unsupported format, a too large card)."""
+
+
+def detect_compression(head):
+    """Return the format of the compressed data by its first bytes (gzip, xz, zstd) or None if it is not compressed."""
+
+    for magic, kind in MAGIC.items():
+        if head.startswith(magic):
+            return kind
+    return None
+
+
+class Decompressor:
+    """A streaming decompressor of a card: the compressed chunks are pushed, the decompressed chunks are yielded.
+
+    The decompressed size is limited (a compression bomb is stopped when the limit is exceeded, not when it is
+    decompressed), the limit is checked for a card which is not compressed (kind None) as well.
+    The zstd format needs the zstandard package.
+    """
+
+    def __init__(self, kind, limit=None):
+        self.kind = kind
+        self.limit = limit
+        self.size = 0
+
+        if kind == 'gzip':
+            self.engine = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        elif kind == 'xz':
+            self.engine = lzma.LZMADecompressor(lzma.FORMAT_XZ)
+        elif kind == 'zstd':
+            if zstandard is None:
+                raise CompressionError('zstd cards are not supported (the zstandard package is not installed)')
+            self.engine = zstandard.ZstdDecompressor().decompressobj()
+        else:
+            self.engine = None
+
+    def count(self, chunk):
+        """Add the decompressed chunk to the size of the card and return it."""
+
+        self.size += len(chunk)
+        if self.limit is not None and self.size > self.limit:
+            raise CompressionError(f'The card is larger than {self.limit} bytes')
+        return chunk
+
+    def decompress(self, data):
+        """Yield the decompressed chunks of the data."""
+
+        try:
+            if self.kind == 'gzip':
+                while data:
+                    chunk = self.engine.decompress(data, CHUNK_SIZE)
+                    data = self.engine.unconsumed_tail
+                    # A gzip file may contain several members
+                    if self.engine.eof and self.engine.unused_data:
+                        data = self.engine.unused_data
+                        self.engine = zlib.decompressobj(zlib.MAX_WBITS | 16)
+                    yield self.count(chunk)
+            elif self.kind == 'xz':
+                if self.engine.eof:
+                    return
+                yield self.count(self.engine.decompress(data, CHUNK_SIZE))
+                while not self.engine.eof and not self.engine.needs_input:
+                    yield self.count(self.engine.decompress(b'', CHUNK_SIZE))
+            elif self.kind == 'zstd':
+                # The zstd decompressor has no output limit, the data is fed in slices small enough
+                # for the output of a step to stay within the rest of the limit
+                data = memoryview(data)
+                while data:
+                    step = len(data) if self.limit is None else max(CHUNK_SIZE, self.limit - self.size) // ZSTD_RATIO
+                    yield self.count(self.engine.decompress(data[:step]))
+                    data = data[step:]
+            else:
+                yield self.count(data)
+        except (zlib.error, lzma.LZMAError, EOFError) as error:
+            raise CompressionError(f'The {self.kind} card cannot be decompressed ({error})') from error
+        except Exception as error:
+            if zstandard is not None and isinstance(error, zstandard.ZstdError):
+                raise CompressionError(f'The zstd card cannot be decompressed ({error})') from error
+            raise
+
+    def finish(self):
+        """Return the rest of the card, raise CompressionError if the compressed card is truncated."""
+
+        if self.kind == 'gzip':
+            chunk = self.count(self.engine.flush())
+            if not self.engine.eof:
+                raise CompressionError('The gzip card is truncated')
+            return chunk
+        if self.kind == 'xz' and not self.engine.eof:
+            raise CompressionError('The xz card is truncated')
+        if self.kind == 'zstd' and not getattr(self.engine, 'eof', True):
+            raise CompressionError('The zstd card is truncated')
+        return b''
+
+
+def decompress_file(file, limit=None):
+    """Read a card from a binary file (compressed or not) and return its bytes."""
+
+    head = file.read(MAGIC_SIZE)
+    decompressor = Decompressor(detect_compression(head), limit)
+    chunks = list(decompressor.decompress(head))
+    for data in iter(lambda: file.read(CHUNK_SIZE), b''):
+        chunks.extend(decompressor.decompress(data))
+    chunks.append(decompressor.finish())
+    return b''.join(chunks)
+
+
+logger = logging.getLogger('logger.dc_compression')
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+from collections import namedtuple
+from ftplib import FTP
+import json
+import logging
+from pathlib import Path
+import re
+from threading import Lock, Thread
+from time import time
+
+
+# A firmware file: the version ("1.90"), the version as a tuple of numbers to sort by, the URL to download it
+Firmware = namedtuple('Firmware', 'version number url')
+
+
+class FTPLister:
+    """List the folders of an FTP server (the Infinet FTP server by default) in one connection."""
+
+    def __init__(self, host='ftp.infinet.ru', timeout=5):
+        self.host = host
+        self.timeout = timeout
+
+    def __call__(self, folders):
+        """Return a list of file paths for each folder."""
+
+        ftp = FTP(self.host, timeout=self.timeout)
+        try:
+            ftp.login()
+            logger.info(f'FTP - Connected to {self.host}')
+            listings = [ftp.nlst(folder) for folder in folders]
+            logger.debug('FTP - NLST from %s', self.host)
+        finally:
+            ftp.close()
+            logger.info(f'FTP - Disconnected from {self.host}')
+        return listings
+
+    def url(self, path):
+        return f'ftp://{self.host}{path}'
+
+
+class DirectoryLister:
+    """List the folders of a local copy of the FTP server (e.g. a fixture directory), the paths are the same."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def __call__(self, folders):
+        """Return a list of file paths for each folder."""
+
+        listings = []
+        for folder in folders:
+            directory = self.root / folder.strip('/')
+            if not directory.is_dir():
+                raise FileNotFoundError(f'{directory} does not exist')
+            listings.append([f'/{folder.strip("/")}/{path.name}' for path in sorted(directory.iterdir())])
+        return listings
+
+    def url(self, path):
+        return (self.root / path.lstrip('/')).as_uri()
+
+
+class FirmwareCatalog:
+    """The firmware files found on the FTP server, sorted by the version.
+
+    A listing is a set of folders and a pattern of the firmware file name with the version in group 1.
+    The folders are given in the order of preference, a version found in several folders is taken from the first one.
+    A listing is read from the server when it is requested first time and kept for ttl (seconds).
+    A listing older than ttl is still returned while it is read again in a background thread.
+    The listings are saved to the snapshot file (JSON), it is used when the server is not available.
+    A listing that cannot be read is not requested again for retry (seconds).
+    The listeners (see on_change()) are called when a refreshed listing is changed (or found first).
+    """
+
+    retry = 60
+
+    def __init__(self, lister=None, ttl=60 * 60, snapshot=None):
+        self.lock = Lock()
+        self.listeners = []
+        self.configure(lister or FTPLister(), ttl, snapshot)
+
+    def configure(self, lister, ttl=60 * 60, snapshot=None):
+        """Set the lister (FTPLister or DirectoryLister), the time to live (seconds) and the snapshot path."""
+
+        with self.lock:
+            self.lister = lister
+            self.ttl = ttl
+            self.snapshot = snapshot
+            # A listing key: (the time of the listing, a list of firmwares sorted by the version)
+            self.index = {}
+            self.refreshing = set()
+            self.failures = {}
+            self.snapshot_loaded = False
+
+    def on_change(self, listener):
+        """Call the listener (without arguments) when a listing is changed, e.g. a new firmware is found."""
+
+        self.listeners.append(listener)
+
+    def latest(self, folders, pattern):
+        """Return the latest Firmware in the folders or None if the listing is not available."""
+
+        firmwares = self.listing(folders, pattern)
+        return firmwares[-1] if firmwares else None
+
+    def listing(self, folders, pattern):
+        """Return a list of the firmwares in the folders sorted by the version (the latest is the last)."""
+
+        key = '\n'.join((pattern, *folders))
+        with self.lock:
+            if not self.snapshot_loaded:
+                self.load()
+            updated, firmwares = self.index.get(key, (None, []))
+            refresh = ((updated is None or time() - updated >= self.ttl) and key not in self.refreshing
+                       and time() - self.failures.get(key, 0) >= self.retry)
+            if refresh:
+                self.refreshing.add(key)
+
+        if refresh and updated is None:
+            return self.refresh(key, folders, pattern) or firmwares
+        if refresh:
+            Thread(target=self.refresh, args=(key, folders, pattern), daemon=True).start()
+        return firmwares
+
+    def refresh(self, key, folders, pattern):
+        """Read the listing from the server and update the index. Return the firmwares or None on failure."""
+
+        time_start = time()
+        try:
+            listings = self.lister(folders)
+        except Exception:
+            logger.exception(f'Firmware catalog: the listing of {", ".join(folders)} cannot be read')
+            with self.lock:
+                self.refreshing.discard(key)
+                self.failures[key] = time()
+            return None
+
+        # A version found several times is taken from the first folder (the folders are listed in the order
+        # of preference: the release, the beta, the old ones) and the first file name in it
+        firmwares = {}
+        for path in (path for listing in listings for path in sorted(listing)):
+            match = re.search(pattern, path)
+            if match is not None and match.group(1) not in firmwares:
+                version = match.group(1)
+                firmwares[version] = Firmware(version, tuple(map(int, version.split('.'))), self.lister.url(path))
+        firmwares = sorted(firmwares.values(), key=lambda firmware: firmware.number)
+
+        with self.lock:
+            previous = self.index.get(key, (None, []))[1]
+            self.index[key] = (time(), firmwares)
+            self.refreshing.discard(key)
+            self.failures.pop(key, None)
+            self.save()
+
+        # The reports made while the listing was not available (e.g. the server was down) are out of date too
+        if previous != firmwares:
+            latest = firmwares[-1].version if firmwares else None
+            logger.info(f'Firmware catalog: the latest firmware in {", ".join(folders)} is {latest}')
+            for listener in self.listeners:
+                try:
+                    listener()
+                except Exception:
+                    logger.exception(f'Firmware catalog: the listener {listener} failed')
+
+        logger.info(f'Firmware catalog: {len(firmwares)} firmwares in {", ".join(folders)}, '
+                    f'Elapsed Time: {time() - time_start}')
+        return firmwares
+
+    def load(self):
+        """Load the last known listings from the snapshot (the lock must be held)."""
+
+        self.snapshot_loaded = True
+        if self.snapshot is None or not Path(self.snapshot).exists():
+            return
+
+        try:
+            with open(self.snapshot, encoding='utf-8') as file:
+                for key, (updated, firmwares) in json.load(file).items():
+                    self.index[key] = (updated, [Firmware(version, tuple(number), url)
+                                                 for version, number, url in firmwares])
+        except (OSError, ValueError):
+            logger.exception(f'Firmware catalog: the snapshot {self.snapshot} cannot be read')
+            return
+
+        logger.info(f'Firmware catalog: {len(self.index)} listings loaded from {self.snapshot}')
+
+    def save(self):
+        """Save the listings to the snapshot (the lock must be held)."""
+
+        if self.snapshot is None:
+            return
+
+        path = Path(self.snapshot)
+        temporary = path.with_name(f'{path.name}.tmp')
+        try:
+            with open(temporary, 'w', encoding='utf-8') as file:
+                json.dump(self.index, file)
+            temporary.replace(path)
+        except OSError:
+            logger.exception(f'Firmware catalog: the snapshot {self.snapshot} cannot be written')
+
+
+catalog = FirmwareCatalog()
+
+logger = logging.getLogger('logger.dc_firmware')
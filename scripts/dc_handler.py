@@ -1,26 +1,91 @@
 # -*- coding: utf-8 -*-
 
+from concurrent.futures import as_completed, FIRST_COMPLETED, ProcessPoolExecutor, wait
+from io import BytesIO
 import logging
+import mmap
+from multiprocessing import get_context, parent_process
+import os
+from pathlib import Path, PurePath
+import sys
+from threading import Lock
 
-from scripts.parsers.dc_parser import get_result
-from scripts.tests.dc_tester import run_tests
+from scripts.dc_cache import cache
+from scripts.dc_compression import decompress_file, detect_compression, MAGIC_SIZE
+from scripts.dc_firmware import catalog, DirectoryLister, FTPLister
+from scripts.dc_logging import log_to_queue
+from scripts.parsers.dc_lines import DiagnosticLines
+from scripts.parsers.dc_parser import get_result, warm_up
+from scripts.tests.dc_rules import rules
+from scripts.tests.dc_tester import run_tests, runner
 from scripts.reports.dc_reporter import create_report, create_report_error
 
 
+# The fields of a report (a tuple returned by analyze())
+REPORT_FIELDS = ('model', 'family', 'subfamily', 'serial_number', 'firmware', 'report')
+
+# The settings of the analysis (the keys of the config), a worker process is configured with them
+SETTINGS = ('CACHE_SIZE', 'CACHE_PATH', 'CACHE_TIMEOUT', 'TESTS_WORKERS', 'TESTS_TIMEOUT', 'TESTS_BUDGET',
+            'FIRMWARE_FOLDER', 'FIRMWARE_TTL', 'FIRMWARE_SNAPSHOT', 'RULES_PATH', 'WARM_UP_CARDS')
+
+
+def configure(settings):
+    """Configure the report cache, the test runner, the firmware catalog and the rules from the settings (a mapping)."""
+
+    cache.configure(settings['CACHE_SIZE'], settings['CACHE_PATH'], settings['CACHE_TIMEOUT'])
+    runner.configure(settings['TESTS_WORKERS'], settings['TESTS_TIMEOUT'], settings['TESTS_BUDGET'])
+    firmware_folder = settings['FIRMWARE_FOLDER']
+    catalog.configure(FTPLister() if firmware_folder is None else DirectoryLister(firmware_folder),
+                      settings['FIRMWARE_TTL'], settings['FIRMWARE_SNAPSHOT'])
+    rules.configure(settings['RULES_PATH'])
+
+
+def read_card(dc_file):
+    """Read a diagnostic card from a file.
+    The file is memory-mapped and the mapped pages are decoded into the text of the card: the text is a full copy
+    of the card (the parsers need a str), only the bytes object read() would make before it is saved.
+    A compressed card (gzip, xz, zstd) is decompressed as it is read.
+    """
+
+    with open(dc_file, 'rb') as file:
+        if detect_compression(file.read(MAGIC_SIZE)) is not None:
+            file.seek(0)
+            return decompress_file(file).decode('utf-8')
+
+        # An empty file cannot be mapped
+        if not file.seek(0, 2):
+            return ''
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return str(buffer, 'utf-8')
+
+
 def analyze(dc_name, dc_file, dc_source):
-    """Handle a diagnostic card."""
+    """Handle a diagnostic card (an uploaded file or a path to a file)."""
 
     try:
-        if dc_source[0] == 'jira':
-            dc_string = dc_file.read().decode('utf-8')
-            dc_list = list(map(lambda x: x + '\n', dc_string.split('\n')))
+        if isinstance(dc_file, (str, PurePath)):
+            dc_string = read_card(dc_file)
         else:
-            with open(dc_file) as text:
-                dc_string = text.read()
-            dc_list = list(map(lambda x: x + '\n', dc_string.split('\n')))
+            dc_string = dc_file.read().decode('utf-8')
     except:
         logger.critical('Wrong file format or encoding')
 
+    return analyze_text(dc_name, dc_string, dc_source)
+
+
+def analyze_text(dc_name, dc_string, dc_source, offsets=None):
+    """Handle the text of a diagnostic card, the offsets of its lines may be found already (see DiagnosticLines)."""
+
+    # The same card may be uploaded again (e.g. a reopened ticket)
+    cache_key = cache.key(dc_string, dc_source[0])
+    report = cache.get(cache_key)
+    if report is not None:
+        logger.info('The report was taken from the cache')
+        return report
+
+    # The lines are cut from the text on request, the card is kept in memory once
+    dc_list = DiagnosticLines(dc_string, offsets)
+
     # Create a class instance
     device = get_result(dc_string, dc_list, dc_name, dc_source)
 
@@ -31,7 +96,179 @@ def analyze(dc_name, dc_file, dc_source):
         tests = run_tests(device)
         report = create_report(device, tests, dc_source)
 
+    # A report without the results of the timed out tests is not cached
+    if report is not None and not (device is not None and tests.timed_out):
+        cache.set(cache_key, report)
+
     return report
 
 
+def analyze_content(dc_name, content, dc_source, offsets=None):
+    """Handle a diagnostic card passed as bytes or as text (with the line offsets if they are known)
+    and return the report as a dict (see REPORT_FIELDS).
+    """
+
+    if isinstance(content, str):
+        return dict(zip(REPORT_FIELDS, analyze_text(dc_name, content, dc_source, offsets)))
+    return dict(zip(REPORT_FIELDS, analyze(dc_name, BytesIO(content), dc_source)))
+
+
+def rehearse(dc_file):
+    """Run a sample card (a path) through the parser, the tests and the report, bypassing the report cache.
+    Return the family of the card or raise ValueError if the card is not parsed.
+    """
+
+    dc_string = read_card(dc_file)
+    dc_source = ['jira', 'warm-up']
+    device = get_result(dc_string, DiagnosticLines(dc_string), PurePath(dc_file).stem, dc_source)
+    if device is None:
+        raise ValueError(f'The sample card {dc_file} is not parsed')
+    create_report(device, run_tests(device), dc_source)
+    return device.family
+
+
+def init_worker(settings, log_queue, log_level):
+    """Prepare a worker process of the pool: send the log records to the main process (if the queue is set),
+    configure the analysis (None - the defaults), compile the patterns and run the sample cards.
+    """
+
+    if log_queue is not None:
+        log_to_queue(log_queue, log_level)
+    if settings is not None:
+        configure(settings)
+    warm_up()
+    for dc_file in settings['WARM_UP_CARDS'] if settings is not None else ():
+        try:
+            rehearse(dc_file)
+        except Exception:
+            logger.exception(f'Warm-up: the sample card {dc_file} failed')
+
+
+def python_executable():
+    """Return the Python interpreter of the worker processes.
+    Under mod_wsgi sys.executable is the server (e.g. Apache), the interpreter of the environment is used then.
+    """
+
+    if Path(sys.executable).name.lower().startswith('python'):
+        return sys.executable
+    if os.name == 'nt':
+        return str(Path(sys.exec_prefix) / 'python.exe')
+    return str(Path(sys.exec_prefix) / 'bin' / 'python3')
+
+
+class AnalysisPool:
+    """A pool of worker processes analyzing the cards in parallel.
+
+    The parsing is CPU-bound and the threads of a process are serialized by the GIL, so the cards of a request
+    and the cards of concurrent requests are sent to the processes. A card is passed as bytes (or text) and the report
+    comes back as a dict (see analyze_content()), no card objects cross the process boundary.
+    The processes are spawned (not forked from a process running threads) and configured by init_worker().
+    They are started on the first use (the warm-up waits for them, see wait()), not when the application
+    is imported, and they run the interpreter set by configure() instead of sys.executable.
+    With no workers the cards are analyzed in the calling thread.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.executor = None
+        self.workers = 0
+        self.initargs = None
+        self.executable = None
+        self.started = []
+
+    def configure(self, workers, settings=None, log_queue=None, log_level=logging.DEBUG, executable=None):
+        """Set the number of the worker processes (the running ones are stopped) configured with the settings
+        (a mapping), the log records of the processes (log_level and above) are sent to the log queue
+        (see LogWriter). The processes run the executable (None - see python_executable()).
+        """
+
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+                self.started = []
+            self.workers = workers
+
+            # A worker process must not start a pool of its own
+            if not workers or parent_process() is not None:
+                self.workers = 0
+                return
+
+            if settings is not None:
+                settings = {key: settings[key] for key in SETTINGS}
+            self.initargs = (settings, log_queue, log_level)
+            self.executable = executable or python_executable()
+
+    def start(self):
+        """Start the worker processes if they are not running. Return the executor or None if there are no workers."""
+
+        with self.lock:
+            if self.executor is None and self.workers:
+                context = get_context('spawn')
+                context.set_executable(self.executable)
+                self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                                    initializer=init_worker, initargs=self.initargs)
+                # The processes are spawned on demand, one by one for each waiting task
+                self.started = [self.executor.submit(int) for _ in range(self.workers)]
+                logger.info(f'Analysis pool: {self.workers} processes were started ({self.executable})')
+            return self.executor
+
+    def wait(self):
+        """Start the processes and wait for them to be ready (warmed up by init_worker())."""
+
+        self.start()
+        for future in self.started:
+            future.result()
+
+    def map(self, cards):
+        """Analyze the cards (name, content, source[, offsets]) and return their reports (dicts) in the same order."""
+
+        executor = self.start()
+        if executor is None:
+            return [analyze_content(*card) for card in cards]
+
+        futures = [executor.submit(analyze_content, *card) for card in cards]
+        return [future.result() for future in futures]
+
+    def iterate(self, cards):
+        """Analyze the cards (name, content, source[, offsets]) and yield (name, report) as the reports are ready.
+        The cards are taken from the iterable as the processes become free (no more than twice the workers
+        are waiting), a card which cannot be analyzed yields (name, None).
+        """
+
+        executor = self.start()
+        if executor is None:
+            for card in cards:
+                yield card[0], self.result(card[0], lambda: analyze_content(*card))
+            return
+
+        pending = {}
+        try:
+            for card in cards:
+                pending[executor.submit(analyze_content, *card)] = card[0]
+                if len(pending) >= self.workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield pending[future], self.result(pending.pop(future), future.result)
+            for future in as_completed(pending):
+                yield pending[future], self.result(pending[future], future.result)
+        finally:
+            # The reader may stop early (e.g. the client disconnected)
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def result(name, function):
+        """Return the report of the card or None if the analysis failed."""
+
+        try:
+            return function()
+        except Exception:
+            logger.exception(f'The card "{name}" cannot be analyzed')
+            return None
+
+
+pool = AnalysisPool()
+
+
 logger = logging.getLogger('logger.dc_handler')
\ No newline at end of file
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import ipaddress
+import json
+import logging
+import socket
+import sqlite3
+from threading import Lock
+from time import time
+from urllib.parse import urlparse
+from urllib.request import build_opener, HTTPRedirectHandler, Request
+from uuid import uuid4
+
+
+class QueueFull(Exception):
+    """The job queue has no free places, the job should be submitted later."""
+
+
+class NoRedirect(HTTPRedirectHandler):
+    """Do not follow the redirects of a callback (a redirect would bypass the check of the host)."""
+
+    def redirect_request(self, request, fp, code, message, headers, url):
+        return None
+
+
+class JobQueue:
+    """Background analysis jobs run by a bounded thread pool.
+
+    A job is a function called in a worker thread, its result (a JSON-serializable object) is kept for ttl (seconds).
+    No more than size jobs are queued or running, a new job is rejected by QueueFull until a place is free,
+    so a burst of uploads is accepted fast and analyzed at the rate of the workers.
+    The jobs are kept in the process memory. If path is set, they are also saved to an SQLite database,
+    so a job can be polled from any process (WSGI worker) on the server.
+    A callback URL (http or https) gets the job as JSON (POST) when the job is finished. The callback host must be
+    in callback_hosts or, if callback_hosts is empty, resolve to the public addresses only, so a callback cannot
+    reach the server itself or the local network (the loopback, private, link-local and reserved addresses).
+    """
+
+    def __init__(self, workers=2, size=64, path=None, ttl=60 * 60, callback_hosts=()):
+        self.lock = Lock()
+        self.jobs = {}
+        self.executor = None
+        self.opener = build_opener(NoRedirect)
+        self.configure(workers, size, path, ttl, callback_hosts)
+
+    def configure(self, workers, size=64, path=None, ttl=60 * 60, callback_hosts=()):
+        """Set the number of threads, the queue size, the database path (None - memory only), the ttl
+        and the hosts allowed for the callbacks (empty - any host with public addresses).
+        """
+
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False)
+            self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='dc_jobs')
+            self.size = size
+            self.path = path
+            self.ttl = ttl
+            self.callback_hosts = {str.lower(host) for host in callback_hosts}
+
+        if path is not None:
+            with self.connect() as connection:
+                connection.execute('PRAGMA journal_mode=WAL')
+                connection.execute('CREATE TABLE IF NOT EXISTS jobs (id TEXT PRIMARY KEY, updated REAL, job TEXT)')
+
+    @contextmanager
+    def connect(self):
+        """Open the database for a transaction, a connection is not shared between threads."""
+
+        connection = sqlite3.connect(self.path, timeout=5)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def submit(self, function, callback=None):
+        """Queue the function and return the job id. Raise QueueFull if the queue is full
+        or ValueError if the callback is not an allowed http(s) URL (see check_callback()).
+        """
+
+        if callback is not None:
+            self.check_callback(callback)
+
+        job_id = uuid4().hex
+        with self.lock:
+            self.expire()
+            active = sum(job['status'] in ('queued', 'running') for job in self.jobs.values())
+            if active >= self.size:
+                raise QueueFull(f'{active} jobs are queued or running')
+            self.jobs[job_id] = {'id': job_id, 'status': 'queued', 'created': time(), 'result': None,
+                                 'callback': callback}
+        self.save(job_id)
+
+        self.executor.submit(self.run, job_id, function)
+        logger.info(f'Job {job_id} queued ({active + 1} jobs are queued or running)')
+        return job_id
+
+    def run(self, job_id, function):
+        """Run the job in a worker thread."""
+
+        self.update(job_id, status='running')
+        time_start = time()
+        try:
+            self.update(job_id, status='finished', result=function())
+        except Exception:
+            logger.exception(f'Job {job_id} failed')
+            self.update(job_id, status='failed')
+        logger.info(f'Job {job_id} is done, Elapsed Time: {time() - time_start}')
+
+        job = self.get(job_id)
+        if job is not None and job['callback'] is not None:
+            self.notify(job)
+
+    def update(self, job_id, **fields):
+        """Change the fields of the job."""
+
+        with self.lock:
+            self.jobs[job_id].update(fields)
+        self.save(job_id)
+
+    def get(self, job_id):
+        """Return the job (a dict: id, status, created, result, callback) or None if it is unknown or expired."""
+
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is not None:
+                return dict(job)
+
+        if self.path is None:
+            return None
+
+        try:
+            with self.connect() as connection:
+                row = connection.execute('SELECT job FROM jobs WHERE id = ? AND updated > ?',
+                                         (job_id, time() - self.ttl)).fetchone()
+        except sqlite3.Error as error:
+            logger.warning(f'Jobs: the database cannot be read ({error})')
+            return None
+        return None if row is None else json.loads(row[0])
+
+    def save(self, job_id):
+        """Save the job to the database."""
+
+        if self.path is None:
+            return
+
+        with self.lock:
+            job = json.dumps(self.jobs[job_id])
+        try:
+            with self.connect() as connection:
+                connection.execute('INSERT OR REPLACE INTO jobs VALUES (?, ?, ?)', (job_id, time(), job))
+                connection.execute('DELETE FROM jobs WHERE updated < ?', (time() - self.ttl,))
+        except sqlite3.Error as error:
+            logger.warning(f'Jobs: the database cannot be written ({error})')
+
+    def expire(self):
+        """Drop the finished jobs older than ttl (the lock must be held)."""
+
+        expired = time() - self.ttl
+        for job_id in [job_id for job_id, job in self.jobs.items()
+                       if job['status'] in ('finished', 'failed') and job['created'] < expired]:
+            del self.jobs[job_id]
+
+    def check_callback(self, callback):
+        """Raise ValueError if the callback is not an http(s) URL, its host is not in the allowed hosts
+        or (no allowed hosts are set) the host has an address which is not public.
+        """
+
+        url = urlparse(callback)
+        if url.scheme not in ('http', 'https') or not url.hostname:
+            raise ValueError(f'The callback must be an http(s) URL: {callback}')
+
+        host = url.hostname
+        if self.callback_hosts:
+            if host not in self.callback_hosts:
+                raise ValueError(f'The callback host is not allowed: {host}')
+            return
+
+        try:
+            addresses = {info[4][0] for info in socket.getaddrinfo(host, url.port, proto=socket.IPPROTO_TCP)}
+        except (OSError, UnicodeError) as error:
+            raise ValueError(f'The callback host cannot be resolved: {host}') from error
+        for address in addresses:
+            # The scope of an IPv6 address ("fe80::1%eth0") is dropped
+            address = ipaddress.ip_address(address.partition('%')[0])
+            if getattr(address, 'ipv4_mapped', None) is not None:
+                address = address.ipv4_mapped
+            if not address.is_global or address.is_multicast:
+                raise ValueError(f'The callback host is not allowed: {host} ({address} is not a public address)')
+
+    def notify(self, job):
+        """Send the job to its callback URL."""
+
+        # The host is checked again, its addresses may have been changed since the job was submitted
+        try:
+            self.check_callback(job['callback'])
+        except ValueError as error:
+            logger.warning(f'Job {job["id"]}: callback {job["callback"]} was not sent ({error})')
+            return
+
+        data = json.dumps({key: job[key] for key in ('id', 'status', 'result')}).encode('utf-8')
+        request = Request(job['callback'], data=data, headers={'Content-Type': 'application/json'}, method='POST')
+        try:
+            with self.opener.open(request, timeout=5) as response:
+                logger.info(f'Job {job["id"]}: callback {job["callback"]} answered {response.status}')
+        except Exception:
+            logger.exception(f'Job {job["id"]}: callback {job["callback"]} failed')
+
+
+jobs = JobQueue()
+
+logger = logging.getLogger('logger.dc_jobs')
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from multiprocessing import get_context, parent_process
+import queue
+
+
+FORMAT = '%(asctime)s - %(levelname)s - %(pathname)s - %(message)s'
+DATE_FORMAT = '%d-%b-%y %H:%M:%S'
+
+
+class LogWriter:
+    """The handlers of the "logger" logger (a rotating file and the console) run by a background thread.
+
+    The threads of the requests only put the records into a queue, the records are formatted and written
+    by the listener thread, so a slow disk does not hold a request and the threads do not wait for the file lock.
+    The worker processes of the analysis pool send their records to the process queue (see log_to_queue()),
+    they are written by the same handlers. The levels are numbers or names ('INFO').
+    """
+
+    def __init__(self):
+        self.listeners = []
+        self.queue = None
+        self.level = logging.DEBUG
+
+    def configure(self, path='parser.log', level=logging.DEBUG, console_level=logging.DEBUG,
+                  max_bytes=1024 * 1024 * 10, backups=5):
+        """Replace the handlers of the "logger" logger by a queue, start the listener writing to the file
+        (rotated at max_bytes, backups files are kept) and to the console.
+        """
+
+        # A worker process imports the main module again, its records are sent to the main process
+        if parent_process() is not None:
+            return
+
+        self.stop()
+        level, console_level = (logging.getLevelName(value) if isinstance(value, str) else value
+                                for value in (level, console_level))
+
+        formatter = logging.Formatter(fmt=FORMAT, datefmt=DATE_FORMAT)
+        file_handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding='utf-8')
+        file_handler.setLevel(level)
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(console_level)
+        for handler in (file_handler, console_handler):
+            handler.setFormatter(formatter)
+
+        local_queue = queue.SimpleQueue()
+        self.queue = get_context('spawn').Queue()
+        self.listeners = [QueueListener(records, file_handler, console_handler, respect_handler_level=True)
+                          for records in (local_queue, self.queue)]
+        for listener in self.listeners:
+            listener.start()
+
+        logger = logging.getLogger('logger')
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+        logger.addHandler(QueueHandler(local_queue))
+        # The debug messages are not formatted if no handler writes them
+        self.level = min(level, console_level)
+        logger.setLevel(self.level)
+
+    def stop(self):
+        """Write the queued records and stop the listeners."""
+
+        for listener in self.listeners:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        self.listeners = []
+
+
+def log_to_queue(records, level=logging.DEBUG):
+    """Send the records of the "logger" logger of a worker process to the queue of the main process."""
+
+    logger = logging.getLogger('logger')
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(records))
+    logger.setLevel(level)
+
+
+writer = LogWriter()
+atexit.register(writer.stop)
+
+logger = logging.getLogger('logger.dc_logging')
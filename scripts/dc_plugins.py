@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+from importlib import import_module, reload
+import logging
+from pathlib import Path
+from threading import Lock
+from time import time
+
+
+class PluginRegistry:
+    """Parsers, tests and reports found once when the application starts.
+
+    parsers - a WANFleX hardware code: a parser module (scripts/parsers/parser_*.py declaring HARDWARE codes)
+    tests - a family (lower case): a list of test modules (scripts/tests/<family>/*.py, sorted by name)
+    reports - a family (lower case): {a kind (jira, web, cli): a report function} (scripts/reports/report_*.py)
+
+    A request looks a plugin up in the dicts, the file system is not scanned again until load() is called.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.parsers = {}
+        self.tests = {}
+        self.reports = {}
+        self.loaded = False
+
+    def load(self, reload_modules=False):
+        """Find and import all plugins. The imported modules are reloaded if reload_modules is True."""
+
+        time_start = time()
+        root = Path(__file__).parent
+
+        def load_module(name):
+            module = import_module(name)
+            return reload(module) if reload_modules else module
+
+        parsers = {}
+        for path in sorted((root / 'parsers').glob('parser_*.py')):
+            module = load_module(f'scripts.parsers.{path.stem}')
+            # The parsers without the hardware codes are not implemented yet
+            for hardware in getattr(module, 'HARDWARE', ()):
+                parsers[hardware] = module
+
+        tests = {}
+        for folder in sorted(path for path in (root / 'tests').iterdir() if (path / '__init__.py').exists()):
+            # Use __ (double underscore) before file name if you need to hide a test from the importer
+            modules = [load_module(f'scripts.tests.{folder.name}.{path.stem}')
+                       for path in sorted(folder.glob('[!__]*.py'))]
+            for module in modules:
+                family = str.lower(getattr(module, 'FAMILY', folder.name))
+                tests.setdefault(family, []).append(module)
+
+        reports = {}
+        for path in sorted((root / 'reports').glob('report_*.py')):
+            module = load_module(f'scripts.reports.{path.stem}')
+            if not hasattr(module, 'KINDS'):
+                continue
+            family = path.stem.replace('report_', '', 1)
+            reports[family] = {kind: getattr(module, kind) for kind in module.KINDS}
+
+        with self.lock:
+            self.parsers, self.tests, self.reports = parsers, tests, reports
+            self.loaded = True
+
+        logger.info(f'Plugins loaded: {len(set(parsers.values()))} parsers, '
+                    f'{sum(len(modules) for modules in tests.values())} tests, {len(reports)} reports, '
+                    f'Elapsed Time: {time() - time_start}')
+
+    def ensure_loaded(self):
+        """Load the plugins if they have not been loaded yet (e.g. the CLI does not call load())."""
+
+        if not self.loaded:
+            self.load()
+
+    def parser(self, hardware):
+        """Return the parser module of the hardware code or None if the hardware is not supported."""
+
+        self.ensure_loaded()
+        return self.parsers.get(hardware)
+
+    def tests_of(self, family):
+        """Return the test modules of the family."""
+
+        self.ensure_loaded()
+        return self.tests.get(str.lower(family), [])
+
+    def report(self, family, kind):
+        """Return the report function of the family for the kind of the source or None."""
+
+        self.ensure_loaded()
+        return self.reports.get(str.lower(family), {}).get(kind)
+
+
+plugins = PluginRegistry()
+
+logger = logging.getLogger('logger.dc_plugins')
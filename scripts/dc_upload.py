@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+import codecs
+import io
+import logging
+
+from scripts.dc_compression import CompressionError, Decompressor, detect_compression, MAGIC_SIZE
+from scripts.dc_plugins import plugins
+from scripts.parsers.dc_lines import line_offsets
+from scripts.parsers.dc_parser import detect, pattern_signature
+
+
+# The longest signature ("# OCTOPUS-PTP WANFleX H18") may be split between two chunks
+SIGNATURE_OVERLAP = 32
+
+
+class CardStream(io.RawIOBase):
+    """A writable stream receiving an uploaded diagnostic card (a multipart file), chunk by chunk.
+
+    The chunks are decoded (UTF-8) and split into lines as they arrive, so the card is ready to be parsed
+    when the upload ends: the text is joined once and the line offsets (see DiagnosticLines) are known already.
+    The header is checked as soon as the WANFleX signature is received: a card of an unsupported family
+    (e.g. InfiMUX) or a card which is not UTF-8 is rejected, the rest of it is dropped unread.
+    A compressed card (gzip, xz, zstd) is decompressed on the way, a card larger than the limit (bytes,
+    after decompression) is rejected as well.
+    """
+
+    def __init__(self, limit=None):
+        self.limit = limit
+        self.magic = b''
+        self.decompressor = None
+        self.finished = False
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.parts = []
+        self.length = 0
+        # A character takes a byte at least, the limit (bytes) bounds the offsets
+        self.offsets = line_offsets(limit)
+        self.head = ''
+        self.detected = False
+        self.rejected = None
+        self.buffer = None
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if self.rejected is not None:
+            return len(data)
+
+        # The format is found by the first bytes of the card
+        if self.decompressor is None:
+            self.magic += data
+            if len(self.magic) < MAGIC_SIZE:
+                return len(data)
+            self.start()
+        else:
+            self.receive(data)
+        return len(data)
+
+    def start(self):
+        """Choose the decompressor by the first bytes of the card and pass them on."""
+
+        data, self.magic = self.magic, b''
+        try:
+            self.decompressor = Decompressor(detect_compression(data), self.limit)
+        except CompressionError as error:
+            self.decompressor = Decompressor(None)
+            self.reject(str(error))
+            return
+        self.receive(data)
+
+    def receive(self, data):
+        """Decompress the received data and decode the card."""
+
+        try:
+            for chunk in self.decompressor.decompress(data):
+                self.decode(chunk)
+        except CompressionError as error:
+            self.reject(str(error))
+
+    def decode(self, data):
+        """Decode the bytes of the card and find the line offsets."""
+
+        if self.rejected is not None:
+            return
+
+        try:
+            text = self.decoder.decode(data)
+        except UnicodeDecodeError as error:
+            self.reject(f'Wrong file format or encoding ({error})')
+            return
+
+        position = text.find('\n')
+        while position != -1:
+            self.offsets.append(self.length + position + 1)
+            position = text.find('\n', position + 1)
+        self.parts.append(text)
+        self.length += len(text)
+
+        if not self.detected:
+            self.inspect(text)
+
+    def inspect(self, text):
+        """Look for the signature in the received text and reject the card if its family is not supported."""
+
+        self.head = self.head[-SIGNATURE_OVERLAP:] + text
+        if pattern_signature.search(self.head) is None:
+            return
+
+        self.detected = True
+        try:
+            family, hardware, card = detect(self.head)
+        except ValueError:
+            # An unknown device is handled (and saved for the developers) by the parser
+            return
+        if card is None or plugins.parser(hardware) is None:
+            self.reject(f'{family} is not supported')
+
+    def reject(self, reason):
+        """Stop receiving the card."""
+
+        logger.info(f'The uploaded card was rejected: {reason}')
+        self.rejected = reason
+        self.parts = []
+        self.offsets = line_offsets(self.limit)
+
+    def text(self):
+        """Return the text of the received card (None if the card was rejected)."""
+
+        if not self.finished:
+            self.finish()
+        if self.rejected is not None:
+            return None
+
+        if len(self.parts) > 1:
+            self.parts = [''.join(self.parts)]
+        return self.parts[0] if self.parts else ''
+
+    def finish(self):
+        """Pass the rest of the card on when it is received."""
+
+        self.finished = True
+        if self.decompressor is None:
+            self.start()
+        if self.rejected is not None:
+            return
+
+        try:
+            self.decode(self.decompressor.finish())
+            # A card truncated in the middle of a character
+            self.decoder.decode(b'', final=True)
+        except CompressionError as error:
+            self.reject(str(error))
+        except UnicodeDecodeError as error:
+            self.reject(f'Wrong file format or encoding ({error})')
+
+    def seekable(self):
+        return True
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        # The multipart parser rewinds the file when it is received, the card is taken by text()
+        if self.buffer is None:
+            return 0
+        return self.buffer.seek(offset, whence)
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        """Read the card as bytes (for the code reading an uploaded file), a rejected card is empty."""
+
+        if self.buffer is None:
+            text = self.text()
+            self.buffer = io.BytesIO(b'' if text is None else text.encode('utf-8'))
+        return self.buffer.read(size)
+
+
+logger = logging.getLogger('logger.dc_upload')
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+from importlib import import_module
+import logging
+from multiprocessing import parent_process
+from threading import Event, Lock, Thread
+from time import time
+
+from scripts.dc_handler import pool, rehearse
+from scripts.parsers.dc_parser import warm_up
+
+
+class WarmUp:
+    """The warm-up of a worker before it is ready to serve the requests.
+
+    The steps: the plugins are imported and their patterns are compiled, the schedule (pdfplumber) is read once,
+    a sample card of each family is run through the whole pipeline (the parser, the tests, the firmware catalog
+    and the report) and the analysis processes are started (they run the same warm-up in init_worker()).
+    A failed step is logged and recorded in the status, it does not stop the warm-up.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.ready = Event()
+        self.started = None
+        self.steps = {}
+
+    def start(self, cards=()):
+        """Run the warm-up in a background thread (the worker answers /ready with 503 until it is done)."""
+
+        # A worker process imports the main module again, it is warmed up by init_worker()
+        if parent_process() is not None:
+            return
+        Thread(target=self.run, args=(cards,), name='dc_warmup', daemon=True).start()
+
+    def wait(self, timeout=None):
+        """Wait for the warm-up, return True if it is done."""
+
+        return self.ready.wait(timeout)
+
+    def run(self, cards=()):
+        """Run the steps of the warm-up, the cards are paths to the sample cards."""
+
+        self.started = time()
+        self.step('plugins', warm_up)
+        self.step('schedule', lambda: import_module('scripts.shifts').duty())
+        for card in cards:
+            self.step(f'card {card.name}', lambda: rehearse(card))
+        self.step('pool', pool.wait)
+        self.ready.set()
+        logger.info(f'Warm-up is done, Elapsed Time: {time() - self.started}')
+
+    def step(self, name, function):
+        """Run a step and record its time (or its error)."""
+
+        time_start = time()
+        try:
+            result = function()
+        except Exception as error:
+            logger.exception(f'Warm-up: the step "{name}" failed')
+            status = {'error': str(error) or type(error).__name__}
+        else:
+            status = {'seconds': round(time() - time_start, 3)}
+            if isinstance(result, str):
+                status['result'] = result
+        with self.lock:
+            self.steps[name] = status
+
+    def status(self):
+        """Return the state of the warm-up (a JSON-serializable dict)."""
+
+        with self.lock:
+            steps = dict(self.steps)
+        elapsed = None if self.started is None else round(time() - self.started, 3)
+        return {'ready': self.ready.is_set(), 'elapsed': elapsed, 'steps': steps}
+
+
+warmup = WarmUp()
+
+logger = logging.getLogger('logger.dc_warmup')
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+import logging
+from collections import namedtuple
+
+
+Field = namedtuple('Field', ['trigger', 'pattern', 'target', 'convert'], defaults=[None])
+Field.__doc__ = """A field of a diagnostic card extracted from a single line.
+
+trigger - a literal (str) the line must contain to be checked by the pattern (a part of the pattern)
+pattern - a compiled pattern
+target - a path (tuple) of keys in the record, an int key is replaced by the group of the match
+convert - a function (match, record) returning the value, the first group is used by default;
+          None returned by the function means the field is not filled in
+"""
+
+
+def group(index=1):
+    """Return a converter taking the group of the match."""
+
+    return lambda match, record: match.group(index)
+
+
+def constant(value):
+    """Return a converter taking the constant value (e.g. "Enabled" if the line is found)."""
+
+    return lambda match, record: value
+
+
+default = group(1)
+
+
+class FieldSet:
+    """A dispatcher of the fields of a section.
+
+    Each line is checked by the triggers first (substring search), only the fields of the found triggers are
+    checked by their patterns. A pattern shared by several fields is searched once per line.
+    The fields are filled in in order of declaration, so the last matched line wins as it does in the "if" ladder.
+    """
+
+    def __init__(self, *fields):
+        self.fields = fields
+        self.triggers = {}
+        for position, field in enumerate(fields):
+            self.triggers.setdefault(field.trigger, []).append(position)
+
+    def extract(self, lines, record):
+        """Fill the record (dict) in from the lines and return it."""
+
+        for line in lines:
+            candidates = [position for trigger, positions in self.triggers.items() if trigger in line
+                          for position in positions]
+            if not candidates:
+                continue
+
+            candidates.sort()
+            matches = {}
+            for position in candidates:
+                field = self.fields[position]
+                if field.pattern not in matches:
+                    matches[field.pattern] = field.pattern.search(line)
+                match = matches[field.pattern]
+                if match is None:
+                    continue
+
+                convert = field.convert or default
+                value = convert(match, record)
+                if value is None:
+                    continue
+
+                keys = [match.group(key) if isinstance(key, int) else key for key in field.target]
+                node = record
+                for key in keys[:-1]:
+                    node = node[key]
+                node[keys[-1]] = value
+
+        return record
+
+
+logger = logging.getLogger('logger.dc_fields')
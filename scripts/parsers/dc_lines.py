@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+from array import array
+from collections.abc import Sequence
+import logging
+
+
+# The line offsets take 4 bytes each, a text of 4 G characters or more needs 8 bytes
+OFFSET_TYPE = 'I'
+OFFSET_MAX = 2 ** (8 * array(OFFSET_TYPE).itemsize) - 1
+
+
+def line_offsets(size=None):
+    """Return an array (with the first offset) for the line offsets of a text of the size (None - unknown)."""
+
+    return array(OFFSET_TYPE if size is not None and size <= OFFSET_MAX else 'Q', [0])
+
+
+class DiagnosticLines(Sequence):
+    """Lines of a diagnostic card as a view of the card text.
+
+    Only the offsets of the lines are kept (4 bytes per line, see line_offsets()), a line is cut from the text
+    when it is requested.
+    The lines are the same as list(map(lambda x: x + '\\n', dc_string.split('\\n'))) gives:
+    each line ends with "\\n", the last line is the rest of the text after the last "\\n" (may be empty).
+    """
+
+    def __init__(self, dc_string, offsets=None):
+        self.dc_string = dc_string
+        # The offsets may be found already while the card was received (see CardStream)
+        if offsets is not None:
+            self.offsets = offsets
+            return
+
+        self.offsets = line_offsets(len(dc_string))
+        position = dc_string.find('\n')
+        while position != -1:
+            self.offsets.append(position + 1)
+            position = dc_string.find('\n', position + 1)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def line(self, index):
+        """Return the line by the index (a non-negative int)."""
+
+        if index + 1 < len(self.offsets):
+            return self.dc_string[self.offsets[index]:self.offsets[index + 1]]
+        return self.dc_string[self.offsets[index]:] + '\n'
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.line(position) for position in range(*index.indices(len(self.offsets)))]
+
+        if index < 0:
+            index += len(self.offsets)
+        if not 0 <= index < len(self.offsets):
+            raise IndexError('line index out of range')
+        return self.line(index)
+
+    def __iter__(self):
+        for index in range(len(self.offsets)):
+            yield self.line(index)
+
+
+logger = logging.getLogger('logger.dc_lines')
@@ -1,14 +1,26 @@
 # -*- coding: utf-8 -*-
 
 from abc import ABC
+from functools import cached_property
 from importlib import import_module
 import logging
 from pathlib import Path
-from re import search
+import re
+from threading import RLock
+from time import time
+
+from scripts.dc_plugins import plugins
+from scripts.parsers.dc_patterns import registry
+from scripts.parsers.dc_sections import SectionIndex
 
 
 class RawDiagnosticCard(ABC):
-    """A diagnostic card."""
+    """A diagnostic card.
+
+    The general info is parsed when the card is created, the sections (settings, radio_status, etc.)
+    are parsed by the family parser when they are requested first time and cached in the instance.
+    The tests of a card run in threads: a section requested by several threads at once is parsed once.
+    """
 
     def __init__(self, model, subfamily, serial_number, firmware, uptime, reboot_reason, dc_list, dc_string):
         self.model = model
@@ -19,6 +31,39 @@ class RawDiagnosticCard(ABC):
         self.reboot_reason = reboot_reason
         self.dc_list = dc_list
         self.dc_string = dc_string
+        # A parser may request another section (e.g. the radio status depends on the settings)
+        self.lock = RLock()
+        self.parsed = {}
+
+    @cached_property
+    def parser(self):
+        """The parser module of the family."""
+
+        return import_module(f'.parser_{str.lower(self.family)}', 'scripts.parsers')
+
+    @cached_property
+    def sections(self):
+        """The section index of the card (the card is scanned for the section markers once)."""
+
+        with self.lock:
+            return SectionIndex(self.dc_list, self.parser.SECTIONS)
+
+    def parse_section(self, section):
+        """Parse the section by parse_<section>(card) of the family parser (once, the other threads wait for it)."""
+
+        with self.lock:
+            if section not in self.parsed:
+                time_start = time()
+                self.parsed[section] = getattr(self.parser, f'parse_{section}')(self)
+                logger.debug('Section "%s" parsed, Elapsed Time: %s', section, time() - time_start)
+            return self.parsed[section]
+
+    def parse_all(self):
+        """Parse all sections of the card which have not been parsed yet."""
+
+        for name, attribute in vars(type(self)).items():
+            if isinstance(attribute, cached_property):
+                getattr(self, name)
 
 
 class R5000Card(RawDiagnosticCard):
@@ -26,14 +71,25 @@ class R5000Card(RawDiagnosticCard):
 
     family = 'R5000'
 
-    def __init__(self, model, subfamily, serial_number, firmware, uptime, reboot_reason, dc_list, dc_string, settings,
-                 radio_status, ethernet_status, switch_status, qos_status):
-        super().__init__(model, subfamily, serial_number, firmware, uptime, reboot_reason, dc_list, dc_string)
-        self.settings = settings
-        self.radio_status = radio_status
-        self.ethernet_status = ethernet_status
-        self.switch_status = switch_status
-        self.qos_status = qos_status
+    @cached_property
+    def settings(self):
+        return self.parse_section('settings')
+
+    @cached_property
+    def radio_status(self):
+        return self.parse_section('radio_status')
+
+    @cached_property
+    def ethernet_status(self):
+        return self.parse_section('ethernet_status')
+
+    @cached_property
+    def switch_status(self):
+        return self.parse_section('switch_status')
+
+    @cached_property
+    def qos_status(self):
+        return self.parse_section('qos_status')
 
 
 class XGCard(RawDiagnosticCard):
@@ -41,13 +97,21 @@ class XGCard(RawDiagnosticCard):
 
     family = 'XG'
 
-    def __init__(self, model, subfamily, serial_number, firmware, uptime, reboot_reason, dc_list, dc_string, settings,
-                 radio_status, ethernet_status, panic):
-        super().__init__(model, subfamily, serial_number, firmware, uptime, reboot_reason, dc_list, dc_string)
-        self.settings = settings
-        self.radio_status = radio_status
-        self.ethernet_status = ethernet_status
-        self.panic = panic
+    @cached_property
+    def settings(self):
+        return self.parse_section('settings')
+
+    @cached_property
+    def radio_status(self):
+        return self.parse_section('radio_status')
+
+    @cached_property
+    def ethernet_status(self):
+        return self.parse_section('ethernet_status')
+
+    @cached_property
+    def panic(self):
+        return self.parse_section('panic')
 
 
 class Q5Card(RawDiagnosticCard):
@@ -55,12 +119,71 @@ class Q5Card(RawDiagnosticCard):
 
     family = 'Q5'
 
-    def __init__(self, model, subfamily, serial_number, firmware, uptime, reboot_reason, dc_list, dc_string, settings,
-                 radio_status, ethernet_status):
-        super().__init__(model, subfamily, serial_number, firmware, uptime, reboot_reason, dc_list, dc_string)
-        self.settings = settings
-        self.radio_status = radio_status
-        self.ethernet_status = ethernet_status
+    @cached_property
+    def settings(self):
+        return self.parse_section('settings')
+
+    @cached_property
+    def radio_status(self):
+        return self.parse_section('radio_status')
+
+    @cached_property
+    def ethernet_status(self):
+        return self.parse_section('ethernet_status')
+
+
+# The header contains the "# <platform> WANFleX H<code>" line, usually within the first 20 lines
+HEADER_SIZE = 2048
+
+pattern_signature = re.compile(r'#\s(R5000|XG|OCTOPUS-PTP)\sWANFleX\sH(\d{2})')
+
+# WANFleX hardware code: (platform, family, class), the parser is found in the plugin registry by the code
+HARDWARE = {
+    '01': ('R5000', 'R5000', R5000Card),
+    '02': ('R5000', 'R5000', R5000Card),
+    '03': ('R5000', 'R5000', R5000Card),
+    '04': ('R5000', 'R5000', R5000Card),
+    '05': ('R5000', 'R5000', R5000Card),
+    '06': ('R5000', 'R5000', R5000Card),
+    '07': ('R5000', 'R5000', R5000Card),
+    '08': ('R5000', 'R5000', R5000Card),
+    '11': ('R5000', 'R5000', R5000Card),
+    '09': ('R5000', 'InfiMUX', None),
+    '16': ('R5000', 'E5000', None),
+    '22': ('R5000', 'E5000', None),
+    '12': ('XG', 'XG', XGCard),
+    '18': ('OCTOPUS-PTP', 'Quanta 5', Q5Card),
+    '21': ('OCTOPUS-PTP', 'Quanta 70', None),
+    '19': ('OCTOPUS-PTP', 'Axion 28', None),
+    '20': ('OCTOPUS-PTP', 'Axion 28', None),
+}
+
+
+def detect(dc_string):
+    """Find the family of the device by the WANFleX signature.
+    Only the header is searched, the whole text is searched if the header does not contain the signature.
+    Return a tuple (family, hardware code, class) or raise ValueError if the device is unknown.
+    """
+
+    pattern = pattern_signature.search(dc_string, 0, HEADER_SIZE) or pattern_signature.search(dc_string)
+    if pattern is None:
+        raise ValueError('WANFleX signature not found')
+
+    platform, hardware = pattern.groups()
+    if hardware not in HARDWARE or HARDWARE[hardware][0] != platform:
+        raise ValueError(f'Unknown hardware: {platform} H{hardware}')
+
+    _, family, card = HARDWARE[hardware]
+    return family, hardware, card
+
+
+def warm_up():
+    """Load the plugins (parsers, tests and reports) to compile the patterns before the first request."""
+
+    plugins.load()
+
+    logger.info(f'{len(registry)} parsers ({sum(len(vars(patterns)) for patterns in registry.values())} patterns) '
+                f'were compiled')
 
 
 def get_result(dc_string, dc_list, dc_name, dc_source):
@@ -68,23 +191,27 @@ def get_result(dc_string, dc_list, dc_name, dc_source):
     Return a class with filled arguments or an error.
     """
 
-    def import_parser(dc_string, dc_list, dc_model):
-        """Dynamic modules (parsers) import. Import only modules starts from "parser_*"
+    def import_parser(dc_string, dc_list, module):
+        """Run the parser found in the plugin registry. Parsers are modules "parser_*" declaring
+        HARDWARE (the hardware codes of the module) and SECTIONS (the Section markers of the card).
 
                 A module must follow the next template:
+                HARDWARE = ('11',)
+                SECTIONS = {'settings': Section(start, end, offset_start, offset_end), ...}
+
                 def parse(dc_string, dc_list):
-                    #parse settings
-                    #parse radio
-                    #parse ethernet
-                    #etc...
-                    return tuple of objects
+                    #parse the general info only
+                    return (model, subfamily, serial_number, firmware, uptime, reboot_reason, dc_list, dc_string)
+
+                def parse_settings(card):
+                    #parse the section cut by card.sections.cut('settings')
+                    return settings
+
+        The sections are parsed lazily: parse_<section>(card) is called when the attribute of the card class
+        (see RawDiagnosticCard) is requested first time.
         """
 
-        try:
-            module = import_module(f'.parser_{dc_model}', 'scripts.parsers')
-            logger.info(f'{module} was imported to parse the diagnostic card')
-        except:
-            logger.critical(f'Parsing script cannot be imported')
+        logger.info(f'{module} was chosen to parse the diagnostic card')
 
         return module.parse(dc_string, dc_list)
 
@@ -116,46 +243,16 @@ def get_result(dc_string, dc_list, dc_name, dc_source):
 
 
     try:
-        #R5000 series
-        if search(r'#\sR5000\sWANFleX\sH(01|02|03|04|05|06|07|08|11)', dc_string) is not None:
-            logger.debug('This is R5000')
-            dc_parsed = import_parser(dc_string, dc_list, 'r5000')
-            device = R5000Card(*dc_parsed)
-
-        #InfiMux (not supported)
-        elif search(r'#\sR5000\sWANFleX\sH09', dc_string) is not None:
-            logger.debug('This is InfiMUX')
-            pass
-
-        #E5000 series (not supported)
-        elif search(r'#\sR5000\sWANFleX\sH(16|22)', dc_string) is not None:
-            logger.debug('This is E5000')
-            pass
-
-        #XG series
-        elif search(r'#\sXG\sWANFleX\sH12', dc_string) is not None:
-            logger.debug('This is XG')
-            dc_parsed = import_parser(dc_string, dc_list, 'xg')
-            device = XGCard(*dc_parsed)
-
-        #Quanta 5 series
-        elif search(r'#\sOCTOPUS-PTP\sWANFleX\sH18', dc_string) is not None:
-            logger.debug('This is Quanta 5')
-            dc_parsed = import_parser(dc_string, dc_list, 'q5')
-            device = Q5Card(*dc_parsed)
-
-        #Quanta 70 series (not supported)
-        elif search(r'#\sOCTOPUS-PTP\sWANFleX\sH21', dc_string) is not None:
-            logger.debug('This is Quanta 70')
-            pass
-
-        #Axion 28 series (not supported)
-        elif search(r'#\sOCTOPUS-PTP\sWANFleX\sH(19|20)', dc_string) is not None:
-            logger.debug('This is Axion 28')
-            pass
-
-        else:
-            raise
+        family, hardware, card = detect(dc_string)
+        logger.debug('This is %s (H%s)', family, hardware)
+
+        #InfiMUX, E5000, Quanta 70 and Axion 28 series are not supported
+        parser = plugins.parser(hardware)
+        if parser is None or card is None:
+            raise ValueError(f'{family} is not supported')
+
+        dc_parsed = import_parser(dc_string, dc_list, parser)
+        device = card(*dc_parsed)
 
         return device
 
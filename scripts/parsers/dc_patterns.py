@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import re
+from types import SimpleNamespace
+
+
+# All compiled patterns of the parsers (a parser name: a namespace with the patterns)
+registry = {}
+
+
+def compile_patterns(name, **patterns):
+    """Compile the patterns of a parser and save them in the registry.
+    The function is called once, when a parser is imported, so the patterns are shared by all calls of the parser.
+    Return a namespace with the compiled patterns (e.g. patterns.g_sn.search(text)).
+    """
+
+    compiled = SimpleNamespace(**{key: re.compile(pattern) for key, pattern in patterns.items()})
+    registry[name] = compiled
+    logger.debug('%s patterns of the "%s" parser were compiled', len(patterns), name)
+    return compiled
+
+
+logger = logging.getLogger('logger.dc_patterns')
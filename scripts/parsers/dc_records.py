@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+from collections.abc import MutableMapping
+import logging
+import re
+
+
+class Record(MutableMapping):
+    """A fixed set of fields kept in slots.
+
+    A record is used as a dict by the field names (record['Level Rx']), so the tests and the reports work with it
+    the same way as with a dict template, but a new record costs neither a deepcopy nor a dict per instance.
+    The fields cannot be added or deleted.
+    """
+
+    __slots__ = ()
+
+    # A field name: a default value (immutable), __slots__ = slot_names(defaults) must be defined along
+    defaults = {}
+    # A field name: a slot name
+    slots = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.slots = dict(zip(cls.defaults, slot_names(cls.defaults)))
+
+    def __init__(self):
+        for key, slot in self.slots.items():
+            setattr(self, slot, self.defaults[key])
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self.slots[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, self.slots[key], value)
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __delitem__(self, key):
+        raise TypeError(f'The field "{key}" of {type(self).__name__} cannot be deleted')
+
+    def __iter__(self):
+        return iter(self.slots)
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __getstate__(self):
+        return dict(self.items())
+
+    def __setstate__(self, state):
+        for key, value in state.items():
+            self[key] = value
+
+
+def slot_names(defaults):
+    """Return the slot names of the fields (e.g. "Level Rx" - "level_rx") to define __slots__ of a record."""
+
+    return tuple(re.sub(r'\W+', '_', key.lower()) for key in defaults)
+
+
+logger = logging.getLogger('logger.dc_records')
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import re
+from bisect import bisect_left
+from collections import namedtuple
+
+
+Section = namedtuple('Section', ['start', 'end', 'offset_start', 'offset_end', 'parent'], defaults=[None])
+Section.__doc__ = """A section of a diagnostic card.
+
+start, end - patterns (str) of the first and the last lines of the section
+offset_start, offset_end - offsets (int) added to the line indexes of the patterns
+parent - a name of the section the patterns are looked for in (None means the whole card)
+"""
+
+
+class SectionIndex:
+    """An index of the section markers of a diagnostic card.
+
+    The card is scanned once: a combined pattern of all markers filters out the lines without markers,
+    the rest of the lines are checked by each marker and the line indexes are saved.
+    The section is cut from the saved indexes without scanning the card again.
+    The last occurrence of each marker is used, the same way as it was done by cut_text().
+    """
+
+    def __init__(self, dc_list, sections):
+        self.dc_list = dc_list
+        self.sections = sections
+
+        markers = []
+        for section in sections.values():
+            for pattern in (section.start, section.end):
+                if pattern not in markers:
+                    markers.append(pattern)
+        self.markers = {pattern: re.compile(pattern) for pattern in markers}
+        self.positions = {pattern: [] for pattern in markers}
+
+        pattern_any = re.compile('|'.join(f'(?:{pattern})' for pattern in markers))
+        for index, line in enumerate(dc_list):
+            if pattern_any.search(line):
+                for pattern, marker in self.markers.items():
+                    if marker.search(line):
+                        self.positions[pattern].append(index)
+
+        self.spans = {}
+
+    def find(self, pattern, span_start, span_end):
+        """Return the index of the last line matched the pattern in the span or None."""
+
+        positions = self.positions[pattern]
+        index = bisect_left(positions, span_end) - 1
+        if index >= 0 and positions[index] >= span_start:
+            return positions[index]
+
+    def span(self, name):
+        """Return the first and the last (not included) line indexes of the section."""
+
+        if name in self.spans:
+            return self.spans[name]
+
+        section = self.sections[name]
+        if section.parent is None:
+            span_start, span_end = 0, len(self.dc_list)
+        else:
+            span_start, span_end = self.span(section.parent)
+
+        line_start = self.find(section.start, span_start, span_end)
+        line_end = self.find(section.end, span_start, span_end)
+        if line_start is None or line_end is None:
+            logger.warning(f'Text has not been cut. Patterns: {section.start} - {section.end}')
+            span = (span_start, span_end)
+        else:
+            # Offsets are applied to the parent text the same way as the list slicing does it
+            text_start, text_end, _ = slice(line_start - span_start + section.offset_start,
+                                            line_end - span_start + section.offset_end).indices(span_end - span_start)
+            span = (span_start + text_start, span_start + max(text_start, text_end))
+
+        self.spans[name] = span
+        return span
+
+    def cut(self, name):
+        """Return the section text as a list of lines."""
+
+        span_start, span_end = self.span(name)
+        return self.dc_list[span_start:span_end]
+
+
+logger = logging.getLogger('logger.dc_sections')
@@ -1,10 +1,115 @@
 # -*- coding: utf-8 -*-
 
 import logging
-import re
 from copy import deepcopy
 from time import time
 
+from scripts.parsers.dc_fields import Field, FieldSet, constant, group
+from scripts.parsers.dc_patterns import compile_patterns
+from scripts.parsers.dc_sections import Section
+
+
+# WANFleX hardware codes parsed by the module ("# <platform> WANFleX H<code>" in the header)
+HARDWARE = ('18',)
+
+SECTIONS = {
+    'settings': Section(r'#System parameters', r'oct swmac_info', 0, 0),
+    'radio': Section(r'#Radio diagnostic', r'oct show calibration', 2, 0),
+    'ethernet': Section(r'#Interface statistic', r'Radio port statistics', 1, 12),
+}
+
+
+patterns = compile_patterns(
+    'q5',
+    # General info
+    g_fw=r'H\d{2}S\d{2}-OCTOPUS_PTPv[\d.]+',
+    g_model=r'([QV]5-[\dE]+)',
+    g_sn=r'SN:(\d+)',
+    g_uptime=r'Uptime: ([\d\w :]*)',
+    g_reboot_reason=r'Last reboot reason: ([\w ]*)',
+
+    # Settings
+    set_role=r'ptp_role (\w+)',
+    set_band=r'bw (\d+)',
+    set_freq_dl=r'freq_dl (\d+)',
+    set_freq_ul=r'freq_ul (\d+)',
+    set_frame=r'frame_length ([\.\d]+)',
+    set_gi=r'guard_interval ([auto\d\/]+)',
+    set_adlp=r'radio.auto_dl_ul_ratio (on)',
+    set_dlp=r'radio.dl_ul_ratio (\d+)',
+    set_pwr=r'tx_power ([\-\d]+)',
+    set_atpc=r'atpc (on)',
+    set_amc=r'amc_strategy (\w+)',
+    set_dl_mcs=r'dl_mcs (([\-\d]+)?(QPSK|QAM)-\d+\/\d+)',
+    set_ul_mcs=r'ul_mcs (([\-\d]+)?(QPSK|QAM)-\d+\/\d+)',
+    set_dfs=r'dfs (dfs_rd|on)',
+    set_harq=r'harq (on)',
+    set_ifc=r'ifc (ge0)',
+
+    # Radio status
+    rs_status=r'State\s+(\w+)',
+    rs_dist=r'Distance\s+(\d+ k?m)',
+    rs_pwr=r'([\-\.\d]+) \/ ([\-\.\d]+) dBm',
+    rs_freq=r'(\d+) MHz',
+    rs_mcs=r'(([\-\d]+)?(QPSK|QAM)-\d+\/\d+)',
+    rs_rssi=r'([\.\-\d]+)( \([\.\-\d]+\))? dBm',
+    rs_evm=r'([\.\-\d]+) dB',
+    rs_crosstalk=r'([\.\-\d]+) dB',
+    rs_arq=r'([\.\d]+) %',
+
+    # Ethernet status
+    es_link=r'Physical link is (\w+)(?:, (\d+) Mbps(?:\s+(\w+)-duplex(?:, (\w+))?)?)?',
+    es_crc=r'CRC errors\s+(\d+)',
+)
+
+# Fields of "conf show": Field(trigger, pattern, target path in settings, converter)
+SETTINGS_FIELDS = FieldSet(
+    Field('ptp_role ', patterns.set_role, ('Role',)),
+    Field('bw ', patterns.set_band, ('Bandwidth',)),
+    Field('freq_dl ', patterns.set_freq_dl, ('DL Frequency',)),
+    Field('freq_ul ', patterns.set_freq_ul, ('UL Frequency',)),
+    Field('frame_length ', patterns.set_frame, ('Frame size',)),
+    Field('guard_interval ', patterns.set_gi, ('Guard Interval',)),
+    Field('auto_dl_ul_ratio on', patterns.set_adlp, ('ADLP',), constant('Enabled')),
+    Field('dl_ul_ratio ', patterns.set_dlp, ('DL/UL Ratio',),
+          lambda match, record: f'{match.group(1)}/{100 - int(match.group(1))}'),
+    Field('tx_power ', patterns.set_pwr, ('Tx Power',)),
+    Field('atpc on', patterns.set_atpc, ('ATPC',), constant('Enabled')),
+    Field('amc_strategy ', patterns.set_amc, ('AMC Strategy',)),
+    Field('dl_mcs ', patterns.set_dl_mcs, ('Max DL MCS',)),
+    Field('ul_mcs ', patterns.set_ul_mcs, ('Max UL MCS',)),
+    Field('dfs ', patterns.set_dfs, ('DFS',), constant('Enabled')),
+    Field('harq on', patterns.set_harq, ('ARQ',), constant('Enabled')),
+    Field('ifc ge0', patterns.set_ifc, ('Interface Status', 1),
+          lambda match, record: 'up' if 'up' in match.string else None),
+)
+
+# Fields of "oct radio stat": (line prefix, pattern, field, group of the findall result or None, stream field)
+# The downlink values are followed by the uplink ones
+RADIO_FIELDS = (
+    ('| Frequency', patterns.rs_freq, 'Frequency', None, False),
+    ('| MCS', patterns.rs_mcs, 'MCS', 0, True),
+    ('| RSSI', patterns.rs_rssi, 'RSSI', 0, True),
+    ('| EVM', patterns.rs_evm, 'EVM', None, True),
+    ('| Crosstalk', patterns.rs_crosstalk, 'Crosstalk', None, True),
+    ('| ARQ ratio', patterns.rs_arq, 'ARQ ratio', None, True),
+)
+
+# Fields of "oct radio stat" outside of the stream tables
+RADIO_STATUS_FIELDS = FieldSet(
+    Field('State', patterns.rs_status, ('Link status',)),
+    Field('Distance', patterns.rs_dist, ('Measured Distance',)),
+)
+
+# Fields of "ifc -a" of ge0
+ETHERNET_FIELDS = FieldSet(
+    Field('Physical link is ', patterns.es_link, ('Status',), lambda match, status: str.lower(match.group(1))),
+    Field('Physical link is ', patterns.es_link, ('Speed',), group(2)),
+    Field('Physical link is ', patterns.es_link, ('Duplex',), group(3)),
+    Field('Physical link is ', patterns.es_link, ('Negotiation',), group(4)),
+    Field('CRC errors', patterns.es_crc, ('CRC',)),
+)
+
 
 def timer(function):
     """Estimate time"""
@@ -17,6 +122,26 @@ def timer(function):
     return wrapper
 
 
+def slice_text(text, slices):
+    """Slice text by line index
+    Input -  text and a list with position of rows (indexes)
+    Output - a list contains the sliced text (from position to position in accordance with the input list)
+    """
+    new_text = []
+    for index, slice in enumerate(slices):
+        try:
+            text_start = slices[index]
+            text_end = slices[index + 1]
+        except IndexError:
+            # Index + 1 cannot be performed for the last element in the arrange
+            text_end = slices[index]
+        finally:
+            new_text.append(text[text_start:text_end])
+    # Drop the element created in the exception
+    new_text.pop()
+    return new_text
+
+
 @timer
 def parse(dc_string, dc_list):
     """Parse a Quanta 5 diagnostic card and fill the class instance in.
@@ -28,8 +153,10 @@ def parse(dc_string, dc_list):
     firmware (type str) - an installed firmware
     uptime (type str) - device's uptime
     reboot_reason (type str) - a last reboot reason
-    dc_list (type list) - a diagnostic card text as a list (array of strings divided by \n)
+    dc_list (type DiagnosticLines) - a diagnostic card text as a sequence of lines (strings divided by \n)
     dc_string (type str) - a diagnostic card text as a string (whole text in the string)
+
+    The next variables are parsed by parse_<variable>(card) when the card attribute is requested first time:
     settings (type dict) - all important settings (in more detail below)
     radio_status (type dict) - information about all wireless links (in more detail below)
     ethernet_status (type dict) - information about all wire links (in more detail below)
@@ -83,57 +210,15 @@ def parse(dc_string, dc_list):
     Example of request: ethernet_status['ge0']['Speed']
     """
 
-    def cut_text(dc_list, pattern_start, pattern_end, offset_start, offset_end):
-        """Cut text from patter_start to pattern_end
-        Input - text, patterns - re.compile, offsets - int
-        Output - a list with the cut text
-        """
-        try:
-            for index, line in enumerate(dc_list):
-                if pattern_start.search(line):
-                    text_start = index + offset_start
-                if pattern_end.search(line):
-                    text_end = index + offset_end
-            text = dc_list[text_start:text_end]
-        except:
-            text = dc_list
-            logger.warning(f'Text has not been cut. Patterns: {pattern_start} - {pattern_end}')
-        return text
-
-    def slice_text(text, slices):
-        """Slice text by line index
-        Input -  text and a list with position of rows (indexes)
-        Output - a list contains the sliced text (from position to position in accordance with the input list)
-        """
-        new_text = []
-        for index, slice in enumerate(slices):
-            try:
-                text_start = slices[index]
-                text_end = slices[index + 1]
-            except IndexError:
-                # Index + 1 cannot be performed for the last element in the arrange
-                text_end = slices[index]
-            finally:
-                new_text.append(text[text_start:text_end])
-        # Drop the element created in the exception
-        new_text.pop()
-        return new_text
-
-
     # General info
     try:
         general_text = ''.join(dc_list[:20])
 
-        pattern_g_fw = re.compile(r'H\d{2}S\d{2}-OCTOPUS_PTPv[\d.]+')
-        pattern_g_model = re.compile(r'([QV]5-[\dE]+)')
-        pattern_g_sn = re.compile(r'SN:(\d+)')
-        pattern_g_uptime = re.compile(r'Uptime: ([\d\w :]*)')
-        pattern_g_reboot_reason = re.compile(r'Last reboot reason: ([\w ]*)')
+        match = patterns.g_fw.search(general_text)
+        if match:
+            firmware = match.group()
 
-        if pattern_g_fw.search(general_text):
-            firmware = pattern_g_fw.search(general_text).group()
-
-        pattern = pattern_g_model.search(general_text)
+        pattern = patterns.g_model.search(general_text)
         if pattern:
             model = pattern.group()
             if 'Q5' in model:
@@ -144,20 +229,36 @@ def parse(dc_string, dc_list):
                 model = 'Quanta Unknown model'
                 subfamily = 'Quanta 5'
 
-        if pattern_g_sn.search(general_text):
-            serial_number = pattern_g_sn.search(general_text).group(1)
+        match = patterns.g_sn.search(general_text)
+        if match:
+            serial_number = match.group(1)
 
-        if pattern_g_uptime.search(general_text):
-            uptime = pattern_g_uptime.search(general_text).group(1)
+        match = patterns.g_uptime.search(general_text)
+        if match:
+            uptime = match.group(1)
 
-        if pattern_g_reboot_reason.search(general_text):
-            reboot_reason = pattern_g_reboot_reason.search(general_text).group(1)
+        match = patterns.g_reboot_reason.search(general_text)
+        if match:
+            reboot_reason = match.group(1)
 
     except:
         logger.warning('General info was not parsed')
 
-    logger.debug(f'General info: Firmware - {firmware}, Model - {model}, Subfamily - {subfamily}, '
-                 f'SN - {serial_number}, Uptime - {uptime}, Last reboot reason - {reboot_reason}')
+    logger.debug('General info: Firmware - %s, Model - %s, Subfamily - %s, '
+                 'SN - %s, Uptime - %s, Last reboot reason - %s',
+                 firmware, model, subfamily, serial_number, uptime, reboot_reason)
+
+    # Prepare result to create a class instance
+    result = (model, subfamily, serial_number, firmware,
+              uptime, reboot_reason, dc_list, dc_string)
+
+    return result
+
+
+def parse_settings(card):
+    """Parse the settings of a Quanta card."""
+
+    sections = card.sections
 
     # Settings
     settings = {'Role': None, 'Bandwidth': None, 'DL Frequency': None, 'UL Frequency': None, 'Frame size': None,
@@ -167,84 +268,24 @@ def parse(dc_string, dc_list):
 
     try:
         # Find "conf show"
-        pattern_start = re.compile(r'#System parameters')
-        pattern_end = re.compile(r'oct swmac_info')
-        settings_text = cut_text(dc_list, pattern_start, pattern_end, 0, 0)
+        settings_text = sections.cut('settings')
 
         # Parse settings
-        pattern_set_role = re.compile(r'ptp_role (\w+)')
-        pattern_set_band = re.compile(r'bw (\d+)')
-        pattern_set_freq_dl = re.compile(r'freq_dl (\d+)')
-        pattern_set_freq_ul = re.compile(r'freq_ul (\d+)')
-        pattern_set_frame = re.compile(r'frame_length ([\.\d]+)')
-        pattern_set_gi = re.compile(r'guard_interval ([auto\d\/]+)')
-        pattern_set_adlp = re.compile(r'radio.auto_dl_ul_ratio (on)')
-        pattern_set_dlp = re.compile(r'radio.dl_ul_ratio (\d+)')
-        pattern_set_pwr = re.compile(r'tx_power ([\-\d]+)')
-        pattern_set_atpc = re.compile(r'atpc (on)')
-        pattern_set_amc = re.compile(r'amc_strategy (\w+)')
-        pattern_set_dl_mcs = re.compile(r'dl_mcs (([\-\d]+)?(QPSK|QAM)-\d+\/\d+)')
-        pattern_set_ul_mcs = re.compile(r'ul_mcs (([\-\d]+)?(QPSK|QAM)-\d+\/\d+)')
-        pattern_set_dfs = re.compile(r'dfs (dfs_rd|on)')
-        pattern_set_harq = re.compile(r'harq (on)')
-        pattern_set_ifc = re.compile(r'ifc (ge0)')
-
-        for line in settings_text:
-            if pattern_set_role.search(line):
-                settings['Role'] = pattern_set_role.search(line).group(1)
-
-            if pattern_set_band.search(line):
-                settings['Bandwidth'] = pattern_set_band.search(line).group(1)
-
-            if pattern_set_freq_dl.search(line):
-                settings['DL Frequency'] = pattern_set_freq_dl.search(line).group(1)
-
-            if pattern_set_freq_ul.search(line):
-                settings['UL Frequency'] = pattern_set_freq_ul.search(line).group(1)
+        SETTINGS_FIELDS.extract(settings_text, settings)
 
-            if pattern_set_frame.search(line):
-                settings['Frame size'] = pattern_set_frame.search(line).group(1)
-
-            if pattern_set_gi.search(line):
-                settings['Guard Interval'] = pattern_set_gi.search(line).group(1)
-
-            if pattern_set_adlp.search(line):
-                settings['ADLP'] = 'Enabled'
-
-            if pattern_set_dlp.search(line):
-                pattern = pattern_set_dlp.search(line).group(1)
-                settings['DL/UL Ratio'] = f'{pattern}/{100 - int(pattern)}'
-
-            if pattern_set_pwr.search(line):
-                settings['Tx Power'] = pattern_set_pwr.search(line).group(1)
-
-            if pattern_set_atpc.search(line):
-                settings['ATPC'] = 'Enabled'
-
-            if pattern_set_amc.search(line):
-                settings['AMC Strategy'] = pattern_set_amc.search(line).group(1)
-
-            if pattern_set_dl_mcs.search(line):
-                settings['Max DL MCS'] = pattern_set_dl_mcs.search(line).group(1)
-
-            if pattern_set_ul_mcs.search(line):
-                settings['Max UL MCS'] = pattern_set_ul_mcs.search(line).group(1)
+    except:
+        logger.warning('Settings were not parsed')
 
-            if pattern_set_dfs.search(line):
-                settings['DFS'] = 'Enabled'
+    logger.debug('Settings: %s', settings)
 
-            if pattern_set_harq.search(line):
-                settings['ARQ'] = 'Enabled'
+    return settings
 
-            if pattern_set_ifc.search(line):
-                interface = pattern_set_ifc.search(line).group(1)
-                if 'up' in line:
-                    settings['Interface Status'][interface] = 'up'
 
-    except:
-        logger.warning('Settings were not parsed')
+def parse_radio_status(card):
+    """Parse the radio status of a Quanta card."""
 
-    logger.debug(f'Settings: {settings}')
+    sections = card.sections
+    settings = card.settings
 
     # Radio Status
     stream = {'Tx Power': None, 'MCS': None, 'RSSI': None, 'EVM': None, 'Crosstalk': None, 'ARQ ratio': None}
@@ -255,132 +296,77 @@ def parse(dc_string, dc_list):
 
     try:
         # Find "oct radio stat"
-        pattern_start = re.compile(r'#Radio diagnostic')
-        pattern_end = re.compile(r'oct show calibration')
-        radio_text = cut_text(dc_list, pattern_start, pattern_end, 2, 0)
+        radio_text = sections.cut('radio')
 
-        # Parse radio status
-        pattern_rs_status = re.compile(r'State\s+(\w+)')
-        pattern_rs_dist = re.compile(r'Distance\s+(\d+ k?m)')
-        pattern_rs_pwr = re.compile(r'([\-\.\d]+) \/ ([\-\.\d]+) dBm')
-        pattern_rs_freq = re.compile(r'(\d+) MHz')
-        pattern_rs_mcs = re.compile(r'(([\-\d]+)?(QPSK|QAM)-\d+\/\d+)')
-        pattern_rs_rssi = re.compile(r'([\.\-\d]+)( \([\.\-\d]+\))? dBm')
-        pattern_rs_evm = re.compile(r'([\.\-\d]+) dB')
-        pattern_rs_crosstalk = re.compile(r'([\.\-\d]+) dB')
-        pattern_rs_arq = re.compile(r'([\.\d]+) %')
+        # The master transmits downlink, the slave transmits uplink
+        if settings['Role'] == 'master':
+            local, remote = dowlink, uplink
+        else:
+            local, remote = uplink, dowlink
 
+        # Parse radio status
         for line in radio_text:
-            if pattern_rs_status.search(line):
-                radio_status['Link status'] = pattern_rs_status.search(line).group(1)
-
-            if pattern_rs_dist.search(line):
-                radio_status['Measured Distance'] = pattern_rs_dist.search(line).group(1)
-
-            if settings['Role'] == 'master':
-                if line.startswith('| TX power'):
-                    dowlink['Stream 0']['Tx Power'] = pattern_rs_pwr.search(line).group(1)
-                    dowlink['Stream 1']['Tx Power'] = pattern_rs_pwr.search(line).group(2)
-                elif line.startswith('| Remote TX power') and radio_status['Link status'] == 'connected':
-                    uplink['Stream 0']['Tx Power'] = pattern_rs_pwr.search(line).group(1)
-                    uplink['Stream 1']['Tx Power'] = pattern_rs_pwr.search(line).group(2)
-            else:
-                if line.startswith('| TX power'):
-                    uplink['Stream 0']['Tx Power'] = pattern_rs_pwr.search(line).group(1)
-                    uplink['Stream 1']['Tx Power'] = pattern_rs_pwr.search(line).group(2)
-                elif line.startswith('| Remote TX power') and radio_status['Link status'] == 'connected':
-                    dowlink['Stream 0']['Tx Power'] = pattern_rs_pwr.search(line).group(1)
-                    dowlink['Stream 1']['Tx Power'] = pattern_rs_pwr.search(line).group(2)
+            # The link status is needed by the lines below it
+            RADIO_STATUS_FIELDS.extract([line], radio_status)
+
+            if line.startswith('| TX power'):
+                pattern = patterns.rs_pwr.search(line)
+                local['Stream 0']['Tx Power'], local['Stream 1']['Tx Power'] = pattern.group(1, 2)
+            elif line.startswith('| Remote TX power') and radio_status['Link status'] == 'connected':
+                pattern = patterns.rs_pwr.search(line)
+                remote['Stream 0']['Tx Power'], remote['Stream 1']['Tx Power'] = pattern.group(1, 2)
 
             if radio_status['Link status'] == 'connected':
-                if line.startswith('| Frequency'):
-                    if pattern_rs_freq.search(line):
-                        dowlink['Frequency'] = pattern_rs_freq.findall(line)[0]
-                        uplink['Frequency'] = pattern_rs_freq.findall(line)[1]
-
-                if line.startswith('| MCS'):
-                    if pattern_rs_mcs.search(line):
-                        dowlink['Stream 0']['MCS'] = pattern_rs_mcs.findall(line)[0][0]
-                        dowlink['Stream 1']['MCS'] = pattern_rs_mcs.findall(line)[1][0]
-                        uplink['Stream 0']['MCS'] = pattern_rs_mcs.findall(line)[2][0]
-                        uplink['Stream 1']['MCS'] = pattern_rs_mcs.findall(line)[3][0]
-
-                if line.startswith('| RSSI'):
-                    if pattern_rs_rssi.search(line):
-                        dowlink['Stream 0']['RSSI'] = pattern_rs_rssi.findall(line)[0][0]
-                        dowlink['Stream 1']['RSSI'] = pattern_rs_rssi.findall(line)[1][0]
-                        uplink['Stream 0']['RSSI'] = pattern_rs_rssi.findall(line)[2][0]
-                        uplink['Stream 1']['RSSI'] = pattern_rs_rssi.findall(line)[3][0]
-
-                if line.startswith('| EVM'):
-                    if pattern_rs_evm.search(line):
-                        dowlink['Stream 0']['EVM'] = pattern_rs_evm.findall(line)[0]
-                        dowlink['Stream 1']['EVM'] = pattern_rs_evm.findall(line)[1]
-                        uplink['Stream 0']['EVM'] = pattern_rs_evm.findall(line)[2]
-                        uplink['Stream 1']['EVM'] = pattern_rs_evm.findall(line)[3]
-
-                if line.startswith('| Crosstalk'):
-                    if pattern_rs_crosstalk.search(line):
-                        dowlink['Stream 0']['Crosstalk'] = pattern_rs_crosstalk.findall(line)[0]
-                        dowlink['Stream 1']['Crosstalk'] = pattern_rs_crosstalk.findall(line)[1]
-                        uplink['Stream 0']['Crosstalk'] = pattern_rs_crosstalk.findall(line)[2]
-                        uplink['Stream 1']['Crosstalk'] = pattern_rs_crosstalk.findall(line)[3]
-
-                if line.startswith('| ARQ ratio'):
-                    if pattern_rs_arq.search(line):
-                        dowlink['Stream 0']['ARQ ratio'] = pattern_rs_arq.findall(line)[0]
-                        dowlink['Stream 1']['ARQ ratio'] = pattern_rs_arq.findall(line)[1]
-                        uplink['Stream 0']['ARQ ratio'] = pattern_rs_arq.findall(line)[2]
-                        uplink['Stream 1']['ARQ ratio'] = pattern_rs_arq.findall(line)[3]
+                for prefix, pattern, field, group, stream_field in RADIO_FIELDS:
+                    if line.startswith(prefix):
+                        break
+                else:
+                    continue
+
+                # Search the pattern once and fill all fields in from the result
+                values = pattern.findall(line)
+                if not values:
+                    continue
+                if group is not None:
+                    values = [value[group] for value in values]
+
+                if stream_field:
+                    records = [dowlink['Stream 0'], dowlink['Stream 1'], uplink['Stream 0'], uplink['Stream 1']]
+                else:
+                    records = [dowlink, uplink]
+
+                for position, record in enumerate(records):
+                    record[field] = values[position]
 
     except:
         logger.warning('Radio Status was not parsed')
 
-    logger.debug(f'Radio Status: {radio_status}')
+    logger.debug('Radio Status: %s', radio_status)
+
+    return radio_status
+
+
+def parse_ethernet_status(card):
+    """Parse the ethernet status of a Quanta card."""
+
+    sections = card.sections
 
     # Ethernet Status
     ethernet_status = {'ge0': {'Status': 'down', 'Speed': None, 'Duplex': None, 'Negotiation': None, 'CRC': 0}}
 
     try:
         # Find "ifc -a"
-        pattern_start = re.compile(r'#Interface statistic')
-        pattern_end = re.compile(r'Radio port statistics')
-        interface_text = cut_text(dc_list, pattern_start, pattern_end, 1, 12)
+        interface_text = sections.cut('ethernet')
 
         # Parse interfaces
-        pattern_es_status = re.compile(r'Physical link is (\w+)')
-        pattern_es_speed = re.compile(r'Physical link is \w+, (\d+) Mbps')
-        pattern_es_duplex = re.compile(r'Physical link is \w+, \d+ Mbps\s+(\w+)-duplex')
-        pattern_es_autoneg = re.compile(r'Physical link is \w+, \d+ Mbps\s+\w+-duplex, (\w+)')
-        pattern_es_crc = re.compile(r'CRC errors\s+(\d+)')
-
-        for line in interface_text:
-            if pattern_es_status.search(line):
-                ethernet_status['ge0']['Status'] = str.lower(pattern_es_status.search(line).group(1))
-
-            if pattern_es_speed.search(line):
-                ethernet_status['ge0']['Speed'] = pattern_es_speed.search(line).group(1)
-
-            if pattern_es_duplex.search(line):
-                ethernet_status['ge0']['Duplex'] = pattern_es_duplex.search(line).group(1)
-
-            if pattern_es_autoneg.search(line):
-                ethernet_status['ge0']['Negotiation'] = pattern_es_autoneg.search(line).group(1)
-
-            if pattern_es_crc.search(line):
-                ethernet_status['ge0']['CRC'] = pattern_es_crc.search(line).group(1)
+        ETHERNET_FIELDS.extract(interface_text, ethernet_status['ge0'])
 
     except:
         logger.warning('Ethernet Status was not parsed')
 
-    logger.debug(f'Ethernet Status: {ethernet_status}')
+    logger.debug('Ethernet Status: %s', ethernet_status)
 
-    # Prepare result to create a class instance
-    result = (model, subfamily, serial_number, firmware,
-              uptime, reboot_reason, dc_list, dc_string,
-              settings, radio_status, ethernet_status)
-
-    return result
+    return ethernet_status
 
 
 logger = logging.getLogger('logger.parser_q5')
\ No newline at end of file
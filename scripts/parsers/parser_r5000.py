@@ -1,10 +1,328 @@
 # -*- coding: utf-8 -*-
 
 import logging
-import re
 from copy import deepcopy
 from time import time
 
+from scripts.parsers.dc_fields import Field, FieldSet, constant, group
+from scripts.parsers.dc_patterns import compile_patterns
+from scripts.parsers.dc_records import Record, slot_names
+from scripts.parsers.dc_sections import Section
+
+
+# WANFleX hardware codes parsed by the module ("# <platform> WANFleX H<code>" in the header)
+HARDWARE = ('01', '02', '03', '04', '05', '06', '07', '08', '11')
+
+SECTIONS = {
+    'settings': Section(r'# R5000 WANFleX H', r'#LLDP parameters', 0, 2),
+    'switch': Section(r'#MAC Switch config', r'#SNMP configuration', 1, -1, 'settings'),
+    'interfaces': Section(r'#Interfaces parameters', r'#QoS manager', 1, -1, 'settings'),
+    'qos': Section(r'#QoS manager', r'#MINT configuration', 1, -1, 'settings'),
+    'license': Section(r"License 'Factory License'", r'</license>', 0, -1),
+    'links': Section(r'Id\s+Name\s+Node\s+Level', r'Total nodes in area', 1, -1),
+    'rf_scanner': Section(r'rf5.0 Source Analysis', r'rf5.0: NOL is empty', 2, 0),
+    'rf_statistics': Section(r'rf5.0 Statistics', r'Software Priority Queues', 3, -2),
+    'ethernet': Section(r'eth0: flags=', r'Name\s+Network', 0, -2),
+    'switch_status': Section(r'Switch statistics:', r'DB Records', 6, -2),
+    'qos_status': Section(r'Software Priority Queues rf5.0', r'Phy errors: total \d+', 0, 1),
+}
+
+
+patterns = compile_patterns(
+    'r5000',
+    # General info
+    g_fw=r'H\d{2}S\d{2}-(MINT|TDMA)[v\d.]+',
+    g_model=r'(R5000-[QMOSL][mxnbtcs]{2,5}/[\dX\*]{1,3}.300.2x\d{2,3})(.2x\d{2})?',
+    g_sn=r'SN:(\d+)',
+    g_uptime=r'Uptime: ([\d\w :]*)',
+    g_reboot_reason=r'Last reboot reason: ([\w ]*)',
+
+    # Settings
+    set_type=r'mint rf5\.0 -type (\w+)',
+    set_pwr=r'rf rf5.0 txpwr ([\-\d]+)',
+    set_atpc=r'rf rf5.0 txpwr [\-\d]+ (pwrctl)',
+    set_extnoise=r'extnoise ([\-+\d+])',
+    set_dfs=r'dfs rf5\.0 (dfsradar|dfsonly|dfsoff)',
+    set_scrambling=r'mint rf5.0 -scrambling',
+    set_tdma_frame=r'tdma mode=Master win=(\d+)',
+    set_tdma_dist=r'mode=Master win=\d+ dist=(\d+)',
+    set_tdma_dlp=r'mode=Master win=\d+ dist=\d+ dlp=(\d+)',
+    set_tdma_target=r'mint rf5\.0 tdma rssi=([\-\d]+)',
+    set_tdma_tsync=r'tsync enable',
+    set_polling=r'mint rf5\.0 poll start',
+    set_m_freq=r'rf rf5\.0 freq ([\.\d]+)',
+    set_m_bitr=r'rf rf5\.0 freq [\.\d]+ bitr (\d+)',
+    set_m_sid=r'rf rf5\.0 freq [\.\d]+ bitr \d+ sid ([\d\w]+)',
+    set_m_band=r'rf rf5\.0 band (\d+)',
+    set_m_afbitr=r'mint rf5\.0 -(auto|fixed)bitrate',
+    set_m_afbitr_offset=r'mint rf5\.0 -(auto|fixed)bitrate ([\-+\d]+)',
+    set_m_mimo=r'rf rf5\.0 (mimo|miso|siso)',
+    set_m_greenfield=r'rf rf5\.0 (mimo|miso|siso) (greenfield)',
+    set_s_status=r'mint rf5\.0 prof \d+ disable',
+    set_s_state=r'[\w\d]+ band \d+ freq [\-\d]+ snr \d+ links \d+, prof (\d+)',
+    set_s_band=r'-band (\d+)',
+    set_s_freq=r'-freq ([\.\d\w]+)',
+    set_s_bitr=r'-bitr (\d+)',
+    set_s_sid=r'-sid ([\d\w]+)',
+    set_s_afbitr=r'-(auto|fixed)bitr',
+    set_s_afbitr_offset=r'-(auto|fixed)bitr (([\-+])?([\d]+))',
+    set_s_mimo=r'-(mimo|miso|siso)',
+    set_s_greenfield=r'(greenfield)',
+    profile=r'mint rf5\.0 prof (\d+)',
+    set_sw=r'switch start',
+    set_sw_id=r'switch group (\d+) add',
+    set_sw_order=r'switch group \d+ add (\d+)',
+    set_sw_ifc=r'switch group \d+ add \d+ (.+)',
+    set_sw_flood=r'flood-unicast on',
+    set_sw_stp=r'stp on',
+    set_sw_mode_trunk=r'trunk on',
+    set_sw_mode_intrunk=r'in-trunk (\d+)',
+    set_sw_mode_upstream=r'upstream',
+    set_sw_mode_downstream=r'downstream',
+    set_sw_rule=r'switch group \d+ rule \d+\s+(permit|deny) match (\w+)',
+    set_sw_rule_list=r'switch list (\w+) match add ([\w\d\-,\s\S]+)',
+    set_sw_rule_default=r'switch group \d+ (deny|permit)',
+    set_sw_rule_vlan=r'switch group \d+ (vlan [\d\-,]+)',
+    set_sw_mngt=r'svi (\d+) group (\d+)',
+    set_ifc=r'ifc (eth\d+|rf5\.0)',
+    set_qm_channel=r'qm (ch\d+)',
+    set_qm_options=r'qm option ([\w\s]+)',
+    set_qm_throughput=r'MaximumTransmitRate="(\d+)"',
+
+    # Radio status
+    rs_mac=r'(00[\dA-F]{10})',
+    rs_prf=r'(join|prf)',
+    rs_name=r'[\.\d]+\s+([\w\d\S \-]+)\s+00[\dA-F]{10}',
+    rs_spaces=r"(\s{2,})",
+    rs_level=r'00[\w\d]+\s+(\d+)/(\d+)',
+    rs_bitrate=r'00[\w\d]+\s+\d+/\d+\s+(\d+)/(\d+)',
+    rs_retry=r'00[\w\d]+\s+\d+/\d+\s+\d+/\d+\s+(\d+)/(\d+)',
+    rs_load=r'load (\d+)/(\d+)',
+    rs_pps=r'pps (\d+)/(\d+)',
+    rs_cost=r'cost ([\-\d+\.]+)',
+    rs_pwr=r'pwr ([\*\-\d+\.]+)/([\*\-\d+\.]+)',
+    rs_rssi=r'rssi ([\*\-\d+\.]+)/([\*\-\d+\.]+)',
+    rs_rssi_rf_scanner=r'\d+\/([\-\d]+)',
+    rs_snr=r'snr (\d+)/(\d+)',
+    rs_distance=r'dist ([\.\d+]+)',
+    rs_firmware=r'(H\d{2}v[v\d.]+)',
+    rs_uptime=r'up ([\d\w :]*)',
+    rs_pulses=r'Pulses: (\d+)',
+    rs_pulses_level=r'level\s+(\d+)',
+    rs_pulses_rssi=r'level\s+\d+\s+\(([\-\d]+)\)',
+    rs_pulses_pps=r'pps ([\.\d]+)',
+    rs_rx_load=r'RX Medium Load\s+([\d\.]+%)',
+    rs_tx_load=r'TX Medium Load\s+([\d\.]+%)',
+    rs_total_load=r'Total Medium Busy\s+([\d\.]+%)',
+    rs_ex_retries=r'Excessive Retries\s+(\d+)',
+    rs_af_retries=r'Aggr Full Retries\s+(\d+)',
+    rs_cur_freq=r'\(band \d+, freq (\d+)\)',
+
+    # Ethernet status
+    es_ifc=r'([\w\d]+): flags',
+    es_link=r'Physical link is (\w+)(?:, (\d+) Mbps(?:\s+(\w+)-duplex(?:, (\w+))?)?)?',
+    es_crc=r'CRC errors\s+(\d+)',
+
+    # Switch status
+    ss_stat=r'(\d+)\s+>?(\d+)\s+>?(\d+)\s+>?(\d+)\s+>?(\d+)\s+>?(\d+)\s+>?(\d+)\s+>?(\d+)\s+>?(\d+)\s+>?(\d+)',
+
+    # QoS status
+    qs_stat=r'(q\d+)\s+(\((P\d+)\))?(\s+\(cos\d\))?\s+(\d+)\s+\/\s+(\d+)?',
+)
+
+
+def auto_bitrate(pattern_offset):
+    """Return a converter of the auto/fixed bitrate option, the offset is taken from the same line."""
+
+    def convert(match, profile):
+        if match.group(1) == 'auto':
+            pattern = pattern_offset.search(match.string)
+            return f'Enabled. Modification is {pattern.group(2)}' if pattern else 'Enabled'
+        return f'Disabled. Fixed bitrate is {profile["Max bitrate"]}'
+    return convert
+
+
+# Fields of the config: Field(trigger, pattern, target path, converter)
+RADIO_FIELDS = FieldSet(
+    # Common settings
+    Field('mint rf5.0 -type ', patterns.set_type, ('Type',)),
+    Field('txpwr ', patterns.set_pwr, ('Tx Power',)),
+    Field('pwrctl', patterns.set_atpc, ('ATPC',), constant('Enabled')),
+    Field('extnoise ', patterns.set_extnoise, ('Extnoise',)),
+    Field('dfs rf5.0 ', patterns.set_dfs, ('DFS',)),
+    Field('-scrambling', patterns.set_scrambling, ('Scrambling',), constant('Enabled')),
+
+    # TDMA Settings
+    Field('tdma mode=Master win=', patterns.set_tdma_frame, ('Frame size',)),
+    Field('mode=Master win=', patterns.set_tdma_dist, ('Distance',)),
+    Field('mode=Master win=', patterns.set_tdma_dlp, ('DL/UL ratio',)),
+    Field('mint rf5.0 tdma rssi=', patterns.set_tdma_target, ('Target RSSI',)),
+    Field('tsync enable', patterns.set_tdma_tsync, ('TSync',), constant('Enabled')),
+
+    # MINT Settings
+    Field('mint rf5.0 poll start', patterns.set_polling, ('Polling',), constant('Enabled')),
+)
+
+MASTER_PROFILE_FIELDS = FieldSet(
+    Field('rf rf5.0 freq ', patterns.set_m_freq, ('Frequency',)),
+    Field('rf rf5.0 freq ', patterns.set_m_bitr, ('Max bitrate',)),
+    Field('rf rf5.0 freq ', patterns.set_m_sid, ('SID',)),
+    Field('rf rf5.0 band ', patterns.set_m_band, ('Bandwidth',)),
+    Field('mint rf5.0 -', patterns.set_m_afbitr, ('Auto bitrate',), auto_bitrate(patterns.set_m_afbitr_offset)),
+    Field('rf rf5.0 ', patterns.set_m_mimo, ('MIMO',), lambda match, profile: str.upper(match.group(1))),
+    Field('greenfield', patterns.set_m_greenfield, ('Greenfield',), group(2)),
+)
+
+SLAVE_PROFILE_FIELDS = FieldSet(
+    Field(' disable', patterns.set_s_status, ('Status',), constant('Disabled')),
+    # Profile cannot be Active if it is disabled
+    Field(' disable', patterns.set_s_status, ('State',), constant('Idle')),
+    Field('-band ', patterns.set_s_band, ('Bandwidth',)),
+    Field('-freq ', patterns.set_s_freq, ('Frequency',)),
+    Field('-bitr ', patterns.set_s_bitr, ('Max bitrate',)),
+    Field('-sid ', patterns.set_s_sid, ('SID',)),
+    Field('bitr', patterns.set_s_afbitr, ('Auto bitrate',), auto_bitrate(patterns.set_s_afbitr_offset)),
+    Field('-', patterns.set_s_mimo, ('MIMO',), lambda match, profile: str.upper(match.group(1))),
+    Field('greenfield', patterns.set_s_greenfield, ('Greenfield',)),
+)
+
+INTERFACE_FIELDS = FieldSet(
+    Field('ifc ', patterns.set_ifc, (1,), lambda match, interfaces: 'up' if 'up' in match.string else None),
+)
+
+SWITCH_GROUP_FIELDS = FieldSet(
+    Field(' add ', patterns.set_sw_order, ('Order',)),
+    # The last word of the line is "\r"
+    Field(' add ', patterns.set_sw_ifc, ('Interfaces',),
+          lambda match, group: ', '.join(match.group(1).split(' ')[:-1])),
+    Field('flood-unicast on', patterns.set_sw_flood, ('Flood',), constant('Enabled')),
+    Field('stp on', patterns.set_sw_stp, ('STP',), constant('Enabled')),
+    # The modes are checked from the lowest priority, the last one found in the line wins
+    Field('downstream', patterns.set_sw_mode_downstream, ('Mode',), constant('Downstream')),
+    Field('upstream', patterns.set_sw_mode_upstream, ('Mode',), constant('Upstream')),
+    Field('in-trunk ', patterns.set_sw_mode_intrunk, ('Mode',), lambda match, group: f'In-Trunk {match.group(1)}'),
+    Field('trunk on', patterns.set_sw_mode_trunk, ('Mode',), constant('Trunk')),
+    Field(' vlan ', patterns.set_sw_rule_vlan, ('Rules',),
+          lambda match, group: f'permit: {match.group(1)}; deny: any any'),
+)
+
+# The rule of a switch group is made of the rule and the default action (see parse_settings())
+SWITCH_RULE_FIELDS = FieldSet(
+    Field(' rule ', patterns.set_sw_rule, ('Action',)),
+    Field(' rule ', patterns.set_sw_rule, ('Rule',), group(2)),
+    Field('switch group ', patterns.set_sw_rule_default, ('Default',)),
+)
+
+SWITCH_LIST_FIELDS = FieldSet(
+    Field('switch list ', patterns.set_sw_rule_list, (1,),
+          lambda match, lists: match.group(2).replace('\'', '').replace('\r', '').replace('\n', '')),
+)
+
+SWITCH_MANAGEMENT_FIELDS = FieldSet(
+    Field('svi ', patterns.set_sw_mngt, (2, 'Management'), constant('Enabled')),
+)
+
+QOS_FIELDS = FieldSet(
+    Field('qm option ', patterns.set_qm_options, ('Options',),
+          lambda match, qos: match.group(1).replace('\r', '').replace('\n', '').replace(' ', ', ')),
+)
+
+LICENSE_FIELDS = FieldSet(
+    Field('MaximumTransmitRate=', patterns.set_qm_throughput, ('Throughput',)),
+)
+
+# Fields of the status: a link of "mint map det" is parsed as one text (a link may take several lines)
+LINK_FIELDS = FieldSet(
+    Field('/', patterns.rs_level, ('Level Rx',)),
+    Field('/', patterns.rs_level, ('Level Tx',), group(2)),
+    Field('/', patterns.rs_bitrate, ('Bitrate Rx',)),
+    Field('/', patterns.rs_bitrate, ('Bitrate Tx',), group(2)),
+    Field('/', patterns.rs_retry, ('Retry Rx',)),
+    Field('/', patterns.rs_retry, ('Retry Tx',), group(2)),
+    Field('load ', patterns.rs_load, ('Load Rx',)),
+    Field('load ', patterns.rs_load, ('Load Tx',), group(2)),
+    Field('pps ', patterns.rs_pps, ('PPS Rx',)),
+    Field('pps ', patterns.rs_pps, ('PPS Tx',), group(2)),
+    Field('cost ', patterns.rs_cost, ('Cost',)),
+    Field('pwr ', patterns.rs_pwr, ('Power Rx',)),
+    Field('pwr ', patterns.rs_pwr, ('Power Tx',), group(2)),
+    Field('snr ', patterns.rs_snr, ('SNR Rx',)),
+    Field('snr ', patterns.rs_snr, ('SNR Tx',), group(2)),
+    Field('dist ', patterns.rs_distance, ('Distance',)),
+    Field('H', patterns.rs_firmware, ('Firmware',)),
+    Field('up ', patterns.rs_uptime, ('Uptime',)),
+)
+
+# MINT firmware does not contain RSSI in the mint map det text
+LINK_RSSI_FIELDS = FieldSet(
+    Field('rssi ', patterns.rs_rssi, ('RSSI Rx',)),
+    Field('rssi ', patterns.rs_rssi, ('RSSI Tx',), group(2)),
+)
+
+# The parts of a link logged if they are not found: (a name, a field)
+LINK_PARTS = (('Level', 'Level Rx'), ('Bitrate', 'Bitrate Rx'), ('Retry', 'Retry Rx'), ('Load', 'Load Rx'),
+              ('PPS', 'PPS Rx'), ('Cost', 'Cost'), ('Power', 'Power Rx'), ('SNR', 'SNR Rx'),
+              ('Distance', 'Distance'), ('Firmware', 'Firmware'), ('Uptime', 'Uptime'))
+
+RF_SCANNER_FIELDS = FieldSet(
+    Field('Pulses: ', patterns.rs_pulses, ('Pulses',)),
+    Field('level', patterns.rs_pulses_level, ('Interference Level',)),
+    Field('level', patterns.rs_pulses_rssi, ('Interference RSSI',)),
+    Field('pps ', patterns.rs_pulses_pps, ('Interference PPS',)),
+)
+
+RF_STATISTICS_FIELDS = FieldSet(
+    Field('RX Medium Load', patterns.rs_rx_load, ('RX Medium Load',)),
+    Field('TX Medium Load', patterns.rs_tx_load, ('TX Medium Load',)),
+    Field('Total Medium Busy', patterns.rs_total_load, ('Total Medium Busy',)),
+    Field('Excessive Retries', patterns.rs_ex_retries, ('Excessive Retries',)),
+    Field('Aggr Full Retries', patterns.rs_af_retries, ('Aggr Full Retries',)),
+    Field('(band ', patterns.rs_cur_freq, ('Current Frequency',)),
+)
+
+
+def crc_errors(match, status):
+    """Fill the Tx CRC errors in and return the Rx ones (the line is searched once), Tx is 0 if the line has only Rx."""
+
+    errors = match.re.findall(match.string)
+    status['Tx CRC'] = errors[1] if len(errors) > 1 else 0
+    return errors[0]
+
+
+ETHERNET_FIELDS = FieldSet(
+    Field('Physical link is ', patterns.es_link, ('Status',), lambda match, status: str.lower(match.group(1))),
+    Field('Physical link is ', patterns.es_link, ('Speed',), group(2)),
+    Field('Physical link is ', patterns.es_link, ('Duplex',), group(3)),
+    Field('Physical link is ', patterns.es_link, ('Negotiation',), group(4)),
+    Field('CRC errors', patterns.es_crc, ('Rx CRC',), crc_errors),
+)
+
+
+class RadioProfile(Record):
+    """A radio profile (the master profile or a slave profile)."""
+
+    defaults = {'Frequency': None, 'Bandwidth': None, 'Max bitrate': None, 'Auto bitrate': 'Disabled',
+                'MIMO': None, 'SID': None, 'Status': 'Enabled', 'Greenfield': 'Disabled', 'State': 'Idle'}
+    __slots__ = slot_names(defaults)
+
+
+class SwitchGroup(Record):
+    """Settings of a switch group."""
+
+    defaults = {'Order': None, 'Flood': 'Disabled', 'STP': 'Disabled', 'Management': 'Disabled',
+                'Mode': 'Normal', 'Interfaces': None, 'Rules': None}
+    __slots__ = slot_names(defaults)
+
+
+class LinkStatus(Record):
+    """A status of a link from "mint map det"."""
+
+    defaults = {'Name': None, 'Level Rx': None, 'Level Tx': None, 'Bitrate Rx': None, 'Bitrate Tx': None,
+                'Load Rx': None, 'Load Tx': None, 'PPS Rx': None, 'PPS Tx': None, 'Cost': None, 'Retry Rx': None,
+                'Retry Tx': None, 'Power Rx': None, 'Power Tx': None, 'RSSI Rx': None, 'RSSI Tx': None,
+                'SNR Rx': None, 'SNR Tx': None, 'Distance': None, 'Firmware': None, 'Uptime': None}
+    __slots__ = slot_names(defaults)
+
 
 def timer(function):
     """Estimate time"""
@@ -17,6 +335,26 @@ def timer(function):
     return wrapper
 
 
+def slice_text(text, slices):
+    """Slice text by line index
+    Input -  text and a list with position of rows (indexes)
+    Output - a list contains the sliced text (from position to position in accordance with the input list)
+    """
+    new_text = []
+    for index, slice in enumerate(slices):
+        try:
+            text_start = slices[index]
+            text_end = slices[index + 1]
+        except IndexError:
+            # Index + 1 cannot be performed for the last element in the arrange
+            text_end = slices[index]
+        finally:
+            new_text.append(text[text_start:text_end])
+    # Drop the element created in the exception
+    new_text.pop()
+    return new_text
+
+
 @timer
 def parse(dc_string, dc_list):
     """Parse an R5000 diagnostic card and fill the class instance in
@@ -31,8 +369,10 @@ def parse(dc_string, dc_list):
     firmware (type str) - an installed firmware
     uptime (type str) - device's uptime
     reboot_reason (type str) - a last reboot reason
-    dc_list (type list) - a diagnostic card text as a list (array of strings divided by \n)
+    dc_list (type DiagnosticLines) - a diagnostic card text as a sequence of lines (strings divided by \n)
     dc_string (type str) - a diagnostic card text as a string (whole text in the string)
+
+    The next variables are parsed by parse_<variable>(card) when the card attribute is requested first time:
     settings (type dict) - all important settings (in more detail below)
     radio_status (type dict) - information about all wireless links (in more detail below)
     ethernet_status (type dict) - information about all wire links (in more detail below)
@@ -132,58 +472,15 @@ def parse(dc_string, dc_list):
     Example of request: ethernet_status['eth0']['Speed']
     """
 
-    def cut_text(text, pattern_start, pattern_end, offset_start, offset_end):
-        """Cut text from patter_start to pattern_end
-        Input - text, patterns - re.compile, offsets - int
-        Output - a list with the cut text
-        """
-        try:
-            for index, line in enumerate(text):
-                if pattern_start.search(line):
-                    text_start = index + offset_start
-                if pattern_end.search(line):
-                    text_end = index + offset_end
-            new_text = text[text_start:text_end]
-        except:
-            new_text = text
-            logger.warning(f'Text has not been cut. Patterns: {pattern_start} - {pattern_end}')
-        return new_text
-
-    def slice_text(text, slices):
-        """Slice text by line index
-        Input -  text and a list with position of rows (indexes)
-        Output - a list contains the sliced text (from position to position in accordance with the input list)
-        """
-        new_text = []
-        for index, slice in enumerate(slices):
-            try:
-                text_start = slices[index]
-                text_end = slices[index + 1]
-            except IndexError:
-                # Index + 1 cannot be performed for the last element in the arrange
-                text_end = slices[index]
-            finally:
-                new_text.append(text[text_start:text_end])
-        # Drop the element created in the exception
-        new_text.pop()
-        return new_text
-
-
     # General info
     try:
         general_text = ''.join(dc_list[:15])
 
-        pattern_g_fw = re.compile(r'H\d{2}S\d{2}-(MINT|TDMA)[v\d.]+')
-        pattern_g_model = re.compile(r'(R5000-[QMOSL][mxnbtcs]{2,5}/[\dX\*]'
-                                     r'{1,3}.300.2x\d{2,3})(.2x\d{2})?')
-        pattern_g_sn = re.compile(r'SN:(\d+)')
-        pattern_g_uptime = re.compile(r'Uptime: ([\d\w :]*)')
-        pattern_g_reboot_reason = re.compile(r'Last reboot reason: ([\w ]*)')
-
-        if pattern_g_fw.search(general_text):
-            firmware = pattern_g_fw.search(general_text).group()
+        match = patterns.g_fw.search(general_text)
+        if match:
+            firmware = match.group()
 
-        pattern = pattern_g_model.search(general_text)
+        pattern = patterns.g_model.search(general_text)
         if pattern:
             model = pattern.group()
             if ('L' in model or 'S' in model) and '2x19' in model:
@@ -199,111 +496,54 @@ def parse(dc_string, dc_list):
             model = 'R5000 Unknown model'
             subfamily = 'R5000 Pro'
 
-        if pattern_g_sn.search(general_text):
-            serial_number = pattern_g_sn.search(general_text).group(1)
+        match = patterns.g_sn.search(general_text)
+        if match:
+            serial_number = match.group(1)
 
-        if pattern_g_uptime.search(general_text):
-            uptime = pattern_g_uptime.search(general_text).group(1)
+        match = patterns.g_uptime.search(general_text)
+        if match:
+            uptime = match.group(1)
 
-        if pattern_g_reboot_reason.search(general_text):
-            reboot_reason = pattern_g_reboot_reason.search(general_text).group(1)
+        match = patterns.g_reboot_reason.search(general_text)
+        if match:
+            reboot_reason = match.group(1)
 
     except:
         logger.warning('General info was not parsed')
 
-    logger.debug(f'General info: Firmware - {firmware}, Model - {model}, Subfamily - {subfamily}, '
-                 f'SN - {serial_number}, Uptime - {uptime}, Last reboot reason - {reboot_reason}')
+    logger.debug('General info: Firmware - %s, Model - %s, Subfamily - %s, '
+                 'SN - %s, Uptime - %s, Last reboot reason - %s',
+                 firmware, model, subfamily, serial_number, uptime, reboot_reason)
+
+    # Prepare result to create a class instance
+    result = (model, subfamily, serial_number, firmware,
+              uptime, reboot_reason, dc_list, dc_string)
+
+    return result
+
+
+def parse_settings(card):
+    """Parse the settings (radio, switch, interfaces and QoS) of an R5000 card."""
+
+    sections = card.sections
+    dc_string = card.dc_string
+    firmware = card.firmware
 
     # Settings
-    radio_profile = {'Frequency': None, 'Bandwidth': None, 'Max bitrate': None, 'Auto bitrate': 'Disabled',
-                     'MIMO': None, 'SID': None, 'Status': 'Enabled', 'Greenfield': 'Disabled', 'State': 'Idle'}
     radio_settings = {'Type': 'slave', 'ATPC': 'Disabled', 'Tx Power': None, 'Extnoise': None, 'DFS': None,
                       'Polling': 'Disabled', 'Frame size': None, 'DL/UL ratio': None, 'Distance': None,
-                      'Target RSSI': None, 'TSync': 'Disabled', 'Scrambling': 'Disabled', 'Profile': radio_profile}
-    switch_group_settings = {'Order': None, 'Flood': 'Disabled', 'STP': 'Disabled', 'Management': 'Disabled',
-                             'Mode': 'Normal', 'Interfaces': None, 'Rules': None}
-    switch_settings = {'Status': 'Disabled', 'Switch Group': switch_group_settings}
+                      'Target RSSI': None, 'TSync': 'Disabled', 'Scrambling': 'Disabled', 'Profile': RadioProfile()}
+    switch_settings = {'Status': 'Disabled', 'Switch Group': SwitchGroup()}
     interfaces_settings = {'eth0': 'down', 'eth1': 'down', 'rf5.0': 'down'}
     qos_settings = {'Options': None, 'Rules': None, 'License': None}
     settings = {'Radio': radio_settings, 'Switch': switch_settings, 'Interface Status': interfaces_settings,
                 'QoS': qos_settings}
 
     try:
-        pattern_start = re.compile(r'# R5000 WANFleX H')
-        pattern_end = re.compile(r'#LLDP parameters')
-        settings_text = cut_text(dc_list, pattern_start, pattern_end, 0, 2)
+        settings_text = sections.cut('settings')
 
         # Radio Settings
-        pattern_set_type = re.compile(r'mint rf5\.0 -type (\w+)')
-        pattern_set_pwr = re.compile(r'rf rf5.0 txpwr ([\-\d]+)')
-        pattern_set_atpc = re.compile(r'rf rf5.0 txpwr [\-\d]+ (pwrctl)')
-        pattern_set_extnoise = re.compile(r'extnoise ([\-+\d+])')
-        pattern_set_dfs = re.compile(r'dfs rf5\.0 (dfsradar|dfsonly|dfsoff)')
-        pattern_set_scrambling = re.compile(r'mint rf5.0 -scrambling')
-        pattern_set_tdma_frame = re.compile(r'tdma mode=Master win=(\d+)')
-        pattern_set_tdma_dist = re.compile(r'mode=Master win=\d+ dist=(\d+)')
-        pattern_set_tdma_dlp = re.compile(r'mode=Master win=\d+ dist=\d+ dlp=(\d+)')
-        pattern_set_tdma_target = re.compile(r'mint rf5\.0 tdma rssi=([\-\d]+)')
-        pattern_set_tdma_tsync = re.compile(r'tsync enable')
-        pattern_set_polling = re.compile(r'mint rf5\.0 poll start')
-        pattern_set_m_freq = re.compile(r'rf rf5\.0 freq ([\.\d]+)')
-        pattern_set_m_bitr = re.compile(r'rf rf5\.0 freq [\.\d]+ bitr (\d+)')
-        pattern_set_m_sid = re.compile(r'rf rf5\.0 freq [\.\d]+ bitr \d+ sid ([\d\w]+)')
-        pattern_set_m_band = re.compile(r'rf rf5\.0 band (\d+)')
-        pattern_set_m_afbitr = re.compile(r'mint rf5\.0 -(auto|fixed)bitrate')
-        pattern_set_m_afbitr_offset = re.compile(r'mint rf5\.0 -(auto|fixed)bitrate ([\-+\d]+)')
-        pattern_set_m_mimo = re.compile(r'rf rf5\.0 (mimo|miso|siso)')
-        pattern_set_m_greenfield = re.compile(r'rf rf5\.0 (mimo|miso|siso) (greenfield)')
-        pattern_set_s_status = re.compile(r'mint rf5\.0 prof \d+ disable')
-        pattern_set_s_state = re.compile(r'[\w\d]+ band \d+ freq [\-\d]+ snr \d+ links \d+, prof (\d+)')
-        pattern_set_s_band = re.compile(r'-band (\d+)')
-        pattern_set_s_freq = re.compile(r'-freq ([\.\d\w]+)')
-        pattern_set_s_bitr = re.compile(r'-bitr (\d+)')
-        pattern_set_s_sid = re.compile(r'-sid ([\d\w]+)')
-        pattern_set_s_afbitr = re.compile(r'-(auto|fixed)bitr')
-        pattern_set_s_afbitr_offset = re.compile(r'-(auto|fixed)bitr (([\-+])?([\d]+))')
-        pattern_set_s_mimo = re.compile(r'-(mimo|miso|siso)')
-        pattern_set_s_greenfield = re.compile(r'(greenfield)')
-
-        for line in settings_text:
-            # Common settings
-            if pattern_set_type.search(line):
-                radio_settings['Type'] = pattern_set_type.search(line).group(1)
-
-            if pattern_set_pwr.search(line):
-                radio_settings['Tx Power'] = pattern_set_pwr.search(line).group(1)
-
-            if pattern_set_atpc.search(line):
-                radio_settings['ATPC'] = 'Enabled'
-
-            if pattern_set_extnoise.search(line):
-                radio_settings['Extnoise'] = pattern_set_extnoise.search(line).group(1)
-
-            if pattern_set_dfs.search(line):
-                radio_settings['DFS'] = pattern_set_dfs.search(line).group(1)
-
-            if pattern_set_scrambling.search(line):
-                radio_settings['Scrambling'] = 'Enabled'
-
-            # TDMA Settings
-            if pattern_set_tdma_frame.search(line):
-                radio_settings['Frame size'] = pattern_set_tdma_frame.search(line).group(1)
-
-            if pattern_set_tdma_dist.search(line):
-                radio_settings['Distance'] = pattern_set_tdma_dist.search(line).group(1)
-
-            if pattern_set_tdma_dlp.search(line):
-                radio_settings['DL/UL ratio'] = pattern_set_tdma_dlp.search(line).group(1)
-
-            if pattern_set_tdma_target.search(line):
-                radio_settings['Target RSSI'] = pattern_set_tdma_target.search(line).group(1)
-
-            if pattern_set_tdma_tsync.search(line):
-                radio_settings['TSync'] = 'Enabled'
-
-            # MINT Settings
-            if pattern_set_polling.search(line):
-                radio_settings['Polling'] = 'Enabled'
+        RADIO_FIELDS.extract(settings_text, radio_settings)
 
         if radio_settings['Type'] == 'slave':
             radio_settings['Polling'] = None
@@ -320,61 +560,35 @@ def parse(dc_string, dc_list):
     # Master profile
     try:
         if radio_settings['Type'] == 'master':
-            radio_settings['Profile'] = {'M': deepcopy(radio_profile)}
+            radio_settings['Profile'] = {'M': RadioProfile()}
             profile = radio_settings['Profile']['M']
 
             # Master has always active and enabled profile
             profile['State'] = 'Active'
 
-            for line in settings_text:
-                if pattern_set_m_freq.search(line):
-                    profile['Frequency'] = pattern_set_m_freq.search(line).group(1)
-
-                if pattern_set_m_bitr.search(line):
-                    profile['Max bitrate'] = pattern_set_m_bitr.search(line).group(1)
-
-                if pattern_set_m_sid.search(line):
-                    profile['SID'] = pattern_set_m_sid.search(line).group(1)
-
-                if pattern_set_m_band.search(line):
-                    profile['Bandwidth'] = pattern_set_m_band.search(line).group(1)
-
-                if pattern_set_m_afbitr.search(line):
-                    if pattern_set_m_afbitr.search(line).group(1) == 'auto' \
-                            and pattern_set_m_afbitr_offset.search(line):
-                        profile['Auto bitrate'] = f'Enabled. Modification is ' \
-                                                  f'{pattern_set_m_afbitr_offset.search(line).group(2)}'
-                    elif pattern_set_m_afbitr.search(line).group(1) == 'auto':
-                        profile['Auto bitrate'] = 'Enabled'
-                    elif pattern_set_m_afbitr.search(line).group(1) == 'fixed':
-                        profile['Auto bitrate'] = f'Disabled. Fixed bitrate is {profile["Max bitrate"]}'
-
-                if pattern_set_m_mimo.search(line):
-                    profile['MIMO'] = str.upper(pattern_set_m_mimo.search(line).group(1))
-
-                if pattern_set_m_greenfield.search(line):
-                    profile['Greenfield'] = pattern_set_m_greenfield.search(line).group(2)
+            MASTER_PROFILE_FIELDS.extract(settings_text, profile)
 
         # Slave profiles
         else:
             # Find each string contains profile
-            pattern_profile = re.compile(r'mint rf5\.0 prof (\d+)')
             slices = []
             profiles_text = []
             for index, line in enumerate(settings_text):
-                if pattern_profile.search(line):
+                match = patterns.profile.search(line)
+                if match:
                     slices.append(index)
-                    profiles_text.append(pattern_profile.search(line).group(1))
+                    profiles_text.append(match.group(1))
             slices.append(slices[-1] + 5)
 
             # Slice the profile text by profiles
             profiles = dict(zip(profiles_text, slice_text(settings_text, slices)))
 
             # Parse each profile
-            radio_settings['Profile'] = {profile: deepcopy(radio_profile) for profile in profiles.keys()}
+            radio_settings['Profile'] = {profile: RadioProfile() for profile in profiles.keys()}
 
-            if pattern_set_s_state.findall(dc_string):
-                profile_active = str(pattern_set_s_state.findall(dc_string)[-1])
+            states = patterns.set_s_state.findall(dc_string)
+            if states:
+                profile_active = str(states[-1])
             else:
                 profile_active = list(radio_settings['Profile'].keys())[0]
 
@@ -382,244 +596,117 @@ def parse(dc_string, dc_list):
                 profile = radio_settings['Profile'][key]
                 if key == profile_active:
                     profile['State'] = 'Active'
-                for line in profiles[key]:
-                    if pattern_set_s_status.search(line):
-                        # Slave may have idle (not used at this moment) and disabled profiles
-                        profile['Status'] = 'Disabled'
-                        # Profile cannot be Active if it is disabled
-                        profile['State'] = 'Idle'
-
-                    if pattern_set_s_band.search(line):
-                        profile['Bandwidth'] = pattern_set_s_band.search(line).group(1)
-
-                    if pattern_set_s_freq.search(line):
-                        profile['Frequency'] = pattern_set_s_freq.search(line).group(1)
-
-                    if pattern_set_s_bitr.search(line):
-                        profile['Max bitrate'] = pattern_set_s_bitr.search(line).group(1)
-
-                    if pattern_set_s_sid.search(line):
-                        profile['SID'] = pattern_set_s_sid.search(line).group(1)
-
-                    if pattern_set_s_afbitr.search(line):
-                        if pattern_set_s_afbitr.search(line).group(1) == 'auto' \
-                                and pattern_set_s_afbitr_offset.search(line):
-                            profile['Auto bitrate'] = f'Enabled. Modification is ' \
-                                                      f'{pattern_set_s_afbitr_offset.search(line).group(2)}'
-                        elif pattern_set_s_afbitr.search(line).group(1) == 'auto':
-                            profile['Auto bitrate'] = 'Enabled'
-                        elif pattern_set_s_afbitr.search(line).group(1) == 'fixed':
-                            profile['Auto bitrate'] = f'Disabled. Fixed bitrate is {profile["Max bitrate"]}'
-
-                    if pattern_set_s_mimo.search(line):
-                        profile['MIMO'] = str.upper(pattern_set_s_mimo.search(line).group(1))
-
-                    if pattern_set_s_greenfield.search(line):
-                        profile['Greenfield'] = pattern_set_s_greenfield.search(line).group(1)
+                SLAVE_PROFILE_FIELDS.extract(profiles[key], profile)
 
     except:
         logger.warning('Radio settings were not parsed')
 
-    logger.debug(f'Radio Settings: {settings["Radio"]}')
+    logger.debug('Radio Settings: %s', settings['Radio'])
 
     # Switch Settings
     try:
-        pattern_start = re.compile(r'#MAC Switch config')
-        pattern_end = re.compile(r'#SNMP configuration')
-        pattern_set_sw = re.compile(r'switch start')
-        if pattern_set_sw.search(dc_string):
+        if patterns.set_sw.search(dc_string):
             switch_settings['Status'] = 'Enabled'
-            sw_settings_text_cut = cut_text(settings_text, pattern_start, pattern_end, 1, -1)
-            pattern_set_sw_id = re.compile(r'switch group (\d+) add')
+            sw_settings_text_cut = sections.cut('switch')
             slices = []
             groups = []
             for index, line in enumerate(sw_settings_text_cut):
-                if pattern_set_sw_id.search(line):
+                match = patterns.set_sw_id.search(line)
+                if match:
                     slices.append(index)
-                    groups.append(pattern_set_sw_id.search(line).group(1))
+                    groups.append(match.group(1))
             slices.append(len(sw_settings_text_cut))
 
             # Slice the profile text by profiles
             sw_settings_text = dict(zip(groups, slice_text(sw_settings_text_cut, slices)))
 
             # Find switch groups
-            switch_settings['Switch Group'] = {id: deepcopy(switch_group_settings) for id in sw_settings_text.keys()}
-
-            pattern_set_sw_order = re.compile(r'switch group \d+ add (\d+)')
-            pattern_set_sw_ifc = re.compile(r'switch group \d+ add \d+ (.+)')
-            pattern_set_sw_flood = re.compile(r'flood-unicast on')
-            pattern_set_sw_stp = re.compile(r'stp on')
-            pattern_set_sw_mode_trunk = re.compile(r'trunk on')
-            pattern_set_sw_mode_intrunk = re.compile(r'in-trunk (\d+)')
-            pattern_set_sw_mode_upstream = re.compile(r'upstream')
-            pattern_set_sw_mode_downstream = re.compile(r'downstream')
-            pattern_set_sw_rule = re.compile(r'switch group \d+ rule \d+\s+(permit|deny) match (\w+)')
-            pattern_set_sw_rule_list = re.compile(r'switch list (\w+) match add ([\w\d\-,\s\S]+)')
-            pattern_set_sw_rule_default = re.compile(r'switch group \d+ (deny|permit)')
-            pattern_set_sw_rule_vlan = re.compile(r'switch group \d+ (vlan [\d\-,]+)')
-            pattern_set_sw_mngt = re.compile(r'svi (\d+) group (\d+)')
-
-            rule_list = {}
-            for line in sw_settings_text_cut:
-                if pattern_set_sw_rule_list.search(line):
-                    pattern = pattern_set_sw_rule_list.search(line)
-                    rule_name = pattern.group(1)
-                    rule_list[rule_name] = pattern.group(2).replace('\'', '').replace('\r', '').replace('\n', '')
-
-            for key in switch_settings['Switch Group']:
-                group = switch_settings['Switch Group'][key]
-                check_rule = False
-                for line in sw_settings_text[key]:
-                    if pattern_set_sw_order.search(line):
-                        group['Order'] = pattern_set_sw_order.search(line).group(1)
-
-                    if pattern_set_sw_ifc.search(line):
-                        group['Interfaces'] = pattern_set_sw_ifc.search(line).group(1).split(' ')
-                        # Drop '\r'
-                        group['Interfaces'].pop()
-                        group['Interfaces'] = ', '.join(group['Interfaces'])
-
-                    if pattern_set_sw_flood.search(line):
-                        group['Flood'] = 'Enabled'
-
-                    if pattern_set_sw_stp.search(line):
-                        group['STP'] = 'Enabled'
-
-                    if pattern_set_sw_mode_trunk.search(line):
-                        group['Mode'] = 'Trunk'
-                    elif pattern_set_sw_mode_intrunk.search(line):
-                        group['Mode'] = f'In-Trunk {pattern_set_sw_mode_intrunk.search(line).group(1)}'
-                    elif pattern_set_sw_mode_upstream.search(line):
-                        group['Mode'] = 'Upstream'
-                    elif pattern_set_sw_mode_downstream.search(line):
-                        group['Mode'] = 'Downstream'
-
-                    if pattern_set_sw_rule_vlan.search(line):
-                        group['Rules'] = f'permit: {pattern_set_sw_rule_vlan.search(line).group(1)}; deny: any any'
-
-                    if pattern_set_sw_rule.search(line):
-                        rule_action = pattern_set_sw_rule.search(line).group(1)
-                        rule = pattern_set_sw_rule.search(line).group(2)
-                        check_rule = True
-
-                    if pattern_set_sw_rule_default.search(line):
-                        rule_default = pattern_set_sw_rule_default.search(line).group(1)
-
-                if check_rule:
-                    if rule in rule_list.keys():
-                        group['Rules'] = f'{rule_action}: {rule} ({rule_list[rule]}); {rule_default}: any any'
+            switch_settings['Switch Group'] = {id: SwitchGroup() for id in sw_settings_text.keys()}
+
+            rule_list = SWITCH_LIST_FIELDS.extract(sw_settings_text_cut, {})
+
+            for key, switch_group in switch_settings['Switch Group'].items():
+                SWITCH_GROUP_FIELDS.extract(sw_settings_text[key], switch_group)
+
+                rule = SWITCH_RULE_FIELDS.extract(sw_settings_text[key], {'Action': None, 'Rule': None,
+                                                                          'Default': None})
+                if rule['Action'] is not None:
+                    if rule['Rule'] in rule_list:
+                        switch_group['Rules'] = (f'{rule["Action"]}: {rule["Rule"]} ({rule_list[rule["Rule"]]}); '
+                                                 f'{rule["Default"]}: any any')
                     else:
-                        group['Rules'] = f'{rule_action}: {rule} ; {rule_default}: any any'
+                        switch_group['Rules'] = f'{rule["Action"]}: {rule["Rule"]} ; {rule["Default"]}: any any'
 
-            for line in sw_settings_text_cut:
-                if pattern_set_sw_mngt.search(line):
-                    group = pattern_set_sw_mngt.search(line).group(2)
-                    switch_settings['Switch Group'][group]['Management'] = 'Enabled'
+            SWITCH_MANAGEMENT_FIELDS.extract(sw_settings_text_cut, switch_settings['Switch Group'])
 
     except:
         logger.warning('Switch settings were not parsed')
 
-    logger.debug(f'Switch Settings: {settings["Switch"]}')
+    logger.debug('Switch Settings: %s', settings['Switch'])
 
     # Interface Settings
     try:
-        pattern_start = re.compile(r'#Interfaces parameters')
-        pattern_end = re.compile(r'#QoS manager')
-        ifc_settings_text = cut_text(settings_text, pattern_start, pattern_end, 1, -1)
+        ifc_settings_text = sections.cut('interfaces')
 
-        pattern_set_ifc = re.compile(r'ifc (eth\d+|rf5\.0)')
-        for line in ifc_settings_text:
-            if pattern_set_ifc.search(line):
-                interface = pattern_set_ifc.search(line).group(1)
-                if 'up' in line:
-                    settings['Interface Status'][interface] = 'up'
+        INTERFACE_FIELDS.extract(ifc_settings_text, settings['Interface Status'])
 
     except:
         logger.warning('Interface Settings were not parsed')
 
-    logger.debug(f'Interface Settings: {settings["Interface Status"]}')
+    logger.debug('Interface Settings: %s', settings['Interface Status'])
 
     # QoS Settings
     try:
-        pattern_start = re.compile(r'#QoS manager')
-        pattern_end = re.compile(r'#MINT configuration')
-        qm_settings_text_cut = cut_text(settings_text, pattern_start, pattern_end, 1, -1)
+        qm_settings_text_cut = sections.cut('qos')
 
-        pattern_set_qm_channel = re.compile(r'qm (ch\d+)')
         slices = []
         channels = []
         for index, line in enumerate(qm_settings_text_cut):
-            if pattern_set_qm_channel.search(line):
+            match = patterns.set_qm_channel.search(line)
+            if match:
                 slices.append(index)
-                channels.append(pattern_set_qm_channel.search(line).group(1))
+                channels.append(match.group(1))
         slices.append(len(qm_settings_text_cut))
         qm_settings_text = dict(zip(channels, slice_text(qm_settings_text_cut, slices)))
 
-        pattern_set_qm_options = re.compile(r'qm option ([\w\s]+)')
-
-        for line in qm_settings_text_cut:
-            if pattern_set_qm_options.search(line):
-                pattern = pattern_set_qm_options.search(line).group(1).replace('\r', '').replace('\n', '')
-                qos_settings['Options'] = pattern.replace(' ', ', ')
+        QOS_FIELDS.extract(qm_settings_text_cut, qos_settings)
 
         qos_settings['Rules'] = {channel: None for channel in qm_settings_text.keys()}
         for channel, text in qm_settings_text.items():
             qos_settings['Rules'][channel] = '; '.join(text).replace('\r', '').replace('\n', '')
 
-        pattern_start = re.compile(r"License 'Factory License'")
-        pattern_end = re.compile(r'</license>')
-        license_text = cut_text(dc_list, pattern_start, pattern_end, 0, -1)
+        license_text = sections.cut('license')
 
-        pattern_set_qm_throughput = re.compile(r'MaximumTransmitRate="(\d+)"')
-
-        qos_settings['License'] = {}
-        for line in license_text:
-            if pattern_set_qm_throughput.search(line):
-                qos_settings['License']['Throughput'] = pattern_set_qm_throughput.search(line).group(1)
+        qos_settings['License'] = LICENSE_FIELDS.extract(license_text, {})
 
     except:
         logger.warning('QoS settings were not parsed')
 
-    logger.debug(f'QoS Settings: {settings["QoS"]}')
+    logger.debug('QoS Settings: %s', settings['QoS'])
+
+    return settings
+
+
+def parse_radio_status(card):
+    """Parse the radio status (links, interference and medium load) of an R5000 card."""
+
+    sections = card.sections
+    firmware = card.firmware
 
     # Radio Status
-    link_status = {'Name': None, 'Level Rx': None, 'Level Tx': None, 'Bitrate Rx': None, 'Bitrate Tx': None,
-                   'Load Rx': None, 'Load Tx': None, 'PPS Rx': None, 'PPS Tx': None, 'Cost': None, 'Retry Rx': None,
-                   'Retry Tx': None, 'Power Rx': None, 'Power Tx': None, 'RSSI Rx': None, 'RSSI Tx': None,
-                   'SNR Rx': None, 'SNR Tx': None, 'Distance': None, 'Firmware': None, 'Uptime': None}
     radio_status = {'Links': None, 'Pulses': None, 'Interference Level': None, 'Interference RSSI': None,
                     'Interference PPS': None, 'RX Medium Load': None, 'TX Medium Load': None,
                     'Total Medium Busy': None, 'Excessive Retries': None, 'Aggr Full Retries': None,
                     'Current Frequency': None}
 
     try:
-        pattern_rs_mac = re.compile(r'(00[\dA-F]{10})')
-        pattern_rs_prf = re.compile(r'(join|prf)')
-        pattern_rs_name = re.compile(r'[\.\d]+\s+([\w\d\S \-]+)\s+00[\dA-F]{10}')
-        pattern_rs_spaces = re.compile(r"(\s{2,})")
-        pattern_rs_level = re.compile(r'00[\w\d]+\s+(\d+)/(\d+)')
-        pattern_rs_bitrate = re.compile(r'00[\w\d]+\s+\d+/\d+\s+(\d+)/(\d+)')
-        pattern_rs_retry = re.compile(r'00[\w\d]+\s+\d+/\d+\s+\d+/\d+\s+(\d+)/(\d+)')
-        pattern_rs_load = re.compile(r'load (\d+)/(\d+)')
-        pattern_rs_pps = re.compile(r'pps (\d+)/(\d+)')
-        pattern_rs_cost = re.compile(r'cost ([\-\d+\.]+)')
-        pattern_rs_pwr = re.compile(r'pwr ([\*\-\d+\.]+)/([\*\-\d+\.]+)')
-        pattern_rs_rssi = re.compile(r'rssi ([\*\-\d+\.]+)/([\*\-\d+\.]+)')
-        pattern_rs_rssi_rf_scanner = re.compile(r'\d+\/([\-\d]+)')
-        pattern_rs_snr = re.compile(r'snr (\d+)/(\d+)')
-        pattern_rs_distance = re.compile(r'dist ([\.\d+]+)')
-        pattern_rs_firmware = re.compile(r'(H\d{2}v[v\d.]+)')
-        pattern_rs_uptime = re.compile(r'up ([\d\w :]*)')
-
         # Find mint map det text
-        pattern_start = re.compile(r'Id\s+Name\s+Node\s+Level')
-        pattern_end = re.compile(r'Total nodes in area')
-        links_text = cut_text(dc_list, pattern_start, pattern_end, 1, -1)
+        links_text = sections.cut('links')
 
         # Find each string contains MAC
         slices = []
         for index, line in enumerate(links_text):
-            if pattern_rs_mac.search(line):
+            if patterns.rs_mac.search(line):
                 slices.append(index)
         slices.append(len(links_text))
 
@@ -628,157 +715,59 @@ def parse(dc_string, dc_list):
         # Need to remove prf and join links
         temp = []
         for link in links:
-            if not pattern_rs_prf.search(link[0]):
+            if not patterns.rs_prf.search(link[0]):
                 temp.append(link)
         links = temp
 
         # Create dictionary from the links arrange. MAC-addresses are keys
-        radio_status['Links'] = {mac: deepcopy(link_status) for mac in
-                                 [pattern_rs_mac.search(link[0]).group(1) for link in links]}
-
-        # Fill the link_status variable for each link
-        for mac in radio_status['Links']:
-            for index, link in enumerate(links):
-                if mac == pattern_rs_mac.search(link[0]).group(1):
-                    link = ''.join(link)
-
-                    name = pattern_rs_name.search(link).group(1)
-                    spaces = pattern_rs_spaces.search(name).group(1)
-                    radio_status['Links'][mac]['Name'] = name.replace(spaces, '')
-
-                    if pattern_rs_level.search(link):
-                        radio_status['Links'][mac]['Level Rx'] = pattern_rs_level.search(link).group(1)
-                        radio_status['Links'][mac]['Level Tx'] = pattern_rs_level.search(link).group(2)
-                    else:
-                        logger.debug(f'Link {mac}: Level was not parsed')
-
-                    if pattern_rs_bitrate.search(link):
-                        radio_status['Links'][mac]['Bitrate Rx'] = pattern_rs_bitrate.search(link).group(1)
-                        radio_status['Links'][mac]['Bitrate Tx'] = pattern_rs_bitrate.search(link).group(2)
-                    else:
-                        logger.debug(f'Link {mac}: Bitrate was not parsed')
-
-                    if pattern_rs_retry.search(link):
-                        radio_status['Links'][mac]['Retry Rx'] = pattern_rs_retry.search(link).group(1)
-                        radio_status['Links'][mac]['Retry Tx'] = pattern_rs_retry.search(link).group(2)
-                    else:
-                        logger.debug(f'Link {mac}: Retry was not parsed')
-
-                    if pattern_rs_load.search(link):
-                        radio_status['Links'][mac]['Load Rx'] = pattern_rs_load.search(link).group(1)
-                        radio_status['Links'][mac]['Load Tx'] = pattern_rs_load.search(link).group(2)
-                    else:
-                        logger.debug(f'Link {mac}: Load was not parsed')
-
-                    if pattern_rs_pps.search(link):
-                        radio_status['Links'][mac]['PPS Rx'] = pattern_rs_pps.search(link).group(1)
-                        radio_status['Links'][mac]['PPS Tx'] = pattern_rs_pps.search(link).group(2)
-                    else:
-                        logger.debug(f'Link {mac}: PPS was not parsed')
-
-                    if pattern_rs_cost.search(link):
-                        radio_status['Links'][mac]['Cost'] = pattern_rs_cost.search(link).group(1)
-                    else:
-                        logger.debug(f'Link {mac}: Cost was not parsed')
-
-                    if pattern_rs_pwr.search(link):
-                        radio_status['Links'][mac]['Power Rx'] = pattern_rs_pwr.search(link).group(1)
-                        radio_status['Links'][mac]['Power Tx'] = pattern_rs_pwr.search(link).group(2)
-                    else:
-                        logger.debug(f'Link {mac}: Power was not parsed')
-
-                    if pattern_rs_snr.search(link):
-                        radio_status['Links'][mac]['SNR Rx'] = pattern_rs_snr.search(link).group(1)
-                        radio_status['Links'][mac]['SNR Tx'] = pattern_rs_snr.search(link).group(2)
-                    else:
-                        logger.debug(f'Link {mac}: SNR was not parsed')
+        macs = [patterns.rs_mac.search(link[0]).group(1) for link in links]
+        radio_status['Links'] = {mac: LinkStatus() for mac in macs}
 
-                    if pattern_rs_distance.search(link):
-                        radio_status['Links'][mac]['Distance'] = pattern_rs_distance.search(link).group(1)
-                    else:
-                        logger.debug(f'Link {mac}: Distance was not parsed')
+        # Fill the link status in for each link
+        for mac, link in zip(macs, links):
+            link = ''.join(link)
 
-                    if pattern_rs_firmware.search(link):
-                        radio_status['Links'][mac]['Firmware'] = pattern_rs_firmware.search(link).group(1)
-                    else:
-                        logger.debug(f'Link {mac}: Firmware was not parsed')
+            name = patterns.rs_name.search(link).group(1)
+            spaces = patterns.rs_spaces.search(name).group(1)
+            radio_status['Links'][mac]['Name'] = name.replace(spaces, '')
 
-                    if pattern_rs_uptime.search(link):
-                        radio_status['Links'][mac]['Uptime'] = pattern_rs_uptime.search(link).group(1)
-                    else:
-                        logger.debug(f'Link {mac}: Uptime was not parsed')
+            LINK_FIELDS.extract([link], radio_status['Links'][mac])
+            if 'TDMA' in firmware:
+                LINK_RSSI_FIELDS.extract([link], radio_status['Links'][mac])
 
-                    # MINT firmare does not contain RSSI in the mint map det text
-                    if 'TDMA' in firmware and pattern_rs_rssi.search(link):
-                        radio_status['Links'][mac]['RSSI Rx'] = pattern_rs_rssi.search(link).group(1)
-                        radio_status['Links'][mac]['RSSI Tx'] = pattern_rs_rssi.search(link).group(2)
-                    elif 'TDMA' in firmware and pattern_rs_rssi.search(link):
-                        logger.debug(f'Link {mac}: RSSI was not parsed')
+            for part, field in LINK_PARTS:
+                if radio_status['Links'][mac][field] is None:
+                    logger.debug('Link %s: %s was not parsed', mac, part)
 
-        pattern_start = re.compile(r'rf5.0 Source Analysis')
-        pattern_end = re.compile(r'rf5.0: NOL is empty')
-        rf_scanner_text = cut_text(dc_list, pattern_start, pattern_end, 2, 0)
+        rf_scanner_text = sections.cut('rf_scanner')
 
         # Get RSSI from muffer (MINT only)
-        for mac in radio_status['Links']:
+        if 'MINT' in firmware:
             for line in rf_scanner_text:
-                if pattern_rs_mac.search(line) \
-                        and mac == pattern_rs_mac.search(line).group(1) \
-                        and 'MINT' in firmware:
-                    radio_status['Links'][mac]['RSSI Rx'] = pattern_rs_rssi_rf_scanner.search(line).group(1)
+                pattern = patterns.rs_mac.search(line)
+                if pattern and pattern.group(1) in radio_status['Links']:
+                    radio_status['Links'][pattern.group(1)]['RSSI Rx'] = \
+                        patterns.rs_rssi_rf_scanner.search(line).group(1)
 
         # Fill the radio_status variable
-        pattern_rs_pulses = re.compile(r'Pulses: (\d+)')
-        pattern_rs_pulses_level = re.compile(r'level\s+(\d+)')
-        pattern_rs_pulses_rssi = re.compile(r'level\s+\d+\s+\(([\-\d]+)\)')
-        pattern_rs_pulses_pps = re.compile(r'pps ([\.\d]+)')
-        pattern_rs_rx_load = re.compile(r'RX Medium Load\s+([\d\.]+%)')
-        pattern_rs_tx_load = re.compile(r'TX Medium Load\s+([\d\.]+%)')
-        pattern_rs_total_load = re.compile(r'Total Medium Busy\s+([\d\.]+%)')
-        pattern_rs_ex_retries = re.compile(r'Excessive Retries\s+(\d+)')
-        pattern_rs_af_retries = re.compile(r'Aggr Full Retries\s+(\d+)')
-        pattern_rs_cur_freq = re.compile(r'\(band \d+, freq (\d+)\)')
-
-        for line in rf_scanner_text:
-            if pattern_rs_pulses.search(line):
-                radio_status['Pulses'] = pattern_rs_pulses.search(line).group(1)
-
-            if pattern_rs_pulses_level.search(line):
-                radio_status['Interference Level'] = pattern_rs_pulses_level.search(line).group(1)
+        RF_SCANNER_FIELDS.extract(rf_scanner_text, radio_status)
 
-            if pattern_rs_pulses_rssi.search(line):
-                radio_status['Interference RSSI'] = pattern_rs_pulses_rssi.search(line).group(1)
+        rf_stat_text = sections.cut('rf_statistics')
 
-            if pattern_rs_pulses_pps.search(line):
-                radio_status['Interference PPS'] = pattern_rs_pulses_pps.search(line).group(1)
+        RF_STATISTICS_FIELDS.extract(rf_stat_text, radio_status)
 
-        pattern_start = re.compile(r'rf5.0 Statistics')
-        pattern_end = re.compile(r'Software Priority Queues')
-        rf_stat_text = cut_text(dc_list, pattern_start, pattern_end, 3, -2)
-
-        for line in rf_stat_text:
-            if pattern_rs_rx_load.search(line):
-                radio_status['RX Medium Load'] = pattern_rs_rx_load.search(line).group(1)
-
-            if pattern_rs_tx_load.search(line):
-                radio_status['TX Medium Load'] = pattern_rs_tx_load.search(line).group(1)
-
-            if pattern_rs_total_load.search(line):
-                radio_status['Total Medium Busy'] = pattern_rs_total_load.search(line).group(1)
+    except:
+        logger.warning('Radio Status was not parsed')
 
-            if pattern_rs_ex_retries.search(line):
-                radio_status['Excessive Retries'] = pattern_rs_ex_retries.search(line).group(1)
+    logger.debug('Radio Status: %s', radio_status)
 
-            if pattern_rs_af_retries.search(line):
-                radio_status['Aggr Full Retries'] = pattern_rs_af_retries.search(line).group(1)
+    return radio_status
 
-            if pattern_rs_cur_freq.search(line):
-                radio_status['Current Frequency'] = pattern_rs_cur_freq.search(line).group(1)
 
-    except:
-        logger.warning('Radio Status was not parsed')
+def parse_ethernet_status(card):
+    """Parse the ethernet status of an R5000 card."""
 
-    logger.debug(f'Radio Status: {radio_status}')
+    sections = card.sections
 
     # Ethernet Status
     ethernet_statuses = {'Status': 'down', 'Speed': None, 'Duplex': None, 'Negotiation': None, 'Rx CRC': 0,
@@ -786,9 +775,7 @@ def parse(dc_string, dc_list):
     ethernet_status = {'eth0': ethernet_statuses, 'eth1': deepcopy(ethernet_statuses)}
 
     try:
-        pattern_start = re.compile(r'eth0: flags=')
-        pattern_end = re.compile(r'Name\s+Network')
-        ifc_stat_text = cut_text(dc_list, pattern_start, pattern_end, 0, -2)
+        ifc_stat_text = sections.cut('ethernet')
 
         slices = []
         for index, line in enumerate(ifc_stat_text):
@@ -801,59 +788,34 @@ def parse(dc_string, dc_list):
 
         interfaces_text = slice_text(ifc_stat_text, slices)
 
-        # Parse interfaces
-        pattern_es_ifc = re.compile(r'([\w\d]+): flags')
-        pattern_es_status = re.compile(r'Physical link is (\w+)')
-        pattern_es_speed = re.compile(r'Physical link is \w+, (\d+) Mbps')
-        pattern_es_duplex = re.compile(r'Physical link is \w+, \d+ Mbps\s+(\w+)-duplex')
-        pattern_es_autoneg = re.compile(r'Physical link is \w+, \d+ Mbps\s+\w+-duplex, (\w+)')
-        pattern_es_crc = re.compile(r'CRC errors\s+(\d+)')
-
+        # Parse interfaces, the lines after "<interface>: flags" are of the interface
         for interface_text in interfaces_text:
             for line in interface_text:
-                if pattern_es_ifc.search(line):
-                    interface = pattern_es_ifc.search(line).group(1)
+                if ': flags' in line:
+                    interface = patterns.es_ifc.search(line).group(1)
 
-                if pattern_es_status.search(line):
-                    ethernet_status[interface]['Status'] = str.lower(pattern_es_status.search(line).group(1))
+                ETHERNET_FIELDS.extract([line], ethernet_status[interface])
 
-                if pattern_es_speed.search(line):
-                    ethernet_status[interface]['Speed'] = pattern_es_speed.search(line).group(1)
+    except:
+        logger.warning('Ethernet Status was not parsed')
 
-                if pattern_es_duplex.search(line):
-                    ethernet_status[interface]['Duplex'] = pattern_es_duplex.search(line).group(1)
+    logger.debug('Ethernet Status: %s', ethernet_status)
 
-                if pattern_es_autoneg.search(line):
-                    ethernet_status[interface]['Negotiation'] = pattern_es_autoneg.search(line).group(1)
+    return ethernet_status
 
-                if len(pattern_es_crc.findall(line)) == 2:
-                    ethernet_status[interface]['Rx CRC'] = pattern_es_crc.findall(line)[0]
-                    ethernet_status[interface]['Tx CRC'] = pattern_es_crc.findall(line)[1]
-                elif len(pattern_es_crc.findall(line)) == 1:
-                    ethernet_status[interface]['Rx CRC'] = pattern_es_crc.findall(line)[0]
-                    ethernet_status[interface]['Tx CRC'] = 0
 
-    except:
-        logger.warning('Ethernet Status was not parsed')
+def parse_switch_status(card):
+    """Parse the switch status of an R5000 card."""
 
-    logger.debug(f'Ethernet Status: {ethernet_status}')
+    sections = card.sections
 
     # Switch Status
+    switch_status = {}
+
     try:
-        pattern_start = re.compile(r'Switch statistics:')
-        pattern_end = re.compile(r'DB Records')
-        sw_stat_text = ''.join(cut_text(dc_list, pattern_start, pattern_end, 6, -2))
-
-        pattern_ss_stat = re.findall(r'(\d+)\s+'
-                             r'>?(\d+)\s+'
-                             r'>?(\d+)\s+'
-                             r'>?(\d+)\s+'
-                             r'>?(\d+)\s+'
-                             r'>?(\d+)\s+'
-                             r'>?(\d+)\s+'
-                             r'>?(\d+)\s+'
-                             r'>?(\d+)\s+'
-                             r'>?(\d+)', sw_stat_text)
+        sw_stat_text = ''.join(sections.cut('switch_status'))
+
+        pattern_ss_stat = patterns.ss_stat.findall(sw_stat_text)
 
         switch_status = {pattern_ss_stat[id][0]: sw_group[1:] for id, sw_group in enumerate(pattern_ss_stat)}
         for id, status in switch_status.items():
@@ -870,15 +832,23 @@ def parse(dc_string, dc_list):
     except:
         logger.warning('Switch Status was not parsed')
 
-    logger.debug(f'Switch Status: {switch_status}')
+    logger.debug('Switch Status: %s', switch_status)
+
+    return switch_status
+
+
+def parse_qos_status(card):
+    """Parse the QoS status of an R5000 card."""
+
+    sections = card.sections
 
     # QoS status
+    qos_status = {}
+
     try:
-        pattern_start = re.compile(r'Software Priority Queues rf5.0')
-        pattern_end = re.compile(r'Phy errors: total \d+')
-        qos_stat_text = ''.join(cut_text(dc_list, pattern_start, pattern_end, 0, 1))
+        qos_stat_text = ''.join(sections.cut('qos_status'))
 
-        pattern_qs_stat = re.findall(r'(q\d+)\s+(\((P\d+)\))?(\s+\(cos\d\))?\s+(\d+)\s+\/\s+(\d+)?', qos_stat_text)
+        pattern_qs_stat = patterns.qs_stat.findall(qos_stat_text)
         qos_status = {channel[0]: channel[2:] for channel in pattern_qs_stat}
         for channel, status in qos_status.items():
             qos_status[channel] = {}
@@ -891,15 +861,9 @@ def parse(dc_string, dc_list):
     except:
         logger.warning('QoS status was not parsed')
 
-    logger.debug(f'QoS Status: {qos_status}')
+    logger.debug('QoS Status: %s', qos_status)
 
-    # Prepare result to create a class instance
-    result = (model, subfamily, serial_number, firmware,
-              uptime, reboot_reason, dc_list, dc_string,
-              settings, radio_status, ethernet_status,
-              switch_status, qos_status)
-
-    return result
+    return qos_status
 
 
 logger = logging.getLogger('logger.parser_r5000')
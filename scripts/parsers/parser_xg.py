@@ -1,10 +1,151 @@
 # -*- coding: utf-8 -*-
 
 import logging
-import re
 from copy import deepcopy
 from time import time
 
+from scripts.parsers.dc_fields import Field, FieldSet, constant, group
+from scripts.parsers.dc_patterns import compile_patterns
+from scripts.parsers.dc_sections import Section
+
+
+# WANFleX hardware codes parsed by the module ("# <platform> WANFleX H<code>" in the header)
+HARDWARE = ('12',)
+
+SECTIONS = {
+    'settings': Section(r'==\[\s+config show\s+\]', r'==\[\s+xg stat\s+\]', 2, 0),
+    'radio': Section(r'==\[\s+xg stat\s+\]', r'==\[\s+ctl\s+\]', 1, -1),
+    'ethernet': Section(r'==\[\s+ifc -a\s+\]', r'==\[\s+sys info -full\s+\]', 1, -1),
+    'panic': Section(r'==\[\s+panic show\s+\]', r'==\[\s+sys log show\s+\]', 1, -1),
+}
+
+
+patterns = compile_patterns(
+    'xg',
+    # General info
+    g_fw=r'H\d{2}S\d{2}[v\d.-]+',
+    g_model=r'([XU]m/\dX?.\d{3,4}.\dx\d{3})(.2x\d{2})?',
+    g_sn=r'SN:(\d+)',
+    g_uptime=r'Uptime: ([\d\w :]*)',
+    g_reboot_reason=r'Last reboot reason: ([\w ]*)',
+
+    # Settings
+    set_role=r'xg -type( |=)(\w+)',
+    set_band=r'xg -channel-width( |=)(\d+)',
+    set_freq_dl_xg=r'xg -freq-dl (\d+)',
+    set_freq_ul_xg=r'xg -freq-ul (\d+)',
+    set_freq_dl_xg1k=r'xg -freq-dl \[0\](\d+),\[1\](\d+)',
+    set_freq_ul_xg1k=r'xg -freq-ul \[0\](\d+),\[1\](\d+)',
+    set_scp=r'xg -short-cp (1)',
+    set_max_dist=r'xg -max-distance( |=)(\d+)',
+    set_frame=r'xg -sframelen( |=)(\d+)',
+    set_pwr=r'xg -txpwr( |=)(\[0\])?([\-\d]+)(,(\[1\])?([\-\d]+))?',
+    set_cbb=r'xg -ctrl-block-boost (1)',
+    set_atpc=r'xg -atpc-master-enable (1)',
+    set_amc=r'xg -amc-strategy( |=)(\w+)',
+    set_mcs=r'xg -max-mcs (\d+)',
+    set_idfs=r'xg -idfs-enable (1)',
+    set_tp=r'xg -traffic-prioritization (1)',
+    set_ifc=r'ifc (ge\d|sfp|radio)',
+    set_adlp=r'-tdd-profile-auto-switching (1)',
+    set_dlp=r'DL/UL Ratio\s+\|(\d+/\d+)',
+
+    # Radio status
+    carrier=r'\|\s+Carrier (\d)',
+    rs_status=r'Wireless Link( status)?\s+\|(\w+)',
+    rs_dist=r'Distance\s+\|(\d+)\s+(meters)?',
+    rs_freq=r'(\d+)( MHz)?',
+    rs_accfer=r'\(([\.\d]+)%\)',
+    rs_pwr=r'([\.\-\d]+)',
+    rs_gain=r'([\.\-\d]+)',
+    rs_mcs=r'((QPSK|QAM)(\d+)? \d+/\d+) \(\d+\)',
+    rs_cinr=r'([\.\-\d]+)',
+    rs_rssi=r'([\.\-\d]+) dBm',
+    rs_crosstalk=r'([\.\-\d]+)',
+    rs_tber=r'\(([\.\d]+)%\)',
+
+    # Ethernet status
+    es_ifc=r'([\w\d]+): flags',
+    es_link=r'Physical link is (\w+)(?:, (\d+) Mbps(?:\s+(\w+)-duplex(?:, (\w+))?)?)?',
+    es_crc=r'CRC errors\s+(\d+)',
+
+    # Panic
+    panic=r'Panic info : \[\w+\]: case "(\w+)"',
+    panic_assert=r'Panic info : \[\w+\]: (ASS.+)',
+)
+
+# Carrier fields of "xg stat": (line prefix, pattern, field, group of the findall result or None, stream field)
+# The local values are followed by the remote ones; only the local values are present if the link is down
+RADIO_FIELDS = (
+    ('|Tx/Rx Frequency', patterns.rs_freq, 'Frequency', 0, False),
+    ('|Rx Acc FER', patterns.rs_accfer, 'Rx Acc FER', None, False),
+    ('|    |Power', patterns.rs_pwr, 'Tx Power', None, True),
+    ('|    |Gain', patterns.rs_gain, 'Tx Gain', None, True),
+    ('|RX  |MCS', patterns.rs_mcs, 'MCS', 0, True),
+    ('|    |CINR', patterns.rs_cinr, 'CINR', None, True),
+    ('|    |RSSI', patterns.rs_rssi, 'RSSI', None, True),
+    ('|    |Crosstalk', patterns.rs_crosstalk, 'Crosstalk', None, True),
+    ('|    |Errors Ratio', patterns.rs_tber, 'Errors Ratio', None, True),
+    ('|    |TBER', patterns.rs_tber, 'Errors Ratio', None, True),
+    ('|    |Acc TBER', patterns.rs_tber, 'Errors Ratio', None, True),
+)
+
+# Fields of "xg stat" outside of the carriers
+RADIO_STATUS_FIELDS = FieldSet(
+    Field('Wireless Link', patterns.rs_status, ('Link status',), group(2)),
+    Field('Distance', patterns.rs_dist, ('Measured Distance',)),
+)
+
+# Fields of "config show": Field(trigger, pattern, target path in settings, converter)
+SETTINGS_FIELDS = FieldSet(
+    Field('xg -type', patterns.set_role, ('Role',), group(2)),
+    Field('xg -channel-width', patterns.set_band, ('Bandwidth',), group(2)),
+    Field('xg -freq-dl ', patterns.set_freq_dl_xg, ('DL Frequency', 'Carrier 0')),
+    Field('xg -freq-ul ', patterns.set_freq_ul_xg, ('UL Frequency', 'Carrier 0')),
+    Field('xg -freq-dl [0]', patterns.set_freq_dl_xg1k, ('DL Frequency', 'Carrier 0')),
+    Field('xg -freq-dl [0]', patterns.set_freq_dl_xg1k, ('DL Frequency', 'Carrier 1'), group(2)),
+    Field('xg -freq-ul [0]', patterns.set_freq_ul_xg1k, ('UL Frequency', 'Carrier 0')),
+    Field('xg -freq-ul [0]', patterns.set_freq_ul_xg1k, ('UL Frequency', 'Carrier 1'), group(2)),
+    Field('xg -short-cp 1', patterns.set_scp, ('Short CP',), constant('Enabled')),
+    Field('xg -max-distance', patterns.set_max_dist, ('Max distance',), group(2)),
+    Field('xg -sframelen', patterns.set_frame, ('Frame size',), group(2)),
+    Field('xg -txpwr', patterns.set_pwr, ('Tx Power',),
+          lambda match, record: max(match.group(3), match.group(6)) if match.group(6) else match.group(3)),
+    Field('xg -ctrl-block-boost 1', patterns.set_cbb, ('Control Block Boost',), constant('Enabled')),
+    Field('xg -atpc-master-enable 1', patterns.set_atpc, ('ATPC',), constant('Enabled')),
+    Field('xg -amc-strategy', patterns.set_amc, ('AMC Strategy',), group(2)),
+    Field('xg -max-mcs ', patterns.set_mcs, ('Max MCS',)),
+    Field('xg -idfs-enable 1', patterns.set_idfs, ('IDFS',), constant('Enabled')),
+    Field('xg -traffic-prioritization 1', patterns.set_tp, ('Traffic prioritization',), constant('Enabled')),
+    Field('ifc ', patterns.set_ifc, ('Interface Status', 1),
+          lambda match, record: 'up' if 'up' in match.string else None),
+    Field('-tdd-profile-auto-switching 1', patterns.set_adlp, ('ADLP',), constant('Enabled')),
+)
+
+
+def crc_errors(match, status):
+    """Fill the Tx CRC errors in and return the Rx ones (the line is searched once), Tx is 0 if the line has only Rx."""
+
+    errors = match.re.findall(match.string)
+    status['Tx CRC'] = errors[1] if len(errors) > 1 else 0
+    return errors[0]
+
+
+# Fields of an interface of "ifc -a"
+ETHERNET_FIELDS = FieldSet(
+    Field('Physical link is ', patterns.es_link, ('Status',), lambda match, status: str.lower(match.group(1))),
+    Field('Physical link is ', patterns.es_link, ('Speed',), group(2)),
+    Field('Physical link is ', patterns.es_link, ('Duplex',), group(3)),
+    Field('Physical link is ', patterns.es_link, ('Negotiation',), group(4)),
+    Field('CRC errors', patterns.es_crc, ('Rx CRC',), crc_errors),
+)
+
+# Fields of "panic show": the cases and the asserts are the keys of a dict
+PANIC_FIELDS = FieldSet(
+    Field(']: case "', patterns.panic, (1,), constant(True)),
+    Field(']: ASS', patterns.panic_assert, (1,), constant(True)),
+)
+
 
 def timer(function):
     """Estimate time"""
@@ -17,6 +158,26 @@ def timer(function):
     return wrapper
 
 
+def slice_text(text, slices):
+    """Slice text by line index
+    Input -  text and a list with position of rows (indexes)
+    Output - a list contains the sliced text (from position to position in accordance with the input list)
+    """
+    new_text = []
+    for index, slice in enumerate(slices):
+        try:
+            text_start = slices[index]
+            text_end = slices[index + 1]
+        except IndexError:
+            # Index + 1 cannot be performed for the last element in the arrange
+            text_end = slices[index]
+        finally:
+            new_text.append(text[text_start:text_end])
+    # Drop the element created in the exception
+    new_text.pop()
+    return new_text
+
+
 @timer
 def parse(dc_string, dc_list):
     """Parse a XG diagnostic card and fill the class instance in.
@@ -31,8 +192,10 @@ def parse(dc_string, dc_list):
     firmware (type str) - an installed firmware
     uptime (type str) - device's uptime
     reboot_reason (type str) - a last reboot reason
-    dc_list (type list) - a diagnostic card text as a list (array of strings divided by \n)
+    dc_list (type DiagnosticLines) - a diagnostic card text as a sequence of lines (strings divided by \n)
     dc_string (type str) - a diagnostic card text as a string (whole text in the string)
+
+    The next variables are parsed by parse_<variable>(card) when the card attribute is requested first time:
     settings (type dict) - all important settings (in more detail below)
     radio_status (type dict) - information about all wireless links (in more detail below)
     ethernet_status (type dict) - information about all wire links (in more detail below)
@@ -97,57 +260,15 @@ def parse(dc_string, dc_list):
     Example of request: ethernet_status['ge0']['Speed']
     """
 
-    def cut_text(dc_list, pattern_start, pattern_end, offset_start, offset_end):
-        """Cut text from patter_start to pattern_end
-        Input - text, patterns - re.compile, offsets - int
-        Output - a list with the cut text
-        """
-        try:
-            for index, line in enumerate(dc_list):
-                if pattern_start.search(line):
-                    text_start = index + offset_start
-                if pattern_end.search(line):
-                    text_end = index + offset_end
-            text = dc_list[text_start:text_end]
-        except:
-            text = dc_list
-            logger.warning(f'Text has not been cut. Patterns: {pattern_start} - {pattern_end}')
-        return text
-
-    def slice_text(text, slices):
-        """Slice text by line index
-        Input -  text and a list with position of rows (indexes)
-        Output - a list contains the sliced text (from position to position in accordance with the input list)
-        """
-        new_text = []
-        for index, slice in enumerate(slices):
-            try:
-                text_start = slices[index]
-                text_end = slices[index + 1]
-            except IndexError:
-                # Index + 1 cannot be performed for the last element in the arrange
-                text_end = slices[index]
-            finally:
-                new_text.append(text[text_start:text_end])
-        # Drop the element created in the exception
-        new_text.pop()
-        return new_text
-
-
     # General info
     try:
         general_text = ''.join(dc_list[:20])
 
-        pattern_g_fw = re.compile(r'H\d{2}S\d{2}[v\d.-]+')
-        pattern_g_model = re.compile(r'([XU]m/\dX?.\d{3,4}.\dx\d{3})(.2x\d{2})?')
-        pattern_g_sn = re.compile(r'SN:(\d+)')
-        pattern_g_uptime = re.compile(r'Uptime: ([\d\w :]*)')
-        pattern_g_reboot_reason = re.compile(r'Last reboot reason: ([\w ]*)')
-
-        if pattern_g_fw.search(general_text):
-            firmware = pattern_g_fw.search(general_text).group()
+        match = patterns.g_fw.search(general_text)
+        if match:
+            firmware = match.group()
 
-        pattern = pattern_g_model.search(general_text)
+        pattern = patterns.g_model.search(general_text)
         if pattern:
             model = pattern.group()
             if '500.2x500' in model or '500.2x200' in model:
@@ -158,20 +279,37 @@ def parse(dc_string, dc_list):
                 model = 'XG Unknown model'
                 subfamily = 'XG 500'
 
-        if pattern_g_sn.search(general_text):
-            serial_number = pattern_g_sn.search(general_text).group(1)
+        match = patterns.g_sn.search(general_text)
+        if match:
+            serial_number = match.group(1)
 
-        if pattern_g_uptime.search(general_text):
-            uptime = pattern_g_uptime.search(general_text).group(1)
+        match = patterns.g_uptime.search(general_text)
+        if match:
+            uptime = match.group(1)
 
-        if pattern_g_reboot_reason.search(general_text):
-            reboot_reason = pattern_g_reboot_reason.search(general_text).group(1)
+        match = patterns.g_reboot_reason.search(general_text)
+        if match:
+            reboot_reason = match.group(1)
 
     except:
         logger.warning('General info was not parsed')
 
-    logger.debug(f'General info: Firmware - {firmware}, Model - {model}, Subfamily - {subfamily}, '
-                 f'SN - {serial_number}, Uptime - {uptime}, Last reboot reason - {reboot_reason}')
+    logger.debug('General info: Firmware - %s, Model - %s, Subfamily - %s, '
+                 'SN - %s, Uptime - %s, Last reboot reason - %s',
+                 firmware, model, subfamily, serial_number, uptime, reboot_reason)
+
+    # Prepare result to create a class instance
+    result = (model, subfamily, serial_number, firmware,
+              uptime, reboot_reason, dc_list, dc_string)
+
+    return result
+
+
+def parse_settings(card):
+    """Parse the settings of a XG card."""
+
+    sections = card.sections
+    dc_string = card.dc_string
 
     # Settings
     settings = {'Role': None, 'Bandwidth': None, 'DL Frequency': {'Carrier 0': None, 'Carrier 1': None},
@@ -183,103 +321,29 @@ def parse(dc_string, dc_list):
 
     try:
         # Find "conf show"
-        pattern_start = re.compile(r'==\[\s+config show\s+\]')
-        pattern_end = re.compile(r'==\[\s+xg stat\s+\]')
-        settings_text = cut_text(dc_list, pattern_start, pattern_end, 2, 0)
+        settings_text = sections.cut('settings')
 
         # Parse settings
-        pattern_set_role = re.compile(r'xg -type( |=)(\w+)')
-        pattern_set_band = re.compile(r'xg -channel-width( |=)(\d+)')
-        pattern_set_freq_dl_xg = re.compile(r'xg -freq-dl (\d+)')
-        pattern_set_freq_ul_xg = re.compile(r'xg -freq-ul (\d+)')
-        pattern_set_freq_dl_xg1k = re.compile(r'xg -freq-dl \[0\](\d+),\[1\](\d+)')
-        pattern_set_freq_ul_xg1k = re.compile(r'xg -freq-ul \[0\](\d+),\[1\](\d+)')
-        pattern_set_scp = re.compile(r'xg -short-cp (1)')
-        pattern_set_max_dist = re.compile(r'xg -max-distance( |=)(\d+)')
-        pattern_set_frame = re.compile(r'xg -sframelen( |=)(\d+)')
-        pattern_set_pwr = re.compile(r'xg -txpwr( |=)(\[0\])?([\-\d]+)(,(\[1\])?([\-\d]+))?')
-        pattern_set_cbb = re.compile(r'xg -ctrl-block-boost (1)')
-        pattern_set_atpc = re.compile(r'xg -atpc-master-enable (1)')
-        pattern_set_amc = re.compile(r'xg -amc-strategy( |=)(\w+)')
-        pattern_set_mcs = re.compile(r'xg -max-mcs (\d+)')
-        pattern_set_idfs = re.compile(r'xg -idfs-enable (1)')
-        pattern_set_tp = re.compile(r'xg -traffic-prioritization (1)')
-        pattern_set_ifc = re.compile(r'ifc (ge\d|sfp|radio)')
-        pattern_set_adlp = re.compile(r'-tdd-profile-auto-switching (1)')
-        pattern_set_dlp = re.compile(r'DL/UL Ratio\s+\|(\d+/\d+)')
-
-        for line in settings_text:
-            if pattern_set_role.search(line):
-                settings['Role'] = pattern_set_role.search(line).group(2)
-
-            if pattern_set_band.search(line):
-                settings['Bandwidth'] = pattern_set_band.search(line).group(2)
-
-            if pattern_set_freq_dl_xg.search(line):
-                settings['DL Frequency']['Carrier 0'] = pattern_set_freq_dl_xg.search(line).group(1)
-
-            if pattern_set_freq_ul_xg.search(line):
-                settings['UL Frequency']['Carrier 0'] = pattern_set_freq_ul_xg.search(line).group(1)
-
-            if pattern_set_freq_dl_xg1k.search(line):
-                settings['DL Frequency']['Carrier 0'] = pattern_set_freq_dl_xg1k.search(line).group(1)
-                settings['DL Frequency']['Carrier 1'] = pattern_set_freq_dl_xg1k.search(line).group(2)
-
-            if pattern_set_freq_ul_xg1k.search(line):
-                settings['UL Frequency']['Carrier 0'] = pattern_set_freq_ul_xg1k.search(line).group(1)
-                settings['UL Frequency']['Carrier 1'] = pattern_set_freq_ul_xg1k.search(line).group(2)
-
-            if pattern_set_scp.search(line):
-                settings['Short CP'] = 'Enabled'
-
-            if pattern_set_max_dist.search(line):
-                settings['Max distance'] = pattern_set_max_dist.search(line).group(2)
-
-            if pattern_set_frame.search(line):
-                settings['Frame size'] = pattern_set_frame.search(line).group(2)
-
-            if pattern_set_pwr.search(line):
-                if not pattern_set_pwr.search(line).group(6):
-                    settings['Tx Power'] = pattern_set_pwr.search(line).group(3)
-                else:
-                    pattern = pattern_set_pwr.search(line)
-                    settings['Tx Power'] = max(pattern.group(3), pattern.group(6))
-
-            if pattern_set_cbb.search(line):
-                settings['Control Block Boost'] = 'Enabled'
-
-            if pattern_set_atpc.search(line):
-                settings['ATPC'] = 'Enabled'
+        SETTINGS_FIELDS.extract(settings_text, settings)
 
-            if pattern_set_amc.search(line):
-                settings['AMC Strategy'] = pattern_set_amc.search(line).group(2)
-
-            if pattern_set_mcs.search(line):
-                settings['Max MCS'] = pattern_set_mcs.search(line).group(1)
-
-            if pattern_set_idfs.search(line):
-                settings['IDFS'] = 'Enabled'
+        if patterns.set_dlp.search(dc_string) and settings['ADLP'] == 'Enabled':
+            settings['DL/UL Ratio'] = f'{patterns.set_dlp.findall(dc_string)[0]} auto'
+        else:
+            settings['DL/UL Ratio'] = f'{patterns.set_dlp.findall(dc_string)[0]}'
 
-            if pattern_set_tp.search(line):
-                settings['Traffic prioritization'] = 'Enabled'
+    except:
+        logger.warning('Settings were not parsed')
 
-            if pattern_set_ifc.search(line):
-                interface = pattern_set_ifc.search(line).group(1)
-                if 'up' in line:
-                    settings['Interface Status'][interface] = 'up'
+    logger.debug('Settings: %s', settings)
 
-            if pattern_set_adlp.search(line):
-                settings['ADLP'] = 'Enabled'
+    return settings
 
-        if pattern_set_dlp.search(dc_string) and settings['ADLP'] == 'Enabled':
-            settings['DL/UL Ratio'] = f'{pattern_set_dlp.findall(dc_string)[0]} auto'
-        else:
-            settings['DL/UL Ratio'] = f'{pattern_set_dlp.findall(dc_string)[0]}'
 
-    except:
-        logger.warning('Settings were not parsed')
+def parse_radio_status(card):
+    """Parse the radio status of a XG card."""
 
-    logger.debug(f'Settings: {settings}')
+    sections = card.sections
+    settings = card.settings
 
     # Radio Status
     stream = {'Tx Power': None, 'Tx Gain': None, 'MCS': None, 'CINR': None, 'RSSI': None, 'Crosstalk': None,
@@ -290,33 +354,18 @@ def parse(dc_string, dc_list):
 
     try:
         # Find "xginfo stat"
-        pattern_start = re.compile(r'==\[\s+xg stat\s+\]')
-        pattern_end = re.compile(r'==\[\s+ctl\s+\]')
-        radio_text = cut_text(dc_list, pattern_start, pattern_end, 1, -1)
+        radio_text = sections.cut('radio')
 
         # Split it to carriers
-        pattern_carrier = re.compile(r'\|\s+Carrier (\d)')
         slices = []
         for index, line in enumerate(radio_text):
-            if pattern_carrier.search(line):
+            if patterns.carrier.search(line):
                 slices.append(index)
         slices.append(len(radio_text))
 
         carriers_text = slice_text(radio_text, slices)
 
         # Parse carriers
-        pattern_rs_status = re.compile(r'Wireless Link( status)?\s+\|(\w+)')
-        pattern_rs_dist = re.compile(r'Distance\s+\|(\d+)\s+(meters)?')
-        pattern_rs_freq = re.compile(r'(\d+)( MHz)?')
-        pattern_rs_accfer = re.compile(r'\(([\.\d]+)%\)')
-        pattern_rs_pwr = re.compile(r'([\.\-\d]+)')
-        pattern_rs_gain = re.compile(r'([\.\-\d]+)')
-        pattern_rs_mcs = re.compile(r'((QPSK|QAM)(\d+)? \d+/\d+) \(\d+\)')
-        pattern_rs_cinr = re.compile(r'([\.\-\d]+)')
-        pattern_rs_rssi = re.compile(r'([\.\-\d]+) dBm')
-        pattern_rs_crosstalk = re.compile(r'([\.\-\d]+)')
-        pattern_rs_tber = re.compile(r'\(([\.\d]+)%\)')
-
         if settings['Role'] == 'master':
             radio_status['Master']['Role'] = 'Local'
             radio_status['Slave']['Role'] = 'Remote'
@@ -328,123 +377,47 @@ def parse(dc_string, dc_list):
             local = radio_status['Slave']
             remote = radio_status['Master']
 
-        for line in radio_text:
-            if pattern_rs_status.search(line):
-                radio_status['Link status'] = pattern_rs_status.search(line).group(2)
-
-            if pattern_rs_dist.search(line):
-                radio_status['Measured Distance'] = pattern_rs_dist.search(line).group(1)
+        RADIO_STATUS_FIELDS.extract(radio_text, radio_status)
 
         for index, carrier_text in enumerate(carriers_text):
 
             carrier = f'Carrier {index}'
 
             for line in carrier_text:
-                if line.startswith('|Tx/Rx Frequency'):
-                    if len(pattern_rs_freq.findall(line)) == 2:
-                        local[carrier]['Frequency'] = pattern_rs_freq.findall(line)[0][0]
-                        remote[carrier]['Frequency'] = pattern_rs_freq.findall(line)[1][0]
-                    else:
-                        local[carrier]['Frequency'] = pattern_rs_freq.findall(line)[0][0]
-
-                if line.startswith('|Rx Acc FER'):
-                    if len(pattern_rs_accfer.findall(line)) == 2:
-                        local[carrier]['Rx Acc FER'] = pattern_rs_accfer.findall(line)[0]
-                        remote[carrier]['Rx Acc FER'] = pattern_rs_accfer.findall(line)[1]
-                    else:
-                        local[carrier]['Rx Acc FER'] = pattern_rs_accfer.findall(line)[0]
-
-                if line.startswith('|    |Power'):
-                    if len(pattern_rs_pwr.findall(line)) == 4:
-                        local[carrier]['Stream 0']['Tx Power'] = pattern_rs_pwr.findall(line)[0]
-                        local[carrier]['Stream 1']['Tx Power'] = pattern_rs_pwr.findall(line)[1]
-                        remote[carrier]['Stream 0']['Tx Power'] = pattern_rs_pwr.findall(line)[2]
-                        remote[carrier]['Stream 1']['Tx Power'] = pattern_rs_pwr.findall(line)[3]
-                    else:
-                        local[carrier]['Stream 0']['Tx Power'] = pattern_rs_pwr.findall(line)[0]
-                        local[carrier]['Stream 1']['Tx Power'] = pattern_rs_pwr.findall(line)[1]
-
-                if line.startswith('|    |Gain'):
-                    if len(pattern_rs_gain.findall(line)) == 4:
-                        local[carrier]['Stream 0']['Tx Gain'] = pattern_rs_gain.findall(line)[0]
-                        local[carrier]['Stream 1']['Tx Gain'] = pattern_rs_gain.findall(line)[1]
-                        remote[carrier]['Stream 0']['Tx Gain'] = pattern_rs_gain.findall(line)[2]
-                        remote[carrier]['Stream 1']['Tx Gain'] = pattern_rs_gain.findall(line)[3]
-                    else:
-                        local[carrier]['Stream 0']['Tx Gain'] = pattern_rs_gain.findall(line)[0]
-                        local[carrier]['Stream 1']['Tx Gain'] = pattern_rs_gain.findall(line)[1]
-
-                if line.startswith('|RX  |MCS'):
-                    if len(pattern_rs_mcs.findall(line)) == 4:
-                        local[carrier]['Stream 0']['MCS'] = pattern_rs_mcs.findall(line)[0][0]
-                        local[carrier]['Stream 1']['MCS'] = pattern_rs_mcs.findall(line)[1][0]
-                        remote[carrier]['Stream 0']['MCS'] = pattern_rs_mcs.findall(line)[2][0]
-                        remote[carrier]['Stream 1']['MCS'] = pattern_rs_mcs.findall(line)[3][0]
-                    else:
-                        local[carrier]['Stream 0']['MCS'] = pattern_rs_mcs.findall(line)[0][0]
-                        local[carrier]['Stream 1']['MCS'] = pattern_rs_mcs.findall(line)[1][0]
-
-                if line.startswith('|    |CINR'):
-                    if len(pattern_rs_cinr.findall(line)) == 4:
-                        local[carrier]['Stream 0']['CINR'] = pattern_rs_cinr.findall(line)[0]
-                        local[carrier]['Stream 1']['CINR'] = pattern_rs_cinr.findall(line)[1]
-                        remote[carrier]['Stream 0']['CINR'] = pattern_rs_cinr.findall(line)[2]
-                        remote[carrier]['Stream 1']['CINR'] = pattern_rs_cinr.findall(line)[3]
-                    else:
-                        local[carrier]['Stream 0']['CINR'] = pattern_rs_cinr.findall(line)[0]
-                        local[carrier]['Stream 1']['CINR'] = pattern_rs_cinr.findall(line)[1]
-
-                if line.startswith('|    |RSSI'):
-                    if len(pattern_rs_rssi.findall(line)) == 4:
-                        local[carrier]['Stream 0']['RSSI'] = pattern_rs_rssi.findall(line)[0]
-                        local[carrier]['Stream 1']['RSSI'] = pattern_rs_rssi.findall(line)[1]
-                        remote[carrier]['Stream 0']['RSSI'] = pattern_rs_rssi.findall(line)[2]
-                        remote[carrier]['Stream 1']['RSSI'] = pattern_rs_rssi.findall(line)[3]
-                    else:
-                        local[carrier]['Stream 0']['RSSI'] = pattern_rs_rssi.findall(line)[0]
-                        local[carrier]['Stream 1']['RSSI'] = pattern_rs_rssi.findall(line)[1]
-
-                if line.startswith('|    |Crosstalk'):
-                    if len(pattern_rs_crosstalk.findall(line)) == 4:
-                        local[carrier]['Stream 0']['Crosstalk'] = pattern_rs_crosstalk.findall(line)[0]
-                        local[carrier]['Stream 1']['Crosstalk'] = pattern_rs_crosstalk.findall(line)[1]
-                        remote[carrier]['Stream 0']['Crosstalk'] = pattern_rs_crosstalk.findall(line)[2]
-                        remote[carrier]['Stream 1']['Crosstalk'] = pattern_rs_crosstalk.findall(line)[3]
-                    else:
-                        local[carrier]['Stream 0']['Crosstalk'] = pattern_rs_crosstalk.findall(line)[0]
-                        local[carrier]['Stream 1']['Crosstalk'] = pattern_rs_crosstalk.findall(line)[1]
-
-                if line.startswith('|    |Errors Ratio'):
-                    if len(pattern_rs_tber.findall(line)) == 4:
-                        local[carrier]['Stream 0']['Errors Ratio'] = pattern_rs_tber.findall(line)[0]
-                        local[carrier]['Stream 1']['Errors Ratio'] = pattern_rs_tber.findall(line)[1]
-                        remote[carrier]['Stream 0']['Errors Ratio'] = pattern_rs_tber.findall(line)[2]
-                        remote[carrier]['Stream 1']['Errors Ratio'] = pattern_rs_tber.findall(line)[3]
-                    else:
-                        local[carrier]['Stream 0']['Errors Ratio'] = pattern_rs_tber.findall(line)[0]
-                        local[carrier]['Stream 1']['Errors Ratio'] = pattern_rs_tber.findall(line)[1]
-                elif line.startswith('|    |TBER'):
-                    if len(pattern_rs_tber.findall(line)) == 4:
-                        local[carrier]['Stream 0']['Errors Ratio'] = pattern_rs_tber.findall(line)[0]
-                        local[carrier]['Stream 1']['Errors Ratio'] = pattern_rs_tber.findall(line)[1]
-                        remote[carrier]['Stream 0']['Errors Ratio'] = pattern_rs_tber.findall(line)[2]
-                        remote[carrier]['Stream 1']['Errors Ratio'] = pattern_rs_tber.findall(line)[3]
-                    else:
-                        local[carrier]['Stream 0']['Errors Ratio'] = pattern_rs_tber.findall(line)[0]
-                        local[carrier]['Stream 1']['Errors Ratio'] = pattern_rs_tber.findall(line)[1]
-                elif line.startswith('|    |Acc TBER'):
-                    if len(pattern_rs_tber.findall(line)) == 4:
-                        local[carrier]['Stream 0']['Errors Ratio'] = pattern_rs_tber.findall(line)[0]
-                        local[carrier]['Stream 1']['Errors Ratio'] = pattern_rs_tber.findall(line)[1]
-                        remote[carrier]['Stream 0']['Errors Ratio'] = pattern_rs_tber.findall(line)[2]
-                        remote[carrier]['Stream 1']['Errors Ratio'] = pattern_rs_tber.findall(line)[3]
-                    else:
-                        local[carrier]['Stream 0']['Errors Ratio'] = pattern_rs_tber.findall(line)[0]
-                        local[carrier]['Stream 1']['Errors Ratio'] = pattern_rs_tber.findall(line)[1]
+                for prefix, pattern, field, group, stream_field in RADIO_FIELDS:
+                    if line.startswith(prefix):
+                        break
+                else:
+                    continue
+
+                # Search the pattern once and fill all fields in from the result
+                values = pattern.findall(line)
+                if group is not None:
+                    values = [value[group] for value in values]
+
+                if stream_field:
+                    records = [local[carrier]['Stream 0'], local[carrier]['Stream 1'],
+                               remote[carrier]['Stream 0'], remote[carrier]['Stream 1']]
+                else:
+                    records = [local[carrier], remote[carrier]]
+
+                if len(values) != len(records):
+                    records = records[:len(records) // 2]
+
+                for position, record in enumerate(records):
+                    record[field] = values[position]
     except:
         logger.warning('Radio Status was not parsed')
 
-    logger.debug(f'Radio Status: {radio_status}')
+    logger.debug('Radio Status: %s', radio_status)
+
+    return radio_status
+
+
+def parse_ethernet_status(card):
+    """Parse the ethernet status of a XG card."""
+
+    sections = card.sections
 
     # Ethernet Status
     ethernet_statuses = {'Status': 'down', 'Speed': None, 'Duplex': None, 'Negotiation': None, 'Rx CRC': 0,
@@ -453,9 +426,7 @@ def parse(dc_string, dc_list):
 
     try:
         # Find "ifc -a"
-        pattern_start = re.compile(r'==\[\s+ifc -a\s+\]')
-        pattern_end = re.compile(r'==\[\s+sys info -full\s+\]')
-        intefaces_text = cut_text(dc_list, pattern_start, pattern_end, 1, -1)
+        intefaces_text = sections.cut('ethernet')
 
         slices = []
         for index, line in enumerate(intefaces_text):
@@ -472,66 +443,37 @@ def parse(dc_string, dc_list):
         interfaces_text_cut = slice_text(intefaces_text, slices)
 
         # Parse interfaces
-        pattern_es_ifc = re.compile(r'([\w\d]+): flags')
-        pattern_es_status = re.compile(r'Physical link is (\w+)')
-        pattern_es_speed = re.compile(r'Physical link is \w+, (\d+) Mbps')
-        pattern_es_duplex = re.compile(r'Physical link is \w+, \d+ Mbps\s+(\w+)-duplex')
-        pattern_es_autoneg = re.compile(r'Physical link is \w+, \d+ Mbps\s+\w+-duplex, (\w+)')
-        pattern_es_crc = re.compile(r'CRC errors\s+(\d+)')
-
         for interface_text in interfaces_text_cut:
             for line in interface_text:
-                if pattern_es_ifc.search(line):
-                    interface = pattern_es_ifc.search(line).group(1)
+                if ': flags' in line:
+                    interface = patterns.es_ifc.search(line).group(1)
 
-                if pattern_es_status.search(line):
-                    ethernet_status[interface]['Status'] = str.lower(pattern_es_status.search(line).group(1))
+                ETHERNET_FIELDS.extract([line], ethernet_status[interface])
 
-                if pattern_es_speed.search(line):
-                    ethernet_status[interface]['Speed'] = pattern_es_speed.search(line).group(1)
+    except:
+        logger.warning('Ethernet Status was not parsed')
 
-                if pattern_es_duplex.search(line):
-                    ethernet_status[interface]['Duplex'] = pattern_es_duplex.search(line).group(1)
+    logger.debug('Ethernet Status: %s', ethernet_status)
 
-                if pattern_es_autoneg.search(line):
-                    ethernet_status[interface]['Negotiation'] = pattern_es_autoneg.search(line).group(1)
+    return ethernet_status
 
-                if pattern_es_crc.search(line):
-                    ethernet_status[interface]['Rx CRC'] = pattern_es_crc.findall(line)[0]
-                    ethernet_status[interface]['Tx CRC'] = pattern_es_crc.findall(line)[1]
 
-    except:
-        logger.warning('Ethernet Status was not parsed')
+def parse_panic(card):
+    """Parse the panic and assert messages of a XG card."""
 
-    logger.debug(f'Ethernet Status: {ethernet_status}')
+    sections = card.sections
 
     # Panic
     try:
-        pattern_start = re.compile(r'==\[\s+panic show\s+\]')
-        pattern_end = re.compile(r'==\[\s+sys log show\s+\]')
-        panic_text = cut_text(dc_list, pattern_start, pattern_end, 1, -1)
-
-        panic = []
-        pattern_panic = re.compile(r'Panic info : \[\w+\]: case "(\w+)"')
-        pattern_assert = re.compile(r'Panic info : \[\w+\]: (ASS.+)')
-
-        for line in panic_text:
-            if pattern_panic.search(line):
-                panic.append(pattern_panic.search(line).group(1))
-            if pattern_assert.search(line):
-                panic.append(pattern_assert.search(line).group(1))
-        panic = set(panic)
+        panic_text = sections.cut('panic')
+
+        panic = set(PANIC_FIELDS.extract(panic_text, {}))
     except:
         logger.warning('Panic messages were not parsed')
 
-    logger.debug(f'Panic: {panic}')
+    logger.debug('Panic: %s', panic)
 
-    # Prepare result to create a class instance
-    result = (model, subfamily, serial_number, firmware,
-              uptime, reboot_reason, dc_list, dc_string,
-              settings, radio_status, ethernet_status, panic)
-
-    return result
+    return panic
 
 
 logger = logging.getLogger('logger.parser_xg')
\ No newline at end of file
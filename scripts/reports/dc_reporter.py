@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 
-from importlib import import_module
 import logging
 
+from scripts.dc_plugins import plugins
+
 
 def create_report(device, tests, dc_source):
     """Look for all available report templates for the requested device and run them.
@@ -10,7 +11,7 @@ def create_report(device, tests, dc_source):
     """
 
     def import_report(device, tests, dc_source):
-        """Dynamic modules (reports) import. Import only modules starts from "report_*"
+        """Choose the report in the plugin registry. Reports are modules "report_*" declaring KINDS of sources
 
                 A module must follow the next template:
                 def parse(dc_string, dc_list):
@@ -21,21 +22,17 @@ def create_report(device, tests, dc_source):
                     return tuple of objects
         """
 
-        module = import_module(f'.report_{str.lower(device.family)}', 'scripts.reports')
-
         #Filter empty test reports
-        if not list(filter(None, tests)):
-            tests = ['Everything is ok']
-        else:
-            tests = list(filter(None, tests))
+        problems = list(filter(None, tests))
+        # A test that has not finished in time has not checked anything
+        problems.extend(f'The test {name.rpartition(".")[2]} has not finished, the report is not complete'
+                        for name in getattr(tests, 'timed_out', ()))
+        tests = problems if problems else ['Everything is ok']
 
         #Create a report in accordance with the source of the diagnostic card
-        if dc_source[0] == 'jira':
-            return module.jira(device, tests)
-        elif dc_source[0] == 'web':
-            return module.web(device, tests)
-        elif dc_source[0] == 'cli':
-            return module.cli(device, tests)
+        report = plugins.report(device.family, dc_source[0])
+        if report is not None:
+            return report(device, tests)
 
     return import_report(device, tests, dc_source)
 
@@ -5,6 +5,10 @@ import logging
 from time import time
 
 
+# Kinds of the sources the module creates reports for
+KINDS = ('jira', 'web', 'cli')
+
+
 def timer(function):
     """Estimate time"""
     def wrapper(dc_string, dc_list):
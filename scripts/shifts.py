@@ -1,31 +1,181 @@
 # -*- coding: utf-8 -*-
 
-from datetime import datetime
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+import hashlib
+import json
+import logging
+from pathlib import Path
+import re
+from threading import Lock
+from time import time
 
-import pdfplumber
+
+MONTHS = {'Январь': 1, 'Февраль': 2, 'Март': 3, 'Апрель': 4, 'Май': 5, 'Июнь': 6, 'Июль': 7, 'Август': 8,
+          'Сентябрь': 9, 'Октябрь': 10, 'Ноябрь': 11, 'Декабрь': 12}
+
+# The mark of the duty shift in the schedule
+DUTY = '4'
+
+
+class ScheduleIndex:
+    """The duty calendar (a date: a person) of the schedule PDF.
+
+    The PDF is parsed once (all pages, a table per month), the calendar is kept in memory and saved next to the PDF
+    (<name>.schedule.json) with the mtime, the size and the hash of the PDF. The saved calendar is used until the PDF
+    is changed: a new mtime or size is checked by the hash, the PDF is parsed again only if the hash is changed.
+    """
+
+    def __init__(self, path='test.pdf'):
+        self.lock = Lock()
+        self.configure(path)
+
+    def configure(self, path):
+        """Set the path of the schedule PDF, the calendar is loaded on the first request."""
+
+        with self.lock:
+            self.path = Path(path)
+            self.index_path = self.path.with_suffix('.schedule.json')
+            self.stamp = None
+            self.digest = None
+            self.days = {}
+            self.dates = []
+
+    def refresh(self):
+        """Load the calendar if the PDF was changed since it was loaded (the lock must be held)."""
+
+        stat = self.path.stat()
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        if stamp == self.stamp:
+            return
+
+        saved = self.load()
+        if saved is not None and saved['stamp'] == stamp:
+            self.use(stamp, saved['digest'], saved['days'])
+            return
+
+        digest = hashlib.sha256(self.path.read_bytes()).hexdigest()
+        if saved is not None and saved['digest'] == digest:
+            days = saved['days']
+        else:
+            days = {day.isoformat(): person for day, person in self.parse().items()}
+        self.use(stamp, digest, days)
+        self.save()
+
+    def use(self, stamp, digest, days):
+        """Keep the calendar in memory (the dates are sorted for the range queries)."""
+
+        self.stamp = stamp
+        self.digest = digest
+        self.days = {date.fromisoformat(day): person for day, person in days.items()}
+        self.dates = sorted(self.days)
+
+    def parse(self):
+        """Parse the PDF and return the calendar {a date: a person}."""
+
+        # pdfplumber is imported only when the PDF is parsed, the saved calendar does not need it
+        import pdfplumber
+
+        time_start = time()
+        days = {}
+        with pdfplumber.open(self.path) as pdf:
+            for page in pdf.pages:
+                for table in page.extract_tables():
+                    days.update(self.parse_table(table))
+        logger.info(f'Schedule: {len(days)} days were parsed from {self.path}, '
+                    f'Elapsed Time: {time() - time_start}')
+        return days
+
+    @staticmethod
+    def parse_table(table):
+        """Return the calendar of a month table: the title ("<month> <year>г.") and the days in the first row,
+        the people from the third row (the name in the second column, the duty shifts are marked by DUTY).
+        A table without the title (e.g. the legend) is skipped.
+        """
+
+        try:
+            # The month and the year may be separated by a line break ("Апрель\n2020г.")
+            title = re.split(r'\s+', table[0][0].strip())
+            month = MONTHS[title[0]]
+            year = int(title[1].replace('г.', ''))
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            return {}
+
+        days = {}
+        for column, day in enumerate(table[0]):
+            if not str(day).isdigit():
+                continue
+            for row in table[2:]:
+                if str(row[column]) == DUTY:
+                    days[date(year, month, int(day))] = row[1]
+        return days
+
+    def load(self):
+        """Return the saved calendar or None if it is not found or broken."""
+
+        try:
+            with open(self.index_path, encoding='utf-8') as file:
+                saved = json.load(file)
+            return {'stamp': saved['stamp'], 'digest': saved['digest'], 'days': dict(saved['days'])}
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.exception(f'Schedule: {self.index_path} cannot be read, the PDF is parsed again')
+            return None
+
+    def save(self):
+        """Save the calendar next to the PDF (the lock must be held)."""
+
+        data = {'stamp': self.stamp, 'digest': self.digest,
+                'days': {day.isoformat(): self.days[day] for day in self.dates}}
+        temporary = self.index_path.with_suffix('.tmp')
+        try:
+            with open(temporary, 'w', encoding='utf-8') as file:
+                json.dump(data, file, ensure_ascii=False)
+            temporary.replace(self.index_path)
+        except OSError:
+            logger.exception(f'Schedule: {self.index_path} cannot be written')
+
+    def person(self, day):
+        """Return the person on duty on the day (None if nobody)."""
+
+        with self.lock:
+            self.refresh()
+            return self.days.get(day)
+
+    def between(self, start, end):
+        """Return a list of (a date, a person) of the duty days from start to end (inclusive)."""
+
+        with self.lock:
+            self.refresh()
+            dates = self.dates[bisect_left(self.dates, start):bisect_right(self.dates, end)]
+            return [(day, self.days[day]) for day in dates]
+
+    def week(self, day):
+        """Return the duty days of the week (Monday to Sunday) of the day."""
+
+        start = day - timedelta(days=day.weekday())
+        return self.between(start, start + timedelta(days=6))
+
+    def month(self, year, month):
+        """Return the duty days of the month."""
+
+        start = date(year, month, 1)
+        end = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        return self.between(start, end)
+
+
+schedule_index = ScheduleIndex()
 
 
 def update():
     pass
 
 def duty():
-    pdf = pdfplumber.open("test.pdf")
-    tables = pdf.pages[0].extract_tables()
-    tables.pop()
+    """Return today and the person on duty today."""
+
     current_date = datetime.now()
-    current_year = str(current_date.year)
-    current_month = current_date.month
-    current_day = str(current_date.day)
-    months = {1: 'Январь', 2: 'Февраль', 3: 'Март', 4: 'Апрель', 5: 'Май', 6: 'Июнь', 7: 'Июль', 8: 'Август',
-              9: 'Сентябрь', 10: 'Октябрь', 11: 'Ноябрь', 12: 'Декабрь'}
-
-    for table in tables:
-        date = table[0][0].replace('\n', '').split(' ')
-        month = date[0].replace(' ', '')
-        year = date[1].replace(' ', '').replace('г.', '')
-        if year == current_year and month == months[current_month]:
-            for row in table[2:]:
-                if str(row[table[0].index(current_day)]) == '4':
-                    person = row[1]
+    return datetime.date(current_date), schedule_index.person(datetime.date(current_date))
+
 
-    return datetime.date(current_date), person
+logger = logging.getLogger('logger.shifts')
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+from bisect import bisect_right
+import hashlib
+import json
+import logging
+from pathlib import Path
+from threading import Lock
+
+
+# A value v falls below a bound (t, '<') if v < t and below a bound (t, '<=') if v <= t
+OPERATORS = {'<': 0, '<=': 1}
+
+
+class Rule:
+    """A threshold rule of a metric: bands of the values and a message template of each band.
+
+    bounds - the upper bounds of the bands in ascending order: ((-80, '<'), (-40, '<=')) reads as
+             "v < -80 is the first band, v <= -40 is the second band, the rest is the third band"
+    bands - a name of each band (len(bounds) + 1), None means the value is fine
+    templates - a band name: a message template (str.format) or a dict {a variant: a template},
+                the templates get the value as {value}, the band name as {band} and the fields passed to check()
+    convert - a function converting the parsed value (a string) to a number
+
+    The band of a value is found by bisection over the bounds, the bounds can be overridden by RuleBook.
+    """
+
+    def __init__(self, bounds, bands, templates, convert=float):
+        if len(bands) != len(bounds) + 1:
+            raise ValueError(f'{len(bounds)} bounds define {len(bounds) + 1} bands, not {len(bands)}')
+        self.bands = tuple(bands)
+        self.templates = templates
+        self.convert = convert
+        self.bounds = ()
+        self.keys = []
+        self.configure(bounds)
+
+    def configure(self, bounds):
+        """Set the bounds of the bands."""
+
+        if len(bounds) != len(self.bounds or bounds):
+            raise ValueError(f'{len(self.bounds)} bounds are expected, not {len(bounds)}')
+        keys = [(value, OPERATORS[operator]) for value, operator in bounds]
+        if keys != sorted(keys):
+            raise ValueError(f'The bounds are not in ascending order: {bounds}')
+        self.bounds = tuple((value, operator) for value, operator in bounds)
+        self.keys = keys
+
+    def band(self, value):
+        """Return the band name of the number (None for nan)."""
+
+        if value != value:
+            return None
+        # 0.5 puts the value between the bounds (t, '<') and (t, '<=') of the same t
+        return self.bands[bisect_right(self.keys, (value, 0.5))]
+
+    def check(self, value, variant=None, **fields):
+        """Convert the value, find its band and return the message or None if the value is fine or unknown."""
+
+        try:
+            value = self.convert(value)
+        except (TypeError, ValueError):
+            logger.debug('The value %r cannot be checked', value)
+            return None
+
+        band = self.band(value)
+        if band is None:
+            return None
+        return self.message(band, value, variant, **fields)
+
+    def message(self, band, value, variant=None, **fields):
+        """Return the message of the band or None if the band has no template for the variant."""
+
+        template = self.templates[band]
+        if isinstance(template, dict):
+            template = template.get(variant)
+            if template is None:
+                return None
+        return template.format(value=value, band=band, **fields)
+
+
+class RuleBook:
+    """The threshold rules of the tests by name ("<family>.<metric>") and the overrides of their bounds.
+
+    The overrides are a JSON file {"<family>.<metric>": [[bound, "<" or "<="], ...]} (e.g. the thresholds
+    of a customer), they are applied to the rules defined already and to the rules defined later.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.rules = {}
+        self.defaults = {}
+        self.overrides = {}
+        self.digest = ''
+
+    def define(self, name, bounds, bands, templates, convert=float):
+        """Create a rule, apply its override and return the rule."""
+
+        rule = Rule(bounds, bands, templates, convert)
+        with self.lock:
+            self.rules[name] = rule
+            self.defaults[name] = rule.bounds
+            if name in self.overrides:
+                self.apply(name)
+        return rule
+
+    def configure(self, path=None):
+        """Load the overrides from the file (None drops the overrides) and apply them."""
+
+        overrides = {}
+        digest = ''
+        if path is not None and Path(path).exists():
+            try:
+                data = Path(path).read_bytes()
+                overrides = {name: [tuple(bound) for bound in bounds] for name, bounds in json.loads(data).items()}
+                digest = hashlib.sha256(data).hexdigest()[:16]
+            except (OSError, TypeError, ValueError):
+                logger.exception(f'Rule overrides: {path} cannot be read, the default thresholds are used')
+
+        with self.lock:
+            self.overrides = overrides
+            self.digest = digest
+            for name in self.rules:
+                self.apply(name)
+
+        logger.info(f'Rule overrides: {len(overrides)} loaded from {path}')
+
+    def apply(self, name):
+        """Set the bounds of the rule from the overrides or the defaults (the lock must be held)."""
+
+        try:
+            self.rules[name].configure(self.overrides.get(name, self.defaults[name]))
+        except (KeyError, TypeError, ValueError):
+            logger.exception(f'The override of the rule "{name}" is wrong, the default bounds are used')
+            self.rules[name].configure(self.defaults[name])
+
+
+rules = RuleBook()
+
+logger = logging.getLogger('logger.dc_rules')
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+from bisect import bisect_right
+from collections import namedtuple
+import logging
+import re
+
+
+# The hits of a signature: the number of the hits, the line numbers of the card (starting from 1)
+Hit = namedtuple('Hit', 'count lines')
+
+
+class SignatureScanner:
+    """Find the known messages (literal texts) in a diagnostic card.
+
+    All signatures are compiled into one alternation, so the card is scanned once
+    however many signatures there are. Longer signatures are tried first at the same position.
+    """
+
+    def __init__(self, signatures):
+        self.signatures = tuple(signatures)
+        literals = sorted(set(self.signatures), key=len, reverse=True)
+        self.pattern = re.compile('|'.join(map(re.escape, literals)))
+
+    def scan(self, device, section=None):
+        """Return a dict {a signature: Hit} of the signatures found in the card or in its section (None - the whole
+        card, a message may be anywhere: the header, the saved log, the license). The whole card is scanned
+        if the section is not found (the section index falls back to the whole text).
+        """
+
+        dc_list = device.dc_list
+        start, end = 0, len(device.dc_string)
+        if section is not None:
+            span_start, span_end = device.sections.span(section)
+            start = dc_list.offsets[span_start] if span_start < len(dc_list) else end
+            end = dc_list.offsets[span_end] if span_end < len(dc_list) else end
+
+        lines = {}
+        for match in self.pattern.finditer(device.dc_string, start, end):
+            lines.setdefault(match.group(), []).append(bisect_right(dc_list.offsets, match.start()))
+
+        return {signature: Hit(len(lines[signature]), lines[signature])
+                for signature in self.signatures if signature in lines}
+
+
+logger = logging.getLogger('logger.dc_signatures')
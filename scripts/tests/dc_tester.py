@@ -1,9 +1,90 @@
 # -*- coding: utf-8 -*-
 
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
 import logging
-from importlib import import_module
-from time import time
-from pathlib import Path
+from threading import Lock
+from time import monotonic, time
+
+from scripts.dc_plugins import plugins
+
+
+class TestResults(list):
+    """Results of the tests in the order of the tests (None - the test has passed or has not finished in time).
+    timed_out - names of the tests that have not finished in time, a report with such results is not complete.
+    """
+
+    def __init__(self, results=(), timed_out=()):
+        super().__init__(results)
+        self.timed_out = list(timed_out)
+
+
+class TestRunner:
+    """Run the tests of a card concurrently in a thread pool shared by the requests of the process.
+
+    The tests are independent, so a network-bound test (recommendations ask the FTP server) waits
+    along with the others instead of adding its latency to them.
+    timeout - seconds a test may run (from its start), budget - seconds all tests of a card may run.
+    A test that has not finished in time is noted in the report. A running thread cannot be stopped, so the test
+    keeps its thread of the pool until it returns: a hung test takes a thread from the other cards, the network
+    calls of the tests must have their own timeouts (see FTPLister) shorter than the timeout of a test.
+    """
+
+    def __init__(self, workers=8, timeout=15, budget=25):
+        self.lock = Lock()
+        self.executor = None
+        self.configure(workers, timeout, budget)
+
+    def configure(self, workers, timeout=15, budget=25):
+        """Set the number of threads and the time limits (seconds)."""
+
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False)
+            self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='dc_tester')
+            self.timeout = timeout
+            self.budget = budget
+
+    def run(self, device, modules):
+        """Run the test modules for the device and return TestResults in the order of the modules."""
+
+        # The tests wait for a thread in the shared pool, the timeout of a test is counted from its start
+        started = {}
+
+        def run_test(module):
+            started[module.__name__] = monotonic()
+            time_start = time()
+            result = module.test(device)
+            logger.debug('Test "%s", Elapsed Time: %s', module.__name__, time() - time_start)
+            return result
+
+        deadline = monotonic() + self.budget
+        futures = [(module, self.executor.submit(run_test, module)) for module in modules]
+
+        test_results = TestResults()
+        for module, future in futures:
+            try:
+                test_results.append(self.wait(future, module.__name__, started, deadline))
+            except TimeoutError:
+                future.cancel()
+                logger.warning(f'Test "{module.__name__}" has not finished in time and was skipped')
+                test_results.append(None)
+                test_results.timed_out.append(module.__name__)
+        return test_results
+
+    def wait(self, future, name, started, deadline):
+        """Return the result of the test, raise TimeoutError if it runs longer than the timeout
+        or has not finished by the deadline.
+        """
+
+        while True:
+            start = started.get(name)
+            # A test waiting for a thread is checked again when its timeout would expire if it started now
+            limit = min((monotonic() if start is None else start) + self.timeout, deadline)
+            try:
+                return future.result(max(0, limit - monotonic()))
+            except TimeoutError:
+                if start is not None or monotonic() >= deadline:
+                    raise
 
 
 def run_tests(device):
@@ -11,8 +92,8 @@ def run_tests(device):
     Return a list of strings with results or an empty list if all tests have passed successfully.
     """
 
-    def import_test(device, test_name):
-        """Dynamic modules (tests) import
+    def import_test(device, modules):
+        """Run the test modules found in the plugin registry.
 
         A module must follow the next template:
         def test(device):
@@ -24,30 +105,21 @@ def run_tests(device):
                 #return None
                 pass
 
+        A test must not change the device, the tests of a card are run concurrently
+        (the sections of the card are parsed by the first test requesting them).
         Use __ (double underscore) before file name if you need to hide a test from the importer.
         """
 
-        module = import_module('.' + str(test_name.stem), 'scripts.tests.' + str.lower(device.family))
-        return module.test(device)
-
-    test_path = Path.cwd() / 'scripts' / 'tests' / str.lower(device.family)
-    """
-    Fix for Apache (httpd.service)
-    httpd_location = '/var/www/html/parser/www/'
-    test_path = Path.cwd() / httpd_location / 'scripts' / 'tests' / str.lower(device.family)
-    """
-    test_results = []
+        return runner.run(device, modules)
 
     time_all_start = time()
-    for test_name in list(test_path.glob('[!__]*.py')):
-        time_start = time()
-        test_results.append(import_test(device, test_name))
-        time_end = time()
-        logger.debug(f'Test "*/{device.family}/{test_name.stem}", Elapsed Time: {time_end - time_start}')
+    test_results = import_test(device, plugins.tests_of(device.family))
     time_all_stop = time()
     logger.info(f'Tests finished, Elapsed Time: {time_all_stop - time_all_start}')
 
     return test_results
 
 
-logger = logging.getLogger('logger.dc_tester')
\ No newline at end of file
+runner = TestRunner()
+
+logger = logging.getLogger('logger.dc_tester')
@@ -2,6 +2,53 @@
 
 import logging
 
+from scripts.tests.dc_rules import rules
+
+
+# The threshold rules, the bounds can be overridden (see RuleBook)
+RSSI = rules.define(
+    'q5.rssi', bounds=((-80, '<'), (-40, '<=')), bands=('low', None, 'high'),
+    templates={
+        'low': 'RSSI is {value} dBm in the {stream} on the {receiver} device. '
+               'Please increase Tx power or improve alignment '
+               'on the {transmitter} device in order to reach better signal. '
+               'The recommended RSSI is -55 dBm.{tx_power}',
+        'high': 'RSSI is {value} dBm in the {stream} on the {receiver} device. '
+                'Please decrease Tx power on the {transmitter} device '
+                'in order to avoid damage to the radio module. '
+                'The recommended RSSI is -55 dBm.{tx_power}',
+    })
+
+EVM = rules.define(
+    'q5.evm', bounds=((-15, '<='), (-10, '<=')), bands=(None, 'middle', 'low'),
+    templates=dict.fromkeys(
+        ('middle', 'low'),
+        'EVM is {value} dB in the {stream} on the {receiver} device. '
+        'The quality of the signal is very low. '
+        'Only {band}-level modulations are available. '
+        'Please improve the quality of the signal to reach better modulations. '
+        'Possible solutions: '
+        '1) Increase Tx power on the {transmitter} device{tx_power_step}; '
+        '2) Find better frequency for the {receiver} device '
+        '(the spectrum analyzer can be used to do that); '
+        '3) Reduce bandwidth on the master device '
+        'in order to improve the sensitivity of the radio module.{bandwidth}'))
+
+CROSSTALK = rules.define(
+    'q5.crosstalk', bounds=((-15, '<='),), bands=(None, 'high'),
+    templates={
+        'high': 'Crosstalk is {value} dB in the {stream} on the {receiver} device. '
+                'Please check the installation of the antenna and LOS.',
+    })
+
+ARQ = rules.define(
+    'q5.arq_ratio', bounds=((5, '<='),), bands=(None, 'high'),
+    templates={
+        'high': 'ARQ ratio is {value} % in the {stream} on the {receiver} device. '
+                'It is recommended to keep the ARQ ratio less than 5%. '
+                'Please check other radio link parameters and find better frequency.',
+    })
+
 
 def test(device):
     """Check radio parameters and return conclusion."""
@@ -17,214 +64,25 @@ def test(device):
     def check_stream(position, stream_name, stream_data):
         """Check important stream parameters and return the conclusion."""
 
-        check_rssi(position, stream_name, stream_data['RSSI'])
-        check_evm(position, stream_name, stream_data['EVM'])
-        check_crosstalk(position, stream_name, stream_data['Crosstalk'])
-        check_arq_ratio(position, stream_name, stream_data['ARQ ratio'])
-
-    def check_rssi(position, stream_name, rssi):
-        """Check RSSI and return the conclusion."""
-
-        try:
-            rssi = float(rssi)
-
-            if position == 'downlink' and settings['Role'] == 'master' and rssi > -40:
-                result.append(f'RSSI is {rssi} dBm in the {stream_name} on the slave device. '
-                              f'Please decrease Tx power on the master device '
-                              f'in order to avoid damage to the radio module. '
-                              f'The recommended RSSI is -55 dBm. '
-                              f'The current Tx power set as {settings["Tx Power"]} dBm.')
-            elif position == 'downlink' and settings['Role'] == 'slave' and rssi > -40:
-                result.append(f'RSSI is {rssi} dBm in the {stream_name} on the slave device. '
-                              f'Please decrease Tx power on the master device '
-                              f'in order to avoid damage to the radio module. '
-                              f'The recommended RSSI is -55 dBm.')
-            elif position == 'uplink' and settings['Role'] == 'master' and rssi > -40:
-                result.append(f'RSSI is {rssi} dBm in the {stream_name} on the master device. '
-                              f'Please decrease Tx power on the slave device '
-                              f'in order to avoid damage to the radio module. '
-                              f'The recommended RSSI is -55 dBm.')
-            elif position == 'uplink' and settings['Role'] == 'slave' and rssi > -40:
-                result.append(f'RSSI is {rssi} dBm in the {stream_name} on the master device. '
-                              f'Please decrease Tx power on the slave device '
-                              f'in order to avoid damage to the radio module. '
-                              f'The recommended RSSI is -55 dBm. '
-                              f'The current Tx power set as {settings["Tx Power"]} dBm.')
-
-            elif position == 'downlink' and settings['Role'] == 'master' and rssi < -80:
-                result.append(f'RSSI is {rssi} dBm in the {stream_name} on the slave device. '
-                              f'Please increase Tx power or improve alignment '
-                              f'on the master device in order to reach better signal. '
-                              f'The recommended RSSI is -55 dBm. '
-                              f'The current Tx power set as {settings["Tx Power"]} dBm.')
-            elif position == 'downlink' and settings['Role'] == 'slave' and rssi < -80:
-                result.append(f'RSSI is {rssi} dBm in the {stream_name} on the slave device. '
-                              f'Please increase Tx power or improve alignment '
-                              f'on the master device in order to reach better signal. '
-                              f'The recommended RSSI is -55 dBm.')
-            elif position == 'uplink' and settings['Role'] == 'master' and rssi < -80:
-                result.append(f'RSSI is {rssi} dBm in the {stream_name} on the master device. '
-                              f'Please increase Tx power or improve alignment '
-                              f'on the slave device in order to reach better signal. '
-                              f'The recommended RSSI is -55 dBm.')
-            elif position == 'uplink' and settings['Role'] == 'slave' and rssi < -80:
-                result.append(f'RSSI is {rssi} dBm in the {stream_name} on the master device. '
-                              f'Please increase Tx power or improve alignment '
-                              f'on the slave device in order to reach better signal. '
-                              f'The recommended RSSI is -55 dBm.'
-                              f'The current Tx power set as {settings["Tx Power"]} dBm.')
-        except TypeError:
-            logger.exception('Radio RSSI TypeError')
-        finally:
-            pass
-
-
-    def check_evm(position, stream_name, evm):
-        """Check EVM and return the conclusion."""
-
-        try:
-            evm = float(evm)
-
-            if position == 'downlink' and settings['Role'] == 'master' and evm > -10:
-                result.append(f'EVM is {evm} dB in the {stream_name} on the slave device. '
-                              f'The quality of the signal is very low. '
-                              f'Only low-level modulations are available. '
-                              f'Please improve the quality of the signal to reach better modulations. '
-                              f'Possible solutions: '
-                              f'1) Increase Tx power on the master device. '
-                              f'The current Tx power set as {settings["Tx Power"]} dBm; '
-                              f'2) Find better frequency for the slave device '
-                              f'(the spectrum analyzer can be used to do that); '
-                              f'3) Reduce bandwidth on the master device '
-                              f'in order to improve the sensitivity of the radio module. '
-                              f'The current bandwidth is {settings["Bandwidth"]} MHz.')
-            elif position == 'downlink' and settings['Role'] == 'slave' and evm > -10:
-                result.append(f'EVM is {evm} dB in the {stream_name} on the slave device. '
-                              f'The quality of the signal is very low. '
-                              f'Only low-level modulations are available. '
-                              f'Please improve the quality of the signal to reach better modulations. '
-                              f'Possible solutions: '
-                              f'1) Increase Tx power on the master device; '
-                              f'2) Find better frequency for the slave device '
-                              f'(the spectrum analyzer can be used to do that); '
-                              f'3) Reduce bandwidth on the master device '
-                              f'in order to improve the sensitivity of the radio module. ')
-            elif position == 'uplink' and settings['Role'] == 'master' and evm > -10:
-                result.append(f'EVM is {evm} dB in the {stream_name} on the master device. '
-                              f'The quality of the signal is very low. '
-                              f'Only low-level modulations are available. '
-                              f'Please improve the quality of the signal to reach better modulations. '
-                              f'Possible solutions: '
-                              f'1) Increase Tx power on the slave device; '
-                              f'2) Find better frequency for the master device '
-                              f'(the spectrum analyzer can be used to do that); '
-                              f'3) Reduce bandwidth on the master device '
-                              f'in order to improve the sensitivity of the radio module. '
-                              f'The current bandwidth is {settings["Bandwidth"]} MHz. ')
-            elif position == 'uplink' and settings['Role'] == 'slave' and evm > -10:
-                result.append(f'EVM is {evm} dB in the {stream_name} on the master device. '
-                              f'The quality of the signal is very low. '
-                              f'Only low-level modulations are available. '
-                              f'Please improve the quality of the signal to reach better modulations. '
-                              f'Possible solutions: '
-                              f'1) Increase Tx power on the slave device. '
-                              f'The current Tx power set as {settings["Tx Power"]} dBm; '
-                              f'2) Find better frequency for the master device '
-                              f'(the spectrum analyzer can be used to do that); '
-                              f'3) Reduce bandwidth on the master device '
-                              f'in order to improve the sensitivity of the radio module. ')
-
-            elif position == 'downlink' and settings['Role'] == 'master' and evm > -15:
-                result.append(f'EVM is {evm} dB in the {stream_name} on the slave device. '
-                              f'The quality of the signal is very low. '
-                              f'Only middle-level modulations are available. '
-                              f'Please improve the quality of the signal to reach better modulations. '
-                              f'Possible solutions: '
-                              f'1) Increase Tx power on the master device. '
-                              f'The current Tx power set as {settings["Tx Power"]} dBm; '
-                              f'2) Find better frequency for the slave device '
-                              f'(the spectrum analyzer can be used to do that); '
-                              f'3) Reduce bandwidth on the master device '
-                              f'in order to improve the sensitivity of the radio module. '
-                              f'The current bandwidth is {settings["Bandwidth"]} MHz. ')
-            elif position == 'downlink' and settings['Role'] == 'slave' and evm > -15:
-                result.append(f'EVM is {evm} dB in the {stream_name} on the slave device. '
-                              f'The quality of the signal is very low. '
-                              f'Only middle-level modulations are available. '
-                              f'Please improve the quality of the signal to reach better modulations. '
-                              f'Possible solutions: '
-                              f'1) Increase Tx power on the master device; '
-                              f'2) Find better frequency for the slave device '
-                              f'(the spectrum analyzer can be used to do that); '
-                              f'3) Reduce bandwidth on the master device '
-                              f'in order to improve the sensitivity of the radio module.')
-            elif position == 'uplink' and settings['Role'] == 'master' and evm > -15:
-                result.append(f'EVM is {evm} dB in the {stream_name} on the master device. '
-                              f'The quality of the signal is very low. '
-                              f'Only middle-level modulations are available. '
-                              f'Please improve the quality of the signal to reach better modulations. '
-                              f'Possible solutions: '
-                              f'1) Increase Tx power on the slave device; '
-                              f'2) Find better frequency for the master device '
-                              f'(the spectrum analyzer can be used to do that); '
-                              f'3) Reduce bandwidth on the master device '
-                              f'in order to improve the sensitivity of the radio module. '
-                              f'The current bandwidth is {settings["Bandwidth"]} MHz.')
-            elif position == 'uplink' and settings['Role'] == 'slave' and evm > -15:
-                result.append(f'EVM is {evm} dB in the {stream_name} on the master device. '
-                              f'The quality of the signal is very low. '
-                              f'Only middle-level modulations are available. '
-                              f'Please improve the quality of the signal to reach better modulations. '
-                              f'Possible solutions: '
-                              f'1) Increase Tx power on the slave device. '
-                              f'The current Tx power set as {settings["Tx Power"]} dBm; '
-                              f'2) Find better frequency for the master device '
-                              f'(the spectrum analyzer can be used to do that); '
-                              f'3) Reduce bandwidth on the master device '
-                              f'in order to improve the sensitivity of the radio module. ')
-        except TypeError:
-            logger.exception('Radio EVM TypeError')
-        finally:
-            pass
-
-
-    def check_crosstalk(position, stream_name, crosstalk):
-        """Check Crosstalk and return the conclusion."""
-
-        try:
-            crosstalk = float(crosstalk)
-
-            if position == 'downlink' and crosstalk > -15:
-                result.append(f'Crosstalk is {crosstalk} dB in the {stream_name} on the slave device. '
-                              f'Please check the installation of the antenna and LOS.')
-            elif position == 'uplink' and crosstalk > -15:
-                result.append(f'Crosstalk is {crosstalk} dB in the {stream_name} on the master device. '
-                              f'Please check the installation of the antenna and LOS.')
-        except TypeError:
-            logger.exception('Radio Crosstalk TypeError')
-        finally:
-            pass
-
-
-    def check_arq_ratio(position, stream_name, arq):
-        """Check ARQ Ratio in the stream and return the conclusion."""
-
-        try:
-            arq = float(arq)
-
-            if position == 'downlink' and arq > 5:
-                result.append(f'ARQ ratio is {arq} % in the {stream_name} on the slave device. '
-                              f'It is recommended to keep the ARQ ratio less than 5%. '
-                              f'Please check other radio link parameters and find better frequency.')
-            elif position == 'uplink' and arq > 5:
-                result.append(f'ARQ ratio is {arq} % in the {stream_name} on the master device. '
-                              f'It is recommended to keep the ARQ ratio less than 5%. '
-                              f'Please check other radio link parameters and find better frequency.')
-        except TypeError:
-            logger.exception('Radio ARQ TypeError')
-        finally:
-            pass
-
+        # The downlink is received by the slave, the uplink is received by the master
+        receiver, transmitter = ('slave', 'master') if position == 'downlink' else ('master', 'slave')
+        fields = {'stream': stream_name, 'receiver': receiver, 'transmitter': transmitter}
+
+        # The Tx power of the transmitter is known if the card is taken from it
+        if settings['Role'] == transmitter:
+            fields['tx_power'] = f' The current Tx power set as {settings["Tx Power"]} dBm.'
+            fields['tx_power_step'] = f'. The current Tx power set as {settings["Tx Power"]} dBm'
+        else:
+            fields['tx_power'] = fields['tx_power_step'] = ''
+        fields['bandwidth'] = f' The current bandwidth is {settings["Bandwidth"]} MHz.' \
+            if settings['Role'] == 'master' else ''
+
+        messages = [CROSSTALK.check(stream_data['Crosstalk'], **fields),
+                    ARQ.check(stream_data['ARQ ratio'], **fields)]
+        if settings['Role'] in ('master', 'slave'):
+            messages.extend([RSSI.check(stream_data['RSSI'], **fields),
+                             EVM.check(stream_data['EVM'], **fields)])
+        result.extend(filter(None, messages))
 
     def check_mixed_polarisations(position, carrier):
         """Check if V and H polarizations were mixed up during installation."""
@@ -3,6 +3,30 @@
 import logging
 from re import search
 
+from scripts.tests.dc_signatures import SignatureScanner
+
+
+# A message in the card: a recommendation, the card is scanned once for all messages
+SIGNATURES = {
+    # Recovery mode
+    'RECOVERY MODE ACTIVE': 'The device has been reset. '
+                            'Please save config (CLI: "config save") '
+                            'and reboot the device.',
+    # Hardware faults
+    'EMERGENCY!!!': 'Please check the installed license or '
+                    'hardware components.',
+    'license: license not found': 'No license. '
+                                  'Please check the installed license.',
+    'DFFS: Can`t erase sector': 'Flash memory failure detected.',
+    'RTC not waking up': 'Real-Time Clock failure detected.',
+    # Scrambling engine
+    'Scrambling engine overflow': 'Hardware encryption module overflow. '
+                                  'Maximum number of connected CPEs is 62. '
+                                  'Please disable scrambling (CLI: "mint rf5.0 -scrambling").',
+}
+
+scanner = SignatureScanner(SIGNATURES)
+
 
 def test(device):
     """Check log and other service messages."""
@@ -41,37 +65,9 @@ def test(device):
             result.append(f'Motherboard temperature is {pattern.group(1)}°. '
                           f'Please pay attention.')
 
-    # Recovery mode
-    pattern = search(r'RECOVERY MODE ACTIVE', device.dc_string)
-    if pattern is not None:
-        result.append('The device has been reset. '
-                      'Please save config (CLI: "config save") '
-                      'and reboot the device.')
-    # Hardware faults
-    pattern = search(r'EMERGENCY!!!', device.dc_string)
-    if pattern is not None:
-        result.append('Please check the installed license or '
-                      'hardware components.')
-
-    pattern = search(r'license: license not found', device.dc_string)
-    if pattern is not None:
-        result.append('No license. '
-                      'Please check the installed license.')
-
-    pattern = search(r'DFFS: Can`t erase sector', device.dc_string)
-    if pattern is not None:
-        result.append('Flash memory failure detected.')
-
-    pattern = search(r'RTC not waking up', device.dc_string)
-    if pattern is not None:
-        result.append('Real-Time Clock failure detected.')
-
-    #Scrambling engine
-    pattern = search(r'Scrambling engine overflow', device.dc_string)
-    if pattern is not None:
-        result.append('Hardware encryption module overflow. '
-                      'Maximum number of connected CPEs is 62. '
-                      'Please disable scrambling (CLI: "mint rf5.0 -scrambling").')
+    # Known faults
+    for signature in scanner.scan(device):
+        result.append(SIGNATURES[signature])
 
     result = list(set(result))
     if result:
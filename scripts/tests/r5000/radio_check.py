@@ -1,134 +1,81 @@
 # -*- coding: utf-8 -*-
 
 import logging
+from math import nan
 import re
 
+from scripts.tests.dc_rules import rules
+
+
+# The threshold rules, the bounds can be overridden (see RuleBook)
+RSSI = rules.define(
+    'r5000.rssi', bounds=((-80, '<'), (-40, '<=')), bands=('low', None, 'high'),
+    templates={
+        'low': 'RSSI is {value} dBm. Please increase Tx power on '
+               'the remote device {name} in order to avoid damage '
+               'to the radio module. '
+               'It is not recommended RSSI less than -80.',
+        'high': 'RSSI is {value} dBm. Please decrease Tx power on '
+                'the remote device {name} in order to avoid damage '
+                'to the radio module. '
+                'It is not recommended RSSI greater than -40.',
+    })
+
+SNR = rules.define(
+    'r5000.snr', bounds=((7, '<'),), bands=('low', None),
+    templates={
+        'low': {
+            'master': 'The quality of the signal of the link {name} is very low '
+                      'due to bad SNR (Rx {snr_rx}dB/Tx {snr_tx}dB). '
+                      'Only low-level modulations are available. '
+                      'Please improve the quality of the signal to reach better modulations. '
+                      'Possible solutions: '
+                      '1) Increase Tx power on the remote side; '
+                      '2) Find better frequency for the remote side '
+                      '(the spectrum analyzer can be used to do that); '
+                      '3) Reduce bandwidth on the master device '
+                      'in order to improve the sensitivity of the radio module. '
+                      'The current bandwidth is {bandwidth} MHz.',
+            'slave': 'The quality of the signal in the link {name} is very low '
+                     'due to bad SNR (Rx {snr_rx}dB/Tx {snr_tx}dB). '
+                     'Only low-level modulations are available. '
+                     'Please improve the quality of the signal to reach better modulations. '
+                     'Possible solutions: '
+                     '1) Increase Tx power on the remote side; '
+                     '2) Find better frequency for the remote side '
+                     '(the spectrum analyzer can be used to do that); '
+                     '3) Reduce bandwidth on the master device '
+                     'in order to improve the sensitivity of the radio module.',
+        },
+    })
+
+RETRY = rules.define(
+    'r5000.retry', bounds=((7, '<='),), bands=(None, 'high'),
+    templates={
+        'high': 'Retries detected on the link {name}. '
+                'Rx {retry_rx}%/Tx {retry_tx}%. '
+                'The recommended value is no more than 10%. '
+                'Please pay attention.',
+    })
+
+
+def number(value):
+    """Return the value of a link field as a float ("*" is removed) or nan if the field is empty.
+    A comparison with nan is false, so the links without a value are skipped by the rules.
+    """
+
+    return nan if value is None else float(value.replace('*', ''))
+
+
+def marked(value):
+    """Return True if the value of a link field is marked by "*"."""
+
+    return value is not None and '*' in value
+
 
 def test(device):
     """Check radio parameters and return conclusion."""
 
-    def check_rssi(status):
-        """Check RSSI and return the conclusion."""
-
-        try:
-            if '*' in status['RSSI Rx']:
-                result.append(f'Polarisation skew detected on the link {status["Name"]}. '
-                              f'Please check alignment, crosstalk, LOS, etc.')
-
-            if status['RSSI Tx'] is not None and '*' in status['RSSI Tx']:
-                result.append(f'Polarisation skew detected on the link {status["Name"]}. '
-                              f'Please check alignment, crosstalk, LOS, etc.')
-
-            # Remove "*" before RSSI
-            rssi = float(status['RSSI Rx'].replace('*', ''))
-            if rssi > -40:
-                result.append(f'RSSI is {rssi} dBm. Please decrease Tx power on '
-                              f'the remote device {status["Name"]} in order to avoid damage '
-                              f'to the radio module. '
-                              f'It is not recommended RSSI greater than -40.')
-            elif rssi < -80:
-                result.append(f'RSSI is {rssi} dBm. Please increase Tx power on '
-                              f'the remote device {status["Name"]} in order to avoid damage '
-                              f'to the radio module. '
-                              f'It is not recommended RSSI less than -80.')
-        except TypeError:
-            logger.exception('Radio RSSI TypeError')
-        finally:
-            pass
-
-
-    def check_power(status):
-        """Check Power and return the conclusion."""
-
-        try:
-            if '*' in status['Power Rx'] or '*' in status['Power Tx']:
-                result.append(f'Power issues detected on the link {status["Name"]}. '
-                              f'Please check Abnormal power disbalance on the remote device')
-        except:
-            logger.exception('Power exception')
-        finally:
-            pass
-
-
-    def check_level(status):
-        """Check Level and return the conclusion."""
-
-        try:
-            level_rx = int(status['Level Rx'])
-            level_tx = int(status['Level Tx'])
-            # Remove "*" before Power level
-            power_rx = float(status['Power Rx'].replace('*', ''))
-            power_tx = float(status['Power Tx'].replace('*', ''))
-            snr_rx = int(status['SNR Rx'])
-            snr_tx = int(status['SNR Tx'])
-            power_skew = abs(power_rx - power_tx)
-            level_skew = abs(level_rx - level_tx)
-            snr_skew = abs(snr_rx - snr_tx)
-            total_skew = abs(snr_skew - level_skew)
-            if power_skew != level_skew and total_skew > 8:
-                result.append(f'Level skew detected on the link {status["Name"]}. '
-                              f'Rx level is {level_rx}, Tx level is {level_tx}. '
-                              f'Tx power is {power_rx} dBm, Rx power is {power_tx} dBm. '
-                              f'Please pay attention.')
-        except TypeError:
-            logger.exception('Radio Level TypeError')
-        finally:
-            pass
-
-
-    def check_snr(status):
-        """Check SNR and return the conclusion."""
-
-        try:
-            snr_rx = int(status['SNR Rx'])
-            snr_tx = int(status['SNR Tx'])
-
-            if (snr_rx < 7 or snr_tx < 7) and radio_settings['Type'] == 'master':
-                result.append(f'The quality of the signal of the link {status["Name"]} is very low '
-                              f'due to bad SNR (Rx {snr_rx}dB/Tx {snr_tx}dB). '
-                              f'Only low-level modulations are available. '
-                              f'Please improve the quality of the signal to reach better modulations. '
-                              f'Possible solutions: '
-                              f'1) Increase Tx power on the remote side; '
-                              f'2) Find better frequency for the remote side '
-                              f'(the spectrum analyzer can be used to do that); '
-                              f'3) Reduce bandwidth on the master device '
-                              f'in order to improve the sensitivity of the radio module. '
-                              f'The current bandwidth is {radio_settings["Profile"]["M"]["Bandwidth"]} MHz.')
-            elif (snr_rx < 7 or snr_tx < 7) and radio_settings['Type'] == 'slave':
-                result.append('The quality of the signal in the link {format(status["Name"]} is very low '
-                              'due to bad SNR (Rx {snr_rx}dB/ Tx {snr_tx}dB). '
-                              'Only low-level modulations are available. '
-                              'Please improve the quality of the signal to reach better modulations. '
-                              'Possible solutions: '
-                              '1) Increase Tx power on the remote side; '
-                              '2) Find better frequency for the remote side '
-                              '(the spectrum analyzer can be used to do that); '
-                              '3) Reduce bandwidth on the master device '
-                              'in order to improve the sensitivity of the radio module.')
-        except TypeError:
-            logger.exception('Radio SNR TypeError')
-        finally:
-            pass
-
-
-    def check_retries(status):
-        """Check Retries and return the conclusion."""
-
-        try:
-            retries_rx = int(status['Retry Rx'])
-            retries_tx = int(status['Retry Tx'])
-            if retries_rx > 7 or retries_tx > 7:
-                result.append(f'Retries detected on the link {status["Name"]}. '
-                              f'Rx {retries_rx}%/Tx {retries_tx}%. '
-                              f'The recommended value is no more than 10%. '
-                              f'Please pay attention.')
-        except TypeError:
-            logger.exception('Radio Retries TypeError')
-        finally:
-            pass
-
-
     radio_status = device.radio_status
     radio_settings = device.settings['Radio']
     result = []
@@ -348,12 +295,48 @@ def test(device):
                       f'Perhaps there may be issue with radio links.\n')
 
     # Check each link
-    for status in radio_status['Links'].values():
-        check_rssi(status)
-        check_power(status)
-        check_level(status)
-        check_snr(status)
-        check_retries(status)
+    for link in radio_status['Links'].values():
+        name = link['Name']
+
+        # RSSI, polarisation skew (the "*" mark)
+        if marked(link['RSSI Rx']) or link['RSSI Rx'] is not None and marked(link['RSSI Tx']):
+            result.append(f'Polarisation skew detected on the link {name}. '
+                          f'Please check alignment, crosstalk, LOS, etc.')
+        message = RSSI.check(number(link['RSSI Rx']), name=name)
+        if message is not None:
+            result.append(message)
+
+        # Power
+        if marked(link['Power Rx']) or link['Power Rx'] is not None and marked(link['Power Tx']):
+            result.append(f'Power issues detected on the link {name}. '
+                          f'Please check Abnormal power disbalance on the remote device')
+
+        # Level skew
+        fields = [link[key] for key in ('Power Rx', 'Power Tx', 'Level Rx', 'Level Tx', 'SNR Rx', 'SNR Tx')]
+        if None not in fields:
+            power_rx, power_tx, level_rx, level_tx, snr_rx, snr_tx = map(number, fields)
+            level_skew = abs(level_rx - level_tx)
+            if abs(power_rx - power_tx) != level_skew and abs(abs(snr_rx - snr_tx) - level_skew) > 8:
+                result.append(f'Level skew detected on the link {name}. '
+                              f'Rx level is {int(level_rx)}, Tx level is {int(level_tx)}. '
+                              f'Tx power is {power_rx} dBm, Rx power is {power_tx} dBm. '
+                              f'Please pay attention.')
+
+        # SNR, the worst direction of the link (the bandwidth is found only for a link with a low SNR)
+        if link['SNR Rx'] is not None and link['SNR Tx'] is not None:
+            snr_rx, snr_tx = number(link['SNR Rx']), number(link['SNR Tx'])
+            band = SNR.band(min(snr_rx, snr_tx))
+            if band is not None:
+                bandwidth = radio_settings['Profile']['M']['Bandwidth'] if radio_settings['Type'] == 'master' else None
+                result.append(SNR.message(band, None, radio_settings['Type'], name=name, bandwidth=bandwidth,
+                                          snr_rx=int(snr_rx), snr_tx=int(snr_tx)))
+
+        # Retries, the worst direction of the link
+        if link['Retry Rx'] is not None and link['Retry Tx'] is not None:
+            retry_rx, retry_tx = number(link['Retry Rx']), number(link['Retry Tx'])
+            message = RETRY.check(max(retry_rx, retry_tx), name=name, retry_rx=int(retry_rx), retry_tx=int(retry_tx))
+            if message is not None:
+                result.append(message)
 
     # Polling status
     if 'MINT' in device.firmware and device.settings['Radio']['Polling'] == 'Disabled':
@@ -3,6 +3,18 @@
 import logging
 from re import search
 
+from scripts.tests.dc_signatures import SignatureScanner
+
+
+# A message in the card: a recommendation, the card is scanned once for all messages
+SIGNATURES = {
+    # Check switch_smi_phy_busy timeout (it's rare)
+    'switch_smi_phy_busy timeout': 'The "switch_smi_phy_busy timeout" message detected. '
+                                   'Please ignore it if it does not cause problems.',
+}
+
+scanner = SignatureScanner(SIGNATURES)
+
 
 def test(device):
     """Check log and other service messages."""
@@ -15,10 +27,9 @@ def test(device):
                       'It may mean power problems. '
                       'Please check power source, PoE-injector and other stuff related to power.')
 
-    # Check switch_smi_phy_busy timeout (it's rare)
-    if search(r'switch_smi_phy_busy timeout', device.dc_string) is not None:
-        result.append('The "switch_smi_phy_busy timeout" message detected. '
-                      'Please ignore it if it does not cause problems.')
+    # Known messages
+    for signature in scanner.scan(device):
+        result.append(SIGNATURES[signature])
 
     # CPU
     pattern = search(r'CPU Load\s+(\d+)%\s+(\d+)%\(10s\)', device.dc_string)
@@ -3,6 +3,75 @@
 import logging
 from re import search
 
+from scripts.tests.dc_rules import rules
+
+
+# The threshold rules, the bounds can be overridden (see RuleBook)
+RSSI = rules.define(
+    'xg.rssi', bounds=((-80, '<'), (-40, '<=')), bands=('low', None, 'high'), convert=int,
+    templates={
+        'low': 'RSSI is {value} dBm in the {stream} of '
+               'the {carrier} on the {position} side. '
+               'Please increase Tx power or improve alignment '
+               'on the {other} side in order to reach better signal.{tx_power}',
+        'high': 'RSSI is {value} dBm in the {stream} of '
+                'the {carrier} on the {position} side. '
+                'Please decrease Tx power on the {other} side '
+                'in order to avoid damage to the radio module.{tx_power}',
+    })
+
+CINR = rules.define(
+    'xg.cinr', bounds=((10, '<'), (20, '<')), bands=('low', 'middle', None), convert=int,
+    templates=dict.fromkeys(
+        ('low', 'middle'),
+        'CINR is {value} dB in the {stream} of '
+        'the {carrier} on the {position} side. '
+        'The quality of the signal is very low. '
+        'Only {band}-level modulations are available. '
+        'Please improve the quality of the signal to reach better modulations. '
+        'Possible solutions: '
+        '1) Increase Tx power on the {other} side{tx_power_step}; '
+        '2) Find better frequency for the remote side '
+        '(the spectrum analyzer can be used to do that); '
+        '3) Reduce bandwidth on the master device '
+        'in order to improve the sensitivity of the radio module. '
+        'The current bandwidth is {bandwidth} MHz.'))
+
+CROSSTALK = rules.define(
+    'xg.crosstalk', bounds=((-15, '<='),), bands=(None, 'high'), convert=int,
+    templates={
+        'high': 'Crosstalk is {value} dB in '
+                'the {stream} of the {carrier} on the {position} side. '
+                'Please check the installation of the antenna and LOS.',
+    })
+
+ERRORS_RATIO = rules.define(
+    'xg.errors_ratio', bounds=((1.5, '<='),), bands=(None, 'high'),
+    templates={
+        'high': 'TBER Errors ({value} %) detected in '
+                'the {stream} of the {carrier} on the {position} side. '
+                'XG does not support ARQ. '
+                'Therefore, some important data may be lost. '
+                'Please check other radio link parameters and find better frequency.',
+    })
+
+ACC_FER = rules.define(
+    'xg.acc_fer', bounds=((1.5, '<='),), bands=(None, 'high'),
+    templates={
+        'high': 'Rx Acc FER errors ({value} %) detected '
+                'in the {carrier} on the {position} side. '
+                'Please check other radio link parameters '
+                'and find better frequency.',
+    })
+
+GAIN_SKEW = rules.define(
+    'xg.gain_skew', bounds=((10, '<='),), bands=(None, 'high'),
+    templates={
+        'high': 'Gain skew detected between '
+                'the streams 0 and 1 of the {carrier} on the {position} side. '
+                'Please check the radio module. It may be faulty.',
+    })
+
 
 def test(device):
     """Check radio parameters and return conclusion."""
@@ -13,184 +82,33 @@ def test(device):
         if carrier_data['Frequency'] is None:
             return
 
-        try:
-            accfer = float(carrier_data['Rx Acc FER'])
-            if accfer > 1.5:
-                result.append(f'Rx Acc FER errors ({accfer} %) detected '
-                              f'in the {carrier_name} on the {position} side. '
-                              f'Please check other radio link parameters '
-                              f'and find better frequency.')
-        except TypeError:
-            logger.exception('Rx Acc FER TypeError')
-        except ValueError:
-            logger.exception('Rx Acc FER ValueError')
-        finally:
-            check_gain(position, carrier_name, carrier_data['Stream 0']['Tx Gain'], carrier_data['Stream 1']['Tx Gain'])
-
-            for stream in ['Stream 0', 'Stream 1']:
-                check_stream(position, carrier_name, str.lower(stream), carrier_data[stream])
-
-    def check_stream(position, carrier_name, stream_name, stream_data):
-        """Check important stream parameters and return the conclusion."""
-
-        check_rssi(position, carrier_name, stream_name, stream_data['RSSI'])
-        check_cinr(position, carrier_name, stream_name, stream_data['CINR'])
-        check_crosstalk(position, carrier_name, stream_name, stream_data['Crosstalk'])
-        check_errors_ratio(position, carrier_name, stream_name, stream_data['Errors Ratio'])
+        other = 'remote' if position == 'local' else 'local'
+        fields = {'carrier': carrier_name, 'position': position, 'other': other,
+                  'bandwidth': settings['Bandwidth']}
 
-    def check_rssi(position, carrier_name, stream_name, rssi):
-        """Check RSSI and return the conclusion."""
+        # The Tx power of the local side is known, the remote side receives it
+        if position == 'remote':
+            fields['tx_power'] = f' The current Tx power set as {settings["Tx Power"]} dBm.'
+            fields['tx_power_step'] = f'. The current Tx power set as {settings["Tx Power"]} dBm'
+        else:
+            fields['tx_power'] = fields['tx_power_step'] = ''
 
+        messages = [ACC_FER.check(carrier_data['Rx Acc FER'], **fields)]
         try:
-            rssi = int(rssi)
-            if position == 'local' and rssi > -40:
-                result.append(f'RSSI is {rssi} dBm in the {stream_name} of '
-                              f'the {carrier_name} on the {position} side. '
-                              f'Please decrease Tx power on the remote '
-                              f'side in order to avoid damage to the radio module.')
-            elif position == 'remote' and rssi > -40:
-                result.append(f'RSSI is {rssi} dBm in the {stream_name} of '
-                              f'the {carrier_name} on the {position} side. '
-                              f'Please decrease Tx power on the local side '
-                              f'in order to avoid damage to the radio module.'
-                              f'The current Tx power set as {settings["Tx Power"]} dBm.')
-            elif position == 'local' and rssi < -80:
-                result.append(f'RSSI is {rssi} dBm in the {stream_name} of '
-                              f'the {carrier_name} on the {position} side. '
-                              f'Please increase Tx power or improve alignment '
-                              f'on the remote side in order to reach better signal.')
-            elif position == 'remote' and rssi < -80:
-                result.append(f'RSSI is {rssi} dBm in the {stream_name} of '
-                              f'the {carrier_name} on the {position} side. '
-                              f'Please increase Tx power or improve alignment '
-                              f'on the local side in order to reach better signal.'
-                              f'The current Tx power set as {settings["Tx Power"]} dBm.')
-        except TypeError:
-            logger.exception('Radio RSSI TypeError')
-        except ValueError:
-            logger.exception('Radio RSSI ValueError')
-        finally:
-            pass
-
-    def check_cinr(position, carrier_name, stream_name, cinr):
-        """Check CINR and return the conclusion."""
-
-        try:
-            cinr = int(cinr)
-            if position == 'local' and cinr < 10:
-                result.append(f'CINR is {cinr} dB in the {stream_name} of '
-                              f'the {carrier_name} on the {position} side. '
-                              f'The quality of the signal is very low. '
-                              f'Only low-level modulations are available. '
-                              f'Please improve the quality of the signal to reach better modulations. '
-                              f'Possible solutions: '
-                              f'1) Increase Tx power on the remote side; '
-                              f'2) Find better frequency for the remote side '
-                              f'(the spectrum analyzer can be used to do that); '
-                              f'3) Reduce bandwidth on the master device '
-                              f'in order to improve the sensitivity of the radio module. '
-                              f'The current bandwidth is {settings["Bandwidth"]} MHz.')
-            elif position == 'remote' and cinr < 10:
-                result.append(f'CINR is {cinr} dB in the {stream_name} of '
-                              f'the {carrier_name} on the {position} side. '
-                              f'The quality of the signal is very low. '
-                              f'Only low-level modulations are available. '
-                              f'Please improve the quality of the signal to reach better modulations. '
-                              f'Possible solutions: '
-                              f'1) Increase Tx power on the local side. '
-                              f'The current Tx power set as {settings["Tx Power"]}; '
-                              f'2) Find better frequency for the remote side '
-                              f'(the spectrum analyzer can be used to do that); '
-                              f'3) Reduce bandwidth on the master device '
-                              f'in order to improve the sensitivity of the radio module. '
-                              f'The current bandwidth is {settings["Bandwidth"]} MHz.')
-            elif position == 'local' and cinr < 20:
-                result.append(f'CINR is {cinr} dB in the {stream_name} of '
-                              f'the {carrier_name} on the {position} side. '
-                              f'The quality of the signal is very low. '
-                              f'Only middle-level modulations are available. '
-                              f'Please improve the quality of the signal to reach better modulations. '
-                              f'Possible solutions: '
-                              f'1) Increase Tx power on the remote side; '
-                              f'2) Find better frequency for the remote side '
-                              f'(the spectrum analyzer can be used to do that); '
-                              f'3) Reduce bandwidth on the master device '
-                              f'in order to improve the sensitivity of the radio module. '
-                              f'The current bandwidth is {settings["Bandwidth"]} MHz.')
-            elif position == 'remote' and cinr < 20:
-                result.append(f'CINR is {cinr} dB in the {stream_name} of '
-                              f'the {carrier_name} on the {position} side. '
-                              f'The quality of the signal is very low. '
-                              f'Only middle-level modulations are available. '
-                              f'Please improve the quality of the signal to reach better modulations. '
-                              f'Possible solutions: '
-                              f'1) Increase Tx power on the local side. '
-                              f'The current Tx power set as {settings["Tx Power"]}; '
-                              f'2) Find better frequency for the remote side '
-                              f'(the spectrum analyzer can be used to do that); '
-                              f'3) Reduce bandwidth on the master device '
-                              f'in order to improve the sensitivity of the radio module. '
-                              f'The current bandwidth is {settings["Bandwidth"]} MHz.')
-        except TypeError:
-            logger.exception('Radio CINR TypeError')
-        except ValueError:
-            logger.exception('Radio CINR ValueError')
-        finally:
-            pass
-
-    def check_crosstalk(position, carrier_name, stream_name, crosstalk):
-        """Check Crosstalk and return the conclusion."""
-
-        try:
-            crosstalk = int(crosstalk)
-            if crosstalk > -15:
-                result.append(f'Crosstalk is {crosstalk} dB in '
-                              f'the {stream_name} of the {carrier_name} on the {position} side. '
-                              f'Please check the installation of the antenna and LOS.')
-        except TypeError:
-            logger.exception('Radio Crosstalk TypeError')
-        except ValueError:
-            logger.exception('Radio Crosstalk ValueError')
-        finally:
-            pass
-
-    def check_errors_ratio(position, carrier_name, stream_name, errors_ratio):
-        """Check Errors Ratio in the stream and return the conclusion."""
-
-        try:
-            errors_ratio = float(errors_ratio)
-            if errors_ratio > 1.5:
-                result.append(f'TBER Errors ({errors_ratio} %) detected in '
-                              f'the {stream_name} of the {carrier_name} on the {position} side. '
-                              f'XG does not support ARQ. '
-                              f'Therefore, some important data may be lost. '
-                              f'Please check other radio link parameters and find better frequency.')
-        except TypeError:
-            logger.exception('Radio Errors Ratio TypeError')
-        except ValueError:
-            logger.exception('Radio Errors ValueError')
-        finally:
-            pass
-
-    def check_gain(position, carrier_name, gain_stream_0, gain_stream_1):
-        """Check Gain and return the conclusion."""
-
-        try:
-            gain_stream_0 = float(gain_stream_0)
-            gain_stream_1 = float(gain_stream_1)
-
-            delta = abs(gain_stream_0 - gain_stream_1)
-
-            if delta > 10:
-                result.append(f'Gain skew detected between '
-                              f'the streams 0 and 1 of the {carrier_name} on the {position} side. '
-                              f'Please check the radio module. It may be faulty.')
-        except TypeError:
-            logger.exception('Radio Gain TypeError')
-        except ValueError:
-            logger.exception('Radio Gain ValueError')
-        finally:
-            pass
+            gain_skew = abs(float(carrier_data['Stream 0']['Tx Gain']) - float(carrier_data['Stream 1']['Tx Gain']))
+            messages.append(GAIN_SKEW.check(gain_skew, **fields))
+        except (TypeError, ValueError):
+            logger.debug('Gain of the %s on the %s side cannot be checked', carrier_name, position)
+
+        for stream in ['Stream 0', 'Stream 1']:
+            stream_data = carrier_data[stream]
+            fields['stream'] = str.lower(stream)
+            messages.extend([CROSSTALK.check(stream_data['Crosstalk'], **fields),
+                             ERRORS_RATIO.check(stream_data['Errors Ratio'], **fields)])
+            if position in ('local', 'remote'):
+                messages.extend([RSSI.check(stream_data['RSSI'], **fields),
+                                 CINR.check(stream_data['CINR'], **fields)])
+        result.extend(filter(None, messages))
 
 
     master = device.radio_status['Master']
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 
 import logging
-from ftplib import FTP
 from re import findall, search
 
+from scripts.dc_firmware import catalog
+
 
 def test(device):
     """Not important or not necessary recommendations."""
@@ -27,40 +28,20 @@ def test(device):
             result.append(f'Uptime is too short ({device.uptime}). '
                           'It is recommended to wait for more in order to collect more precise statistics.')
 
-    # New firmware
-    try:
-        ftp = FTP('ftp.infinet.ru', timeout=2)
-        ftp.set_debuglevel(0)  # Print FTP log in console
-        ftp.login()
-        logger.info(f'FTP - Connected to {ftp.host}')
-        fw_current = search(r'v((\d+\.){2}(\d+))', device.firmware).group(1)
-        fw_release = ftp.nlst('/pub/Firmware/XG/H12/')
-        fw_beta = ftp.nlst('/pub/Firmware/beta/XG/')
-        fw_old = ftp.nlst('/pub/Firmware/old/XG/')
-        logger.debug(f'FTP - NLST from {ftp.host}')
-        ftp.quit()
-        logger.info(f'FTP - Disconnected from {ftp.host}')
-        firmwares = filter(lambda x: '.bin' in x, fw_release + fw_beta + fw_old)
-        firmwares = [search(r'v(\d+\.\d+\.\d+)\.bin', fw).group(1) for fw in firmwares]
-        fw_latest = sorted(firmwares, key=lambda x: [int(num) for num in x.split('.')])[-1]
-        if fw_current != fw_latest:
-            for fw in [fw_release, fw_beta, fw_old]:
-                pattern = list(filter(lambda x: fw_latest in x, fw))
-                if len(pattern) > 0:
-                    path_latest = f'ftp://ftp.infinet.ru{pattern[0]}'
-            result.append(f'The current firmware version ({fw_current}) is old. '
-                          f'Please update it. '
-                          f'The latest version ({fw_latest}) can be downloaded '
-                          f'from our FTP server ({path_latest}).')
-    except TimeoutError:
-        logger.exception(f'FTP - A connection to FTP server attempt failed '
-                         f'because the connected party did not properly respond after '
-                         f'a period of time, or established connection failed '
-                         f'because connected host has failed to respond')
-    except:
-        logger.exception(f'FTP - A connection to FTP server attempt failed')
-    finally:
-        pass
+    # New firmware (an unknown format of the firmware version is not checked)
+    match = search(r'v((\d+\.){2}(\d+))', device.firmware)
+    fw_current = None if match is None else match.group(1)
+    firmware = None
+    if fw_current is not None:
+        firmware = catalog.latest(('/pub/Firmware/XG/H12/', '/pub/Firmware/beta/XG/', '/pub/Firmware/old/XG/'),
+                                  r'v(\d+\.\d+\.\d+)\.bin')
+    if firmware is not None and fw_current != firmware.version:
+        fw_latest = firmware.version
+        path_latest = firmware.url
+        result.append(f'The current firmware version ({fw_current}) is old. '
+                      f'Please update it. '
+                      f'The latest version ({fw_latest}) can be downloaded '
+                      f'from our FTP server ({path_latest}).')
 
     result = list(set(result))
     if result:
@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+
+from scripts.dc_cache import ReportCache
+
+
+def test_key_ignores_line_endings():
+    cache = ReportCache()
+    key = cache.key('R5000 WANFleX H11S11\nUptime: 00:08:16\n', 'jira')
+
+    assert cache.key('R5000 WANFleX H11S11 \r\nUptime: 00:08:16\t\r\n\r\n', 'jira') == key
+    assert cache.key('R5000 WANFleX H11S11\nUptime: 00:08:17\n', 'jira') != key
+    assert cache.key('R5000 WANFleX H11S11\nUptime: 00:08:16\n', 'web') != key
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+import io
+import lzma
+
+import pytest
+
+from scripts.dc_compression import CHUNK_SIZE, CompressionError, decompress_file, Decompressor
+
+LIMIT = 1024 * 1024
+# 64 MB of zeros are compressed to a few KB
+BOMB = bytes(1024 * 1024 * 64)
+CARD = b'# WANFleX H11 diagnostic card\n' * 1000
+
+
+def compress(kind, data):
+    if kind == 'gzip':
+        return gzip.compress(data)
+    if kind == 'xz':
+        return lzma.compress(data, lzma.FORMAT_XZ)
+    zstandard = pytest.importorskip('zstandard')
+    return zstandard.ZstdCompressor().compress(data)
+
+
+@pytest.mark.parametrize('kind', ['gzip', 'xz', 'zstd'])
+def test_card(kind):
+    assert decompress_file(io.BytesIO(compress(kind, CARD)), LIMIT) == CARD
+
+
+@pytest.mark.parametrize('kind', ['gzip', 'xz', 'zstd'])
+def test_truncated_card(kind):
+    with pytest.raises(CompressionError):
+        decompress_file(io.BytesIO(compress(kind, CARD)[:-8]), LIMIT)
+
+
+@pytest.mark.parametrize('kind', ['gzip', 'xz', 'zstd'])
+def test_bomb(kind):
+    data = compress(kind, BOMB)
+    decompressor = Decompressor(kind, LIMIT)
+
+    with pytest.raises(CompressionError, match='larger than'):
+        for _ in decompressor.decompress(data):
+            pass
+    # The bomb is stopped by the limit, not decompressed as a whole
+    assert decompressor.size <= LIMIT + 2 * CHUNK_SIZE
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+from types import SimpleNamespace
+
+from scripts.dc_cache import ReportCache
+from scripts.dc_firmware import DirectoryLister, FirmwareCatalog
+from scripts.tests.q5 import recommendations as q5_recommendations
+from scripts.tests.xg import recommendations as xg_recommendations
+
+
+def test_duplicate_version_from_first_folder(tmp_path):
+    for folder in ('release', 'old'):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / 'v1.2.3.bin').touch()
+    (tmp_path / 'old' / 'v1.2.2.bin').touch()
+
+    for folders in (('/release/', '/old/'), ('/old/', '/release/')):
+        catalog = FirmwareCatalog(DirectoryLister(tmp_path))
+        firmware = catalog.latest(folders, r'v(\d+\.\d+\.\d+)\.bin')
+
+        assert firmware.version == '1.2.3'
+        assert firmware.url.endswith(f'{folders[0]}v1.2.3.bin')
+        assert [firmware.version for firmware in catalog.listing(folders, r'v(\d+\.\d+\.\d+)\.bin')] == [
+            '1.2.2', '1.2.3']
+
+
+def test_new_firmware_clears_cache(tmp_path):
+    (tmp_path / 'release').mkdir()
+    (tmp_path / 'release' / 'v1.2.3.bin').touch()
+    folders, pattern = ('/release/',), r'v(\d+\.\d+\.\d+)\.bin'
+    key = '\n'.join((pattern, *folders))
+    cache = ReportCache()
+    catalog = FirmwareCatalog(DirectoryLister(tmp_path))
+    catalog.on_change(cache.clear)
+
+    assert catalog.latest(folders, pattern).version == '1.2.3'
+    cache.set('card', 'report')
+    # The same listing does not clear the cache
+    catalog.refresh(key, folders, pattern)
+    assert cache.get('card') == 'report'
+
+    (tmp_path / 'release' / 'v1.2.4.bin').touch()
+    catalog.refresh(key, folders, pattern)
+    assert catalog.latest(folders, pattern).version == '1.2.4'
+    assert cache.get('card') is None
+
+
+def test_unknown_firmware_version():
+    device = SimpleNamespace(firmware='unknown', uptime='1 day, 00:00:00', dc_string='',
+                             settings={'Traffic prioritization': 'Disabled', 'ARQ': 'Enabled',
+                                       'Max DL MCS': '256-QAM-7/8', 'Max UL MCS': '256-QAM-7/8'})
+
+    assert xg_recommendations.test(device) is None
+    assert q5_recommendations.test(device) is None
+
+
+def test_first_listing_clears_cache(tmp_path):
+    folders, pattern = ('/release/',), r'v(\d+\.\d+\.\d+)\.bin'
+    key = '\n'.join((pattern, *folders))
+    cache = ReportCache()
+    catalog = FirmwareCatalog(DirectoryLister(tmp_path))
+    catalog.on_change(cache.clear)
+
+    # The report made while the listing is not available
+    assert catalog.latest(folders, pattern) is None
+    cache.set('card', 'report')
+
+    (tmp_path / 'release').mkdir()
+    (tmp_path / 'release' / 'v1.2.3.bin').touch()
+    catalog.refresh(key, folders, pattern)
+    assert cache.get('card') is None
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from scripts.dc_jobs import JobQueue
+
+
+@pytest.fixture
+def queue():
+    return JobQueue(workers=1, size=4)
+
+
+@pytest.mark.parametrize('callback', [
+    'ftp://93.184.216.34/hook',
+    'http:///hook',
+    'http://127.0.0.1:5000/hook',
+    'http://localhost/hook',
+    'http://10.0.0.1/hook',
+    'http://192.168.1.1/hook',
+    'http://169.254.169.254/latest/meta-data/',
+    'http://0.0.0.0/hook',
+    'http://[::1]/hook',
+    'http://[::ffff:127.0.0.1]/hook',
+    'http://[fe80::1]/hook',
+])
+def test_rejected_callback(queue, callback):
+    with pytest.raises(ValueError):
+        queue.submit(lambda: None, callback)
+    assert queue.jobs == {}
+
+
+def test_public_callback(queue):
+    queue.check_callback('https://93.184.216.34/hook')
+
+
+def test_allowed_hosts(queue):
+    queue.configure(1, 4, callback_hosts=['Hooks.Example'])
+
+    # An allowed host is not resolved, it may be in the local network
+    queue.check_callback('http://hooks.example:8080/hook')
+    with pytest.raises(ValueError):
+        queue.check_callback('https://93.184.216.34/hook')
+
+
+def test_notify_checks_callback(queue, monkeypatch):
+    def open_url(*args, **kwargs):
+        raise AssertionError('The callback was sent')
+
+    monkeypatch.setattr(queue.opener, 'open', open_url)
+    queue.notify({'id': '1', 'status': 'finished', 'result': None, 'callback': 'http://127.0.0.1/hook'})
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+from scripts.dc_upload import CardStream
+from scripts.parsers.dc_lines import DiagnosticLines, line_offsets
+
+CARD = 'R5000 WANFleX H11S11\n\nUptime: 00:08:16\nlast'
+
+
+def test_lines():
+    lines = DiagnosticLines(CARD)
+
+    assert lines.offsets.itemsize == 4
+    assert list(lines) == list(map(lambda x: x + '\n', CARD.split('\n')))
+
+
+def test_offsets_of_large_text():
+    assert line_offsets(2 ** 32 - 1).itemsize == 4
+    assert line_offsets(2 ** 32).itemsize == 8
+    assert line_offsets(None).itemsize == 8
+
+
+def test_stream_offsets():
+    stream = CardStream(1024 * 1024 * 16)
+    stream.write(CARD.encode('utf-8'))
+
+    assert stream.text() == CARD
+    assert stream.offsets == DiagnosticLines(CARD).offsets
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+from scripts.parsers.parser_r5000 import ETHERNET_FIELDS, SWITCH_GROUP_FIELDS, SwitchGroup
+
+
+def test_switch_mode_priority():
+    # A line with several modes: trunk, in-trunk, upstream and downstream in the order of priority
+    lines = ['switch group 1 add 10 eth0 rf5.0 \r\n', 'switch group 1 upstream downstream\n',
+             'switch group 1 trunk on in-trunk 5\n']
+
+    group = SWITCH_GROUP_FIELDS.extract(lines, SwitchGroup())
+
+    assert group['Order'] == '10'
+    assert group['Interfaces'] == 'eth0, rf5.0'
+    assert group['Mode'] == 'Trunk'
+    assert SWITCH_GROUP_FIELDS.extract(lines[:2], SwitchGroup())['Mode'] == 'Upstream'
+
+
+def test_ethernet_crc():
+    status = {'Status': 'down', 'Speed': None, 'Duplex': None, 'Negotiation': None, 'Rx CRC': 0, 'Tx CRC': 0}
+    lines = ['  Physical link is UP, 100 Mbps Full-duplex, Auto-negotiation\n', '  CRC errors 5   CRC errors 7\n']
+
+    ETHERNET_FIELDS.extract(lines, status)
+    assert status == {'Status': 'up', 'Speed': '100', 'Duplex': 'Full', 'Negotiation': 'Auto',
+                      'Rx CRC': '5', 'Tx CRC': '7'}
+
+    ETHERNET_FIELDS.extract(['  CRC errors 3\n'], status)
+    assert (status['Rx CRC'], status['Tx CRC']) == ('3', 0)
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+from scripts.parsers.parser_q5 import ETHERNET_FIELDS as Q5_ETHERNET_FIELDS
+from scripts.parsers.parser_xg import ETHERNET_FIELDS, PANIC_FIELDS
+
+
+def test_ethernet_link():
+    status = {'Status': 'down', 'Speed': None, 'Duplex': None, 'Negotiation': None, 'Rx CRC': 0, 'Tx CRC': 0}
+
+    ETHERNET_FIELDS.extract(['\tPhysical link is DOWN\n'], status)
+    assert (status['Status'], status['Speed']) == ('down', None)
+
+    ETHERNET_FIELDS.extract(['\tPhysical link is UP, 1000 Mbps Full-duplex, Auto\n',
+                             '\tCRC errors 2   CRC errors 4\n'], status)
+    assert status == {'Status': 'up', 'Speed': '1000', 'Duplex': 'Full', 'Negotiation': 'Auto',
+                      'Rx CRC': '2', 'Tx CRC': '4'}
+
+    status = {'Status': 'down', 'Speed': None, 'Duplex': None, 'Negotiation': None, 'CRC': 0}
+    Q5_ETHERNET_FIELDS.extract(['Physical link is UP, 100 Mbps Half-duplex\n', 'CRC errors 3\n'], status)
+    assert status == {'Status': 'up', 'Speed': '100', 'Duplex': 'Half', 'Negotiation': None, 'CRC': '3'}
+
+
+def test_panic():
+    lines = ['Panic info : [12]: case "watchdog"\n', 'Panic info : [13]: ASSERT at xg.c:10\n',
+             'Panic info : [14]: case "watchdog"\n', 'Last panic logging is enabled\n']
+
+    assert set(PANIC_FIELDS.extract(lines, {})) == {'watchdog', 'ASSERT at xg.c:10'}
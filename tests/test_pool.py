@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+import sys
+
+from scripts import dc_handler
+
+
+def test_started_on_first_use():
+    pool = dc_handler.AnalysisPool()
+    pool.configure(2, executable='/opt/python/bin/python3')
+
+    assert pool.executor is None
+    assert pool.executable == '/opt/python/bin/python3'
+
+    pool.configure(0)
+    assert pool.start() is None
+
+
+def test_executable_under_server(monkeypatch):
+    monkeypatch.setattr(sys, 'executable', '/usr/sbin/httpd')
+    monkeypatch.setattr(dc_handler.os, 'name', 'posix')
+
+    assert dc_handler.python_executable() == str(Path(sys.exec_prefix) / 'bin' / 'python3')
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from scripts import dc_cache
+from scripts.tests.dc_rules import Rule, RuleBook, rules
+
+BOUNDS = ((-80, '<'), (-80, '<='), (-40, '<='))
+BANDS = ('low', 'edge', 'weak', None)
+TEMPLATES = {'low': 'RSSI {value} is {band} on {link}', 'edge': 'RSSI {value} is on the edge',
+             'weak': {'local': 'Local RSSI {value} is weak', 'remote': 'Remote RSSI {value} is weak'}}
+
+
+def test_bands_of_the_same_bound():
+    rule = Rule(BOUNDS, BANDS, TEMPLATES)
+
+    assert rule.band(-80.5) == 'low'
+    assert rule.band(-80) == 'edge'
+    assert rule.band(-79.5) == 'weak'
+    assert rule.band(-40) == 'weak'
+    assert rule.band(-39.5) is None
+
+
+def test_unknown_values():
+    rule = Rule(BOUNDS, BANDS, TEMPLATES)
+
+    assert rule.check('nan') is None
+    assert rule.check(float('nan')) is None
+    assert rule.check('-') is None
+    assert rule.check(None) is None
+    assert rule.check('-90', link='eth0') == 'RSSI -90.0 is low on eth0'
+
+
+def test_template_variants():
+    rule = Rule(BOUNDS, BANDS, TEMPLATES)
+
+    assert rule.check('-50', 'local') == 'Local RSSI -50.0 is weak'
+    assert rule.check('-50', 'remote') == 'Remote RSSI -50.0 is weak'
+    # No template of the variant: no message
+    assert rule.check('-50') is None
+    assert rule.check('-80', 'local') == 'RSSI -80.0 is on the edge'
+
+
+def test_overrides(tmp_path):
+    book = RuleBook()
+    before = book.define('r5000.rssi', BOUNDS, BANDS, TEMPLATES)
+    path = tmp_path / 'rules.json'
+    path.write_text(json.dumps({'r5000.rssi': [[-70, '<'], [-70, '<='], [-30, '<=']],
+                                'r5000.snr': [[10, '<'], [20, '<']]}))
+
+    book.configure(path)
+    after = book.define('r5000.snr', ((5, '<'), (15, '<')), ('bad', 'low', None), {'bad': 'Bad', 'low': 'Low'})
+
+    assert before.band(-75) == 'low'
+    assert after.band(17) == 'low'
+    assert after.band(20) is None
+
+    book.configure(None)
+    assert before.band(-75) == 'weak'
+    assert after.band(17) is None
+
+
+def test_wrong_override(tmp_path):
+    book = RuleBook()
+    rule = book.define('r5000.rssi', BOUNDS, BANDS, TEMPLATES)
+    path = tmp_path / 'rules.json'
+    path.write_text(json.dumps({'r5000.rssi': [[-70, '<'], [-30, '<=']]}))
+
+    book.configure(path)
+    assert rule.bounds == BOUNDS
+    assert book.define('r5000.rssi', BOUNDS, BANDS, TEMPLATES).bounds == BOUNDS
+
+
+def test_digest_changes_cache_version(tmp_path):
+    version = dc_cache.code_version()
+    path = tmp_path / 'rules.json'
+    path.write_text(json.dumps({'r5000.unknown': [[1, '<']]}))
+
+    try:
+        rules.configure(path)
+        assert rules.digest
+        assert dc_cache.code_version() != version
+    finally:
+        rules.configure(None)
+
+    assert dc_cache.code_version() == version
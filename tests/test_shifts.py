@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+from datetime import date
+from pathlib import Path
+import shutil
+
+import pytest
+
+from scripts.shifts import ScheduleIndex
+
+
+def test_title_with_line_break():
+    table = [['Апрель\n2020г.', 'Сотрудник', '1', '2'], ['', '', 'ср', 'чт'], ['1', 'Иванов', '4', '8']]
+
+    assert ScheduleIndex.parse_table(table) == {date(2020, 4, 1): 'Иванов'}
+
+
+def test_schedule_pdf_months(tmp_path):
+    pytest.importorskip('pdfplumber')
+    # The calendar is saved next to the PDF, the copy keeps the repository clean
+    path = tmp_path / 'schedule.pdf'
+    shutil.copy(Path(__file__).parent.parent / 'test.pdf', path)
+    index = ScheduleIndex(path)
+
+    for month in (4, 5, 6):
+        assert index.month(2020, month), f'No duty days in 2020-{month:02}'
+    assert path.with_suffix('.schedule.json').exists()
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+from re import search
+
+import pytest
+
+from scripts.parsers.dc_lines import DiagnosticLines
+from scripts.parsers.dc_parser import get_result
+from scripts.tests.r5000 import log_check as r5000_log_check
+from scripts.tests.xg import log_check as xg_log_check
+
+ARCHIVE = Path(__file__).parent.parent / 'scripts' / 'dcards' / 'archive'
+
+# The messages are put after the line starting with the marker (None - at the end of the card)
+R5000_POSITIONS = ['R5000 WANFleX', '~~~~~', 'Name   Init/Cur', "License 'Factory License'", None]
+XG_POSITIONS = ['==[     sys uptime', '==[     panic show', '==[    sys log show', '==[       license',
+                '==[       wd log', None]
+
+
+def insert(card, marker, lines):
+    card = [line if line.endswith('\n') else f'{line}\n' for line in card.splitlines(keepends=True)]
+    index = len(card) if marker is None else next(i for i, line in enumerate(card) if line.startswith(marker)) + 1
+    return ''.join(card[:index] + [f'{line}\n' for line in lines] + card[index:]), index + 1
+
+
+def parse(card, name):
+    return get_result(card, DiagnosticLines(card), name, ['jira', 'test'])
+
+
+@pytest.mark.parametrize('module, name, marker', [
+    *((r5000_log_check, 'diagcard.SN-219984.txt', marker) for marker in R5000_POSITIONS),
+    *((xg_log_check, 'diagcard.SN-500268 xg link up and all ok.txt', marker) for marker in XG_POSITIONS),
+])
+def test_scanner_finds_what_search_finds(module, name, marker):
+    card, line = insert((ARCHIVE / name).read_text(encoding='utf-8'), marker, module.SIGNATURES)
+    device = parse(card, name)
+
+    hits = module.scanner.scan(device)
+
+    assert set(hits) == {signature for signature in module.SIGNATURES if search(signature, card) is not None}
+    assert set(hits) == set(module.SIGNATURES)
+    for number, signature in enumerate(module.SIGNATURES, line):
+        assert hits[signature].lines == [number]
+
+
+@pytest.mark.parametrize('module, name', [
+    (r5000_log_check, 'diagcard.SN-219984.txt'),
+    (xg_log_check, 'diagcard.SN-500268 xg link up and all ok.txt'),
+])
+def test_scanner_without_messages(module, name):
+    card = (ARCHIVE / name).read_text(encoding='utf-8')
+
+    assert module.scanner.scan(parse(card, name)) == {}
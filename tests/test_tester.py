@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+from time import sleep
+from types import SimpleNamespace
+
+from scripts.dc_plugins import plugins
+from scripts.parsers.dc_parser import R5000Card
+from scripts.reports.dc_reporter import create_report
+from scripts.tests import dc_tester
+
+
+class Device:
+    family = 'R5000'
+
+
+def module(name, seconds, result=None):
+    def test(device):
+        sleep(seconds)
+        return result
+    return SimpleNamespace(__name__=f'scripts.tests.r5000.{name}', test=test)
+
+
+def test_timeout_from_start():
+    # A single thread: the second test waits for the first one, its timeout is counted from its own start
+    runner = dc_tester.TestRunner(workers=1, timeout=0.5, budget=5)
+    results = runner.run(Device(), [module('first', 0.3, 'First'), module('second', 0.3, 'Second')])
+
+    assert results == ['First', 'Second']
+    assert results.timed_out == []
+
+
+def test_timed_out_in_report(monkeypatch):
+    runner = dc_tester.TestRunner(workers=2, timeout=0.2, budget=5)
+    results = runner.run(Device(), [module('slow', 1), module('fast', 0, 'Problem')])
+
+    assert results == [None, 'Problem']
+    assert results.timed_out == ['scripts.tests.r5000.slow']
+
+    monkeypatch.setattr(plugins, 'report', lambda family, kind: lambda device, tests: tests)
+    assert create_report(Device(), results, ('cli',)) == [
+        'Problem', 'The test slow has not finished, the report is not complete']
+
+
+def test_section_parsed_once():
+    calls = []
+
+    def parse_settings(card):
+        calls.append(card)
+        sleep(0.2)
+        return {'Role': 'master'}
+
+    card = R5000Card(*[None] * 8)
+    card.parser = SimpleNamespace(parse_settings=parse_settings)
+    tests = [SimpleNamespace(__name__=f'scripts.tests.r5000.test_{index}', test=lambda device: device.settings['Role'])
+             for index in range(4)]
+
+    results = dc_tester.TestRunner(workers=4, timeout=5, budget=5).run(card, tests)
+    assert results == ['master'] * 4
+    assert len(calls) == 1